@@ -42,6 +42,14 @@ ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "")
 
 AHREFS_API_KEY = os.getenv("AHREFS_API_KEY", "")
 SEMRUSH_API_KEY = os.getenv("SEMRUSH_API_KEY", "")
+# Seconds a competitor's Ahrefs/SEMrush backlink profile is reused
+COMPETITOR_BACKLINK_CACHE_TTL = int(os.getenv("COMPETITOR_BACKLINK_CACHE_TTL", "86400"))
+# Query Ahrefs and SEMrush at the same time for competitor backlinks. Faster
+# SEMrush fallback, but every uncached lookup then spends SEMrush API units
+# even when Ahrefs answers. Off by default (Ahrefs first, SEMrush on miss).
+COMPETITOR_BACKLINK_CONCURRENT_PROVIDERS = (
+    os.getenv("COMPETITOR_BACKLINK_CONCURRENT_PROVIDERS", "false").lower() == "true"
+)
 
 SENDGRID_API_KEY = os.getenv("SENDGRID_API_KEY", "")
 
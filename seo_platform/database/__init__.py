@@ -1 +1 @@
-from .models import Base, engine, SessionLocal, get_db
+from .models import Base, engine, SessionLocal, get_db, session_scope
@@ -4,9 +4,12 @@ Uses SQLAlchemy ORM with support for SQLite (dev) and PostgreSQL (production).
 """
 
 import datetime
+from contextlib import contextmanager
+
 from sqlalchemy import (
     create_engine, Column, Integer, String, Float, Boolean, Text,
-    DateTime, Date, JSON, ForeignKey, Index, Enum as SQLEnum
+    DateTime, Date, JSON, ForeignKey, Index, Enum as SQLEnum,
+    delete, inspect, select, update
 )
 from sqlalchemy.orm import declarative_base, relationship, sessionmaker
 from sqlalchemy.sql import func
@@ -27,6 +30,20 @@ def get_db():
         db.close()
 
 
+@contextmanager
+def session_scope():
+    """Provide a transactional session: commit on success, roll back on error."""
+    db = SessionLocal()
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
 # ============================================================
 # Module 1: Keyword Research & Tracking
 # ============================================================
@@ -327,6 +344,7 @@ class Backlink(Base):
     __table_args__ = (
         Index("idx_backlink_domain", "source_domain"),
         Index("idx_backlink_toxic", "is_toxic"),
+        Index("idx_backlink_active_domain", "is_active", "source_domain"),
     )
 
 
@@ -363,6 +381,10 @@ class Competitor(Base):
 
     analyses = relationship("CompetitorAnalysis", back_populates="competitor", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("idx_competitor_domain", "domain", unique=True),
+    )
+
 
 class CompetitorAnalysis(Base):
     __tablename__ = "competitor_analyses"
@@ -461,9 +483,54 @@ class SEOMetric(Base):
     )
 
 
+def has_unique_competitor_domain(bind) -> bool:
+    """Return True if ``competitors.domain`` carries its unique index."""
+    return any(
+        ix["name"] == "idx_competitor_domain" and ix["unique"]
+        for ix in inspect(bind).get_indexes("competitors")
+    )
+
+
+def _migrate_competitor_domain_index(bind) -> None:
+    """Add the unique ``competitors.domain`` index to an existing table.
+
+    ``create_all`` skips tables that already exist, so databases created
+    before the index was declared never get it.  Duplicate domains are
+    collapsed onto their lowest id (moving their analyses across) before
+    the index is built.
+    """
+    if not inspect(bind).has_table("competitors") or has_unique_competitor_domain(bind):
+        return
+    with bind.begin() as conn:
+        dupes = conn.execute(
+            select(Competitor.domain, func.min(Competitor.id))
+            .where(Competitor.domain.isnot(None))
+            .group_by(Competitor.domain)
+            .having(func.count(Competitor.id) > 1)
+        ).all()
+        for domain, keep_id in dupes:
+            drop_ids = select(Competitor.id).where(
+                Competitor.domain == domain, Competitor.id != keep_id
+            )
+            conn.execute(
+                update(CompetitorAnalysis)
+                .where(CompetitorAnalysis.competitor_id.in_(drop_ids))
+                .values(competitor_id=keep_id)
+            )
+            conn.execute(
+                delete(Competitor).where(
+                    Competitor.domain == domain, Competitor.id != keep_id
+                )
+            )
+        for index in Competitor.__table__.indexes:
+            if index.name == "idx_competitor_domain":
+                index.create(conn)
+
+
 def init_db():
     """Initialize the database, creating all tables."""
     Base.metadata.create_all(bind=engine)
+    _migrate_competitor_domain_index(engine)
     return engine
 
 
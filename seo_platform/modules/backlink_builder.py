@@ -8,25 +8,120 @@ notary associations, chambers of commerce, and business directories relevant
 to the DMV area and Southwest Virginia service regions.
 """
 
+import csv
 import datetime
+import heapq
 import re
-import statistics
+import threading
 from collections import Counter, defaultdict
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
+from string import Template
+from typing import Any, Iterable, NamedTuple, Optional
 from urllib.parse import urlparse
 
+import ahocorasick
+import lxml.html
+import numpy as np
+import orjson
+import pandas as pd
 import requests
 from bs4 import BeautifulSoup
+from cachetools import TTLCache
 from loguru import logger
-
-from config.settings import AHREFS_API_KEY, COMPANY, SEMRUSH_API_KEY
+from requests.adapters import HTTPAdapter
+from sqlalchemy import and_, case, distinct, func, insert, or_, select, update
+from urllib3.util.retry import Retry
+
+try:
+    import numba
+
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+    logger.debug("numba not installed; toxicity scoring uses the NumPy path")
+
+try:
+    import re2
+
+    _RE2_AVAILABLE = True
+except ImportError:
+    _RE2_AVAILABLE = False
+    logger.debug("re2 not installed; spam-domain matching uses the re module")
+
+from config.settings import (
+    AHREFS_API_KEY,
+    COMPANY,
+    COMPETITOR_BACKLINK_CACHE_TTL,
+    COMPETITOR_BACKLINK_CONCURRENT_PROVIDERS,
+    SEMRUSH_API_KEY,
+)
 from database.models import Backlink, BacklinkOpportunity, SessionLocal
+from utils.helpers import read_capped
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
-COMPANY_DOMAIN: str = urlparse(COMPANY["website"]).netloc.replace("www.", "")
+COMPANY_DOMAIN: str = urlparse(COMPANY["website"]).netloc.removeprefix("www.")
+
+# Every domain whose inbound links count as ours (brands, microsites).
+OWN_DOMAINS: tuple[str, ...] = (COMPANY_DOMAIN,)
+
+# Maximum number of bound parameters per ``IN (...)`` lookup; keeps batched
+# queries below SQLite's host-parameter limit.
+_IN_CLAUSE_CHUNK: int = 500
+
+# Rows per executemany batch when writing scan results back by primary key.
+_BULK_UPDATE_CHUNK: int = 1000
+
+# Largest body read from a page being scored; anything beyond is ignored.
+_PAGE_BYTE_CAP: int = 1_048_576
+
+# Rows fetched per round-trip when streaming the profile for reporting.
+_REPORT_PARTITION_SIZE: int = 10_000
+
+# Default headers for every outbound request (browser-like UA).
+DEFAULT_HEADERS: dict[str, str] = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+}
+
+# Maximum number of competitor profiles fetched in parallel during a
+# gap analysis.
+_COMPETITOR_CONCURRENCY: int = 8
+
+# Maximum number of referring pages re-scraped in parallel when falling
+# back to database-driven verification.
+_SCRAPE_CONCURRENCY: int = 20
+
+# Short-lived cache of Ahrefs JSON responses shared by every BacklinkBuilder
+# in the process, keyed on (report, target, limit) -- never on the token.
+_AHREFS_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=600)
+_AHREFS_CACHE_LOCK = threading.Lock()
+
+# Competitor backlink profiles change slowly and cost paid API units, so
+# they are reused for COMPETITOR_BACKLINK_CACHE_TTL seconds (default 24h).
+_COMPETITOR_BACKLINK_CACHE: TTLCache = TTLCache(
+    maxsize=512, ttl=COMPETITOR_BACKLINK_CACHE_TTL
+)
+_COMPETITOR_BACKLINK_CACHE_LOCK = threading.Lock()
+
+# Maximum number of concurrent Ahrefs domain-rating lookups.
+_DA_LOOKUP_CONCURRENCY: int = 5
+
+# Per-builder memo of estimated domain authorities; bounded, and refreshed
+# daily so long-lived builders pick up rating changes.
+_DA_CACHE_SIZE: int = 4096
+_DA_CACHE_TTL: int = 86400
+
+# Conservative DA assumed for unknown domains when no rating is available;
+# never cached, so a failed lookup is retried next time.
+_DA_BASELINE: int = 15
 
 # Relevance keywords used to evaluate whether a linking page is topically
 # aligned with notary / apostille / legal services.
@@ -40,6 +135,21 @@ RELEVANCE_KEYWORDS: list[str] = [
     "chamber of commerce", "professional services", "small business",
 ]
 
+# Aho-Corasick automaton over RELEVANCE_KEYWORDS so a block of text is
+# scanned once for every keyword instead of once per keyword.
+_RELEVANCE_AC = ahocorasick.Automaton()
+for _kw in RELEVANCE_KEYWORDS:
+    _RELEVANCE_AC.add_word(_kw, _kw)
+_RELEVANCE_AC.make_automaton()
+
+# Automaton over OWN_DOMAINS so each scraped href is checked in one pass
+# however many domains we track.
+_OWN_DOMAINS_AC = ahocorasick.Automaton()
+for _domain in OWN_DOMAINS:
+    _OWN_DOMAINS_AC.add_word(_domain, _domain)
+_OWN_DOMAINS_AC.make_automaton()
+_OWN_DOMAINS_BYTES: tuple[bytes, ...] = tuple(d.encode() for d in OWN_DOMAINS)
+
 # Heuristic patterns commonly found in spammy / link-farm domains.
 SPAM_DOMAIN_PATTERNS: list[str] = [
     r"free[-_]?link", r"link[-_]?farm", r"link[-_]?exchange",
@@ -50,332 +160,748 @@ SPAM_DOMAIN_PATTERNS: list[str] = [
     r"diet[-_]?pill", r"weight[-_]?loss[-_]?pill", r"crypto[-_]?scam",
     r"click[-_]?here", r"best[-_]?price", r"cheap[-_]?(buy|order)",
 ]
+# All spam patterns as one alternation, so a domain is scanned once rather
+# than once per pattern.  RE2 (linear-time, no backtracking) is used when
+# available.
+_SPAM_DOMAIN_RE = (re2 if _RE2_AVAILABLE else re).compile(
+    "|".join(f"(?:{pattern})" for pattern in SPAM_DOMAIN_PATTERNS)
+)
+
+# Top-level domains disproportionately used by throwaway / spam sites.
+# The capture group yields the matched TLD (with its dot) for reporting.
+SUSPICIOUS_TLDS: tuple[str, ...] = (
+    ".xyz", ".top", ".pw", ".cc", ".tk", ".ga",
+    ".cf", ".gq", ".ml", ".buzz", ".click",
+)
+_SUSPICIOUS_TLD_RE = re.compile(
+    r"(\.(?:" + "|".join(t[1:] for t in SUSPICIOUS_TLDS) + r"))$"
+)
+
+# Exact-match anchor texts typical of paid or spammy link placements.
+COMMERCIAL_ANCHORS: frozenset[str] = frozenset({
+    "click here", "buy now", "cheap", "best price",
+    "order now", "free", "discount", "deal",
+})
+
+# Link-scoring signals: platforms whose outbound links are almost always
+# nofollow, and TLDs treated as trustworthy.
+NOFOLLOW_LIKELY_DOMAINS: frozenset[str] = frozenset({
+    "facebook.com", "twitter.com", "x.com", "instagram.com",
+    "linkedin.com", "reddit.com", "quora.com", "pinterest.com",
+    "youtube.com", "tiktok.com", "medium.com", "wikipedia.org",
+})
+# Dot-prefixed forms, so subdomains (m.facebook.com) match but lookalike
+# registrations (notfacebook.com) do not.
+_NOFOLLOW_SUFFIXES: tuple[str, ...] = tuple(
+    sorted("." + domain for domain in NOFOLLOW_LIKELY_DOMAINS)
+)
+TRUSTED_TLDS: frozenset[str] = frozenset({
+    ".gov", ".edu", ".org", ".com", ".net", ".us",
+})
+
+# Translation table that strips ASCII digits; the length difference gives
+# the digit count of a domain name in one C-level pass.
+_DIGIT_DEL = str.maketrans("", "", "0123456789")
+
+# Well-known high-DA domains used as the heuristic fallback when the Ahrefs
+# API is not configured or a lookup fails.
+HIGH_DA_DOMAINS: dict[str, int] = {
+    "google.com": 100, "yelp.com": 93, "bbb.org": 88,
+    "yellowpages.com": 82, "findlaw.com": 82, "justia.com": 80,
+    "angi.com": 80, "mapquest.com": 78, "nolo.com": 75,
+    "thumbtack.com": 72, "avvo.com": 72, "lawyers.com": 70,
+    "scc.virginia.gov": 70, "bingplaces.com": 70,
+    "hg.org": 68, "virginia.org": 68, "manta.com": 62,
+    "lawinfo.com": 62, "nationalnotary.org": 60,
+    "alignable.com": 55, "virginiasbdc.org": 50,
+    "dcchamber.org": 50, "123notary.com": 48,
+    "notaryrotary.com": 45, "snapdocs.com": 45,
+    "fairfaxchamber.org": 47, "alexchamber.com": 45,
+    "roanokechamber.org": 44, "arlingtonchamber.org": 42,
+    "asnnotary.org": 42, "loudounchamber.org": 40,
+    "gwhcc.org": 40, "notary.net": 40, "notarycafe.com": 38,
+    "signingagent.com": 35, "montgomerycc.org": 32,
+    "s-rcchamber.org": 30, "closesimple.com": 30,
+    "virginianotaryassociation.org": 25,
+}
+
+
+class LinkOpportunity(NamedTuple):
+    """A curated link-building target."""
+
+    target_site: str
+    target_url: str
+    category: str
+    domain_authority: int
+    notes: str
+
+
+class GapDomain(NamedTuple):
+    """A referring domain that links to competitors but not to us."""
+
+    source_domain: str
+    competitors_linking: int
+    domain_authority: int
+    source_url: str
+    anchor_text: str
+    priority: str
+
 
 # Pre-populated list of 40+ specific link-building opportunities organised
 # by category.  Each entry carries a URL, estimated domain authority (DA),
 # and a short description of how to pursue the listing.
-LINK_OPPORTUNITIES: list[dict[str, Any]] = [
+LINK_OPPORTUNITIES: list[LinkOpportunity] = [
     # --- Legal Directories ---------------------------------------------------
-    {
-        "target_site": "Avvo",
-        "target_url": "https://www.avvo.com",
-        "category": "legal_directory",
-        "domain_authority": 72,
-        "notes": "Create a free professional profile. List notary and apostille services.",
-    },
-    {
-        "target_site": "FindLaw",
-        "target_url": "https://www.findlaw.com",
-        "category": "legal_directory",
-        "domain_authority": 82,
-        "notes": "Submit business to the legal services directory listing.",
-    },
-    {
-        "target_site": "Justia",
-        "target_url": "https://www.justia.com",
-        "category": "legal_directory",
-        "domain_authority": 80,
-        "notes": "Create a free legal professional profile with service details.",
-    },
-    {
-        "target_site": "LawInfo",
-        "target_url": "https://www.lawinfo.com",
-        "category": "legal_directory",
-        "domain_authority": 62,
-        "notes": "Submit listing under notary / document authentication services.",
-    },
-    {
-        "target_site": "Lawyers.com",
-        "target_url": "https://www.lawyers.com",
-        "category": "legal_directory",
-        "domain_authority": 70,
-        "notes": "Submit a professional services listing for legal document support.",
-    },
-    {
-        "target_site": "HG.org Legal Directory",
-        "target_url": "https://www.hg.org",
-        "category": "legal_directory",
-        "domain_authority": 68,
-        "notes": "Submit under legal services / notary section.",
-    },
-    {
-        "target_site": "Nolo",
-        "target_url": "https://www.nolo.com",
-        "category": "legal_directory",
-        "domain_authority": 75,
-        "notes": "Explore the lawyer and legal services directory for listing options.",
-    },
+    LinkOpportunity(
+        target_site="Avvo",
+        target_url="https://www.avvo.com",
+        category="legal_directory",
+        domain_authority=72,
+        notes="Create a free professional profile. List notary and apostille services.",
+    ),
+    LinkOpportunity(
+        target_site="FindLaw",
+        target_url="https://www.findlaw.com",
+        category="legal_directory",
+        domain_authority=82,
+        notes="Submit business to the legal services directory listing.",
+    ),
+    LinkOpportunity(
+        target_site="Justia",
+        target_url="https://www.justia.com",
+        category="legal_directory",
+        domain_authority=80,
+        notes="Create a free legal professional profile with service details.",
+    ),
+    LinkOpportunity(
+        target_site="LawInfo",
+        target_url="https://www.lawinfo.com",
+        category="legal_directory",
+        domain_authority=62,
+        notes="Submit listing under notary / document authentication services.",
+    ),
+    LinkOpportunity(
+        target_site="Lawyers.com",
+        target_url="https://www.lawyers.com",
+        category="legal_directory",
+        domain_authority=70,
+        notes="Submit a professional services listing for legal document support.",
+    ),
+    LinkOpportunity(
+        target_site="HG.org Legal Directory",
+        target_url="https://www.hg.org",
+        category="legal_directory",
+        domain_authority=68,
+        notes="Submit under legal services / notary section.",
+    ),
+    LinkOpportunity(
+        target_site="Nolo",
+        target_url="https://www.nolo.com",
+        category="legal_directory",
+        domain_authority=75,
+        notes="Explore the lawyer and legal services directory for listing options.",
+    ),
 
     # --- Notary Associations --------------------------------------------------
-    {
-        "target_site": "National Notary Association (NNA)",
-        "target_url": "https://www.nationalnotary.org",
-        "category": "notary_association",
-        "domain_authority": 60,
-        "notes": "Maintain active membership. Get listed in the NNA Notary Locator.",
-    },
-    {
-        "target_site": "American Society of Notaries",
-        "target_url": "https://www.asnnotary.org",
-        "category": "notary_association",
-        "domain_authority": 42,
-        "notes": "Become a member and appear in the online directory.",
-    },
-    {
-        "target_site": "Virginia Notary Association",
-        "target_url": "https://www.virginianotaryassociation.org",
-        "category": "notary_association",
-        "domain_authority": 25,
-        "notes": "State-level association membership with directory listing.",
-    },
-    {
-        "target_site": "Notary Rotary",
-        "target_url": "https://www.notaryrotary.com",
-        "category": "notary_association",
-        "domain_authority": 45,
-        "notes": "Join the signing-agent directory. Targeted at loan-signing leads.",
-    },
-    {
-        "target_site": "123Notary",
-        "target_url": "https://www.123notary.com",
-        "category": "notary_association",
-        "domain_authority": 48,
-        "notes": "Create a notary profile in one of the largest notary directories.",
-    },
-    {
-        "target_site": "SigningAgent.com",
-        "target_url": "https://www.signingagent.com",
-        "category": "notary_association",
-        "domain_authority": 35,
-        "notes": "Loan signing agent directory. Relevant for real-estate closing services.",
-    },
-    {
-        "target_site": "Notary.net",
-        "target_url": "https://www.notary.net",
-        "category": "notary_association",
-        "domain_authority": 40,
-        "notes": "Free notary public directory listing by state.",
-    },
+    LinkOpportunity(
+        target_site="National Notary Association (NNA)",
+        target_url="https://www.nationalnotary.org",
+        category="notary_association",
+        domain_authority=60,
+        notes="Maintain active membership. Get listed in the NNA Notary Locator.",
+    ),
+    LinkOpportunity(
+        target_site="American Society of Notaries",
+        target_url="https://www.asnnotary.org",
+        category="notary_association",
+        domain_authority=42,
+        notes="Become a member and appear in the online directory.",
+    ),
+    LinkOpportunity(
+        target_site="Virginia Notary Association",
+        target_url="https://www.virginianotaryassociation.org",
+        category="notary_association",
+        domain_authority=25,
+        notes="State-level association membership with directory listing.",
+    ),
+    LinkOpportunity(
+        target_site="Notary Rotary",
+        target_url="https://www.notaryrotary.com",
+        category="notary_association",
+        domain_authority=45,
+        notes="Join the signing-agent directory. Targeted at loan-signing leads.",
+    ),
+    LinkOpportunity(
+        target_site="123Notary",
+        target_url="https://www.123notary.com",
+        category="notary_association",
+        domain_authority=48,
+        notes="Create a notary profile in one of the largest notary directories.",
+    ),
+    LinkOpportunity(
+        target_site="SigningAgent.com",
+        target_url="https://www.signingagent.com",
+        category="notary_association",
+        domain_authority=35,
+        notes="Loan signing agent directory. Relevant for real-estate closing services.",
+    ),
+    LinkOpportunity(
+        target_site="Notary.net",
+        target_url="https://www.notary.net",
+        category="notary_association",
+        domain_authority=40,
+        notes="Free notary public directory listing by state.",
+    ),
 
     # --- Local Business Chambers ----------------------------------------------
-    {
-        "target_site": "Alexandria Chamber of Commerce",
-        "target_url": "https://www.alexchamber.com",
-        "category": "chamber_of_commerce",
-        "domain_authority": 45,
-        "notes": "Join as a member for a listing in the Alexandria business directory.",
-    },
-    {
-        "target_site": "Arlington Chamber of Commerce",
-        "target_url": "https://www.arlingtonchamber.org",
-        "category": "chamber_of_commerce",
-        "domain_authority": 42,
-        "notes": "Membership provides a profile page with a dofollow backlink.",
-    },
-    {
-        "target_site": "Fairfax County Chamber of Commerce",
-        "target_url": "https://www.fairfaxchamber.org",
-        "category": "chamber_of_commerce",
-        "domain_authority": 47,
-        "notes": "Major Northern Virginia chamber. Member directory includes website link.",
-    },
-    {
-        "target_site": "Loudoun County Chamber of Commerce",
-        "target_url": "https://www.loudounchamber.org",
-        "category": "chamber_of_commerce",
-        "domain_authority": 40,
-        "notes": "Growing business community. Good for Loudoun County visibility.",
-    },
-    {
-        "target_site": "Roanoke Regional Chamber of Commerce",
-        "target_url": "https://www.roanokechamber.org",
-        "category": "chamber_of_commerce",
-        "domain_authority": 44,
-        "notes": "Primary chamber for Southwest Virginia market. Member directory listing.",
-    },
-    {
-        "target_site": "Salem-Roanoke County Chamber of Commerce",
-        "target_url": "https://www.s-rcchamber.org",
-        "category": "chamber_of_commerce",
-        "domain_authority": 30,
-        "notes": "Local chamber serving Salem and Roanoke County area.",
-    },
-    {
-        "target_site": "Montgomery County (VA) Chamber of Commerce",
-        "target_url": "https://www.montgomerycc.org",
-        "category": "chamber_of_commerce",
-        "domain_authority": 32,
-        "notes": "Covers Blacksburg / Christiansburg area. Directory link available.",
-    },
-    {
-        "target_site": "Greater Washington Hispanic Chamber of Commerce",
-        "target_url": "https://www.gwhcc.org",
-        "category": "chamber_of_commerce",
-        "domain_authority": 40,
-        "notes": "Relevant for bilingual / Spanish-language notary services.",
-    },
-    {
-        "target_site": "DC Chamber of Commerce",
-        "target_url": "https://www.dcchamber.org",
-        "category": "chamber_of_commerce",
-        "domain_authority": 50,
-        "notes": "District-wide chamber. Good DA and local relevance.",
-    },
+    LinkOpportunity(
+        target_site="Alexandria Chamber of Commerce",
+        target_url="https://www.alexchamber.com",
+        category="chamber_of_commerce",
+        domain_authority=45,
+        notes="Join as a member for a listing in the Alexandria business directory.",
+    ),
+    LinkOpportunity(
+        target_site="Arlington Chamber of Commerce",
+        target_url="https://www.arlingtonchamber.org",
+        category="chamber_of_commerce",
+        domain_authority=42,
+        notes="Membership provides a profile page with a dofollow backlink.",
+    ),
+    LinkOpportunity(
+        target_site="Fairfax County Chamber of Commerce",
+        target_url="https://www.fairfaxchamber.org",
+        category="chamber_of_commerce",
+        domain_authority=47,
+        notes="Major Northern Virginia chamber. Member directory includes website link.",
+    ),
+    LinkOpportunity(
+        target_site="Loudoun County Chamber of Commerce",
+        target_url="https://www.loudounchamber.org",
+        category="chamber_of_commerce",
+        domain_authority=40,
+        notes="Growing business community. Good for Loudoun County visibility.",
+    ),
+    LinkOpportunity(
+        target_site="Roanoke Regional Chamber of Commerce",
+        target_url="https://www.roanokechamber.org",
+        category="chamber_of_commerce",
+        domain_authority=44,
+        notes="Primary chamber for Southwest Virginia market. Member directory listing.",
+    ),
+    LinkOpportunity(
+        target_site="Salem-Roanoke County Chamber of Commerce",
+        target_url="https://www.s-rcchamber.org",
+        category="chamber_of_commerce",
+        domain_authority=30,
+        notes="Local chamber serving Salem and Roanoke County area.",
+    ),
+    LinkOpportunity(
+        target_site="Montgomery County (VA) Chamber of Commerce",
+        target_url="https://www.montgomerycc.org",
+        category="chamber_of_commerce",
+        domain_authority=32,
+        notes="Covers Blacksburg / Christiansburg area. Directory link available.",
+    ),
+    LinkOpportunity(
+        target_site="Greater Washington Hispanic Chamber of Commerce",
+        target_url="https://www.gwhcc.org",
+        category="chamber_of_commerce",
+        domain_authority=40,
+        notes="Relevant for bilingual / Spanish-language notary services.",
+    ),
+    LinkOpportunity(
+        target_site="DC Chamber of Commerce",
+        target_url="https://www.dcchamber.org",
+        category="chamber_of_commerce",
+        domain_authority=50,
+        notes="District-wide chamber. Good DA and local relevance.",
+    ),
 
     # --- Virginia State Directories -------------------------------------------
-    {
-        "target_site": "Virginia.gov Business Directory",
-        "target_url": "https://www.virginia.gov/services/business/",
-        "category": "state_directory",
-        "domain_authority": 85,
-        "notes": "State government resource listing. Very high DA.",
-    },
-    {
-        "target_site": "Virginia SCC (State Corporation Commission)",
-        "target_url": "https://www.scc.virginia.gov",
-        "category": "state_directory",
-        "domain_authority": 70,
-        "notes": "Ensure the business is registered and appears in the SCC look-up.",
-    },
-    {
-        "target_site": "Virginia Secretary of State - Notary Division",
-        "target_url": "https://www.commonwealth.virginia.gov/official-documents/notary-commissions/",
-        "category": "state_directory",
-        "domain_authority": 72,
-        "notes": "Maintain an active notary commission listed with the state.",
-    },
-    {
-        "target_site": "Virginia Tourism Corporation",
-        "target_url": "https://www.virginia.org",
-        "category": "state_directory",
-        "domain_authority": 68,
-        "notes": "Submit under professional services for Virginia visitors needing notary.",
-    },
-    {
-        "target_site": "Virginia SBDC (Small Business Development Center)",
-        "target_url": "https://www.virginiasbdc.org",
-        "category": "state_directory",
-        "domain_authority": 50,
-        "notes": "Resource directory for Virginia small businesses.",
-    },
+    LinkOpportunity(
+        target_site="Virginia.gov Business Directory",
+        target_url="https://www.virginia.gov/services/business/",
+        category="state_directory",
+        domain_authority=85,
+        notes="State government resource listing. Very high DA.",
+    ),
+    LinkOpportunity(
+        target_site="Virginia SCC (State Corporation Commission)",
+        target_url="https://www.scc.virginia.gov",
+        category="state_directory",
+        domain_authority=70,
+        notes="Ensure the business is registered and appears in the SCC look-up.",
+    ),
+    LinkOpportunity(
+        target_site="Virginia Secretary of State - Notary Division",
+        target_url="https://www.commonwealth.virginia.gov/official-documents/notary-commissions/",
+        category="state_directory",
+        domain_authority=72,
+        notes="Maintain an active notary commission listed with the state.",
+    ),
+    LinkOpportunity(
+        target_site="Virginia Tourism Corporation",
+        target_url="https://www.virginia.org",
+        category="state_directory",
+        domain_authority=68,
+        notes="Submit under professional services for Virginia visitors needing notary.",
+    ),
+    LinkOpportunity(
+        target_site="Virginia SBDC (Small Business Development Center)",
+        target_url="https://www.virginiasbdc.org",
+        category="state_directory",
+        domain_authority=50,
+        notes="Resource directory for Virginia small businesses.",
+    ),
 
     # --- Business Directories -------------------------------------------------
-    {
-        "target_site": "Better Business Bureau (BBB)",
-        "target_url": "https://www.bbb.org",
-        "category": "business_directory",
-        "domain_authority": 88,
-        "notes": "Accreditation provides a high-DA backlink. Essential trust signal.",
-    },
-    {
-        "target_site": "Manta",
-        "target_url": "https://www.manta.com",
-        "category": "business_directory",
-        "domain_authority": 62,
-        "notes": "Free business profile with link back to website.",
-    },
-    {
-        "target_site": "Alignable",
-        "target_url": "https://www.alignable.com",
-        "category": "business_directory",
-        "domain_authority": 55,
-        "notes": "Local business networking platform with profile link.",
-    },
-    {
-        "target_site": "Thumbtack",
-        "target_url": "https://www.thumbtack.com",
-        "category": "business_directory",
-        "domain_authority": 72,
-        "notes": "Professional services marketplace. Good for lead gen and backlink.",
-    },
-    {
-        "target_site": "Yelp",
-        "target_url": "https://www.yelp.com",
-        "category": "business_directory",
-        "domain_authority": 93,
-        "notes": "Claim and optimise the Yelp business page for a high-DA link.",
-    },
-    {
-        "target_site": "Google Business Profile",
-        "target_url": "https://business.google.com",
-        "category": "business_directory",
-        "domain_authority": 100,
-        "notes": "Foundation of local SEO. Keep profile fully optimised.",
-    },
-    {
-        "target_site": "Bing Places for Business",
-        "target_url": "https://www.bingplaces.com",
-        "category": "business_directory",
-        "domain_authority": 70,
-        "notes": "Claim the Bing listing. Imports from Google Business Profile.",
-    },
-    {
-        "target_site": "Apple Maps Connect",
-        "target_url": "https://mapsconnect.apple.com",
-        "category": "business_directory",
-        "domain_authority": 100,
-        "notes": "Claim the Apple Maps listing for iOS/Siri visibility.",
-    },
-    {
-        "target_site": "Yellow Pages (YP.com)",
-        "target_url": "https://www.yellowpages.com",
-        "category": "business_directory",
-        "domain_authority": 82,
-        "notes": "Legacy directory still used by many consumers. Free listing available.",
-    },
-    {
-        "target_site": "Angi (formerly Angie's List)",
-        "target_url": "https://www.angi.com",
-        "category": "business_directory",
-        "domain_authority": 80,
-        "notes": "Home services directory. Relevant for mobile notary visits.",
-    },
-    {
-        "target_site": "MapQuest",
-        "target_url": "https://www.mapquest.com",
-        "category": "business_directory",
-        "domain_authority": 78,
-        "notes": "Add business listing for map-based searches.",
-    },
+    LinkOpportunity(
+        target_site="Better Business Bureau (BBB)",
+        target_url="https://www.bbb.org",
+        category="business_directory",
+        domain_authority=88,
+        notes="Accreditation provides a high-DA backlink. Essential trust signal.",
+    ),
+    LinkOpportunity(
+        target_site="Manta",
+        target_url="https://www.manta.com",
+        category="business_directory",
+        domain_authority=62,
+        notes="Free business profile with link back to website.",
+    ),
+    LinkOpportunity(
+        target_site="Alignable",
+        target_url="https://www.alignable.com",
+        category="business_directory",
+        domain_authority=55,
+        notes="Local business networking platform with profile link.",
+    ),
+    LinkOpportunity(
+        target_site="Thumbtack",
+        target_url="https://www.thumbtack.com",
+        category="business_directory",
+        domain_authority=72,
+        notes="Professional services marketplace. Good for lead gen and backlink.",
+    ),
+    LinkOpportunity(
+        target_site="Yelp",
+        target_url="https://www.yelp.com",
+        category="business_directory",
+        domain_authority=93,
+        notes="Claim and optimise the Yelp business page for a high-DA link.",
+    ),
+    LinkOpportunity(
+        target_site="Google Business Profile",
+        target_url="https://business.google.com",
+        category="business_directory",
+        domain_authority=100,
+        notes="Foundation of local SEO. Keep profile fully optimised.",
+    ),
+    LinkOpportunity(
+        target_site="Bing Places for Business",
+        target_url="https://www.bingplaces.com",
+        category="business_directory",
+        domain_authority=70,
+        notes="Claim the Bing listing. Imports from Google Business Profile.",
+    ),
+    LinkOpportunity(
+        target_site="Apple Maps Connect",
+        target_url="https://mapsconnect.apple.com",
+        category="business_directory",
+        domain_authority=100,
+        notes="Claim the Apple Maps listing for iOS/Siri visibility.",
+    ),
+    LinkOpportunity(
+        target_site="Yellow Pages (YP.com)",
+        target_url="https://www.yellowpages.com",
+        category="business_directory",
+        domain_authority=82,
+        notes="Legacy directory still used by many consumers. Free listing available.",
+    ),
+    LinkOpportunity(
+        target_site="Angi (formerly Angie's List)",
+        target_url="https://www.angi.com",
+        category="business_directory",
+        domain_authority=80,
+        notes="Home services directory. Relevant for mobile notary visits.",
+    ),
+    LinkOpportunity(
+        target_site="MapQuest",
+        target_url="https://www.mapquest.com",
+        category="business_directory",
+        domain_authority=78,
+        notes="Add business listing for map-based searches.",
+    ),
 
     # --- Real Estate Directories (loan signing / closing services) ------------
-    {
-        "target_site": "SnapDocs",
-        "target_url": "https://www.snapdocs.com",
-        "category": "real_estate_directory",
-        "domain_authority": 45,
-        "notes": "Notary signing platform for loan-signing / real-estate closings.",
-    },
-    {
-        "target_site": "Zillow Agent Directory",
-        "target_url": "https://www.zillow.com",
-        "category": "real_estate_directory",
-        "domain_authority": 91,
-        "notes": "Explore partnership or advertising for closing notary services.",
-    },
-    {
-        "target_site": "Realtor.com",
-        "target_url": "https://www.realtor.com",
-        "category": "real_estate_directory",
-        "domain_authority": 88,
-        "notes": "Professional directory. Link available through partnerships.",
-    },
-    {
-        "target_site": "NotaryCafe",
-        "target_url": "https://www.notarycafe.com",
-        "category": "real_estate_directory",
-        "domain_authority": 38,
-        "notes": "Notary community / directory focused on signing agents.",
-    },
-    {
-        "target_site": "CloseSimple",
-        "target_url": "https://www.closesimple.com",
-        "category": "real_estate_directory",
-        "domain_authority": 30,
-        "notes": "Title and closing industry platform. Networking opportunity.",
-    },
+    LinkOpportunity(
+        target_site="SnapDocs",
+        target_url="https://www.snapdocs.com",
+        category="real_estate_directory",
+        domain_authority=45,
+        notes="Notary signing platform for loan-signing / real-estate closings.",
+    ),
+    LinkOpportunity(
+        target_site="Zillow Agent Directory",
+        target_url="https://www.zillow.com",
+        category="real_estate_directory",
+        domain_authority=91,
+        notes="Explore partnership or advertising for closing notary services.",
+    ),
+    LinkOpportunity(
+        target_site="Realtor.com",
+        target_url="https://www.realtor.com",
+        category="real_estate_directory",
+        domain_authority=88,
+        notes="Professional directory. Link available through partnerships.",
+    ),
+    LinkOpportunity(
+        target_site="NotaryCafe",
+        target_url="https://www.notarycafe.com",
+        category="real_estate_directory",
+        domain_authority=38,
+        notes="Notary community / directory focused on signing agents.",
+    ),
+    LinkOpportunity(
+        target_site="CloseSimple",
+        target_url="https://www.closesimple.com",
+        category="real_estate_directory",
+        domain_authority=30,
+        notes="Title and closing industry platform. Networking opportunity.",
+    ),
 ]
 
+# LINK_OPPORTUNITIES grouped by category in the shape find_opportunities
+# returns.  The table is constant, so the grouping is built once.
+_grouped_opportunities: dict[str, list[dict[str, Any]]] = defaultdict(list)
+for _opp in LINK_OPPORTUNITIES:
+    _grouped_opportunities[_opp.category].append(_opp._asdict())
+_OPPORTUNITIES_BY_CATEGORY: tuple[dict[str, Any], ...] = tuple(
+    {"category": cat, "count": len(items), "opportunities": items}
+    for cat, items in _grouped_opportunities.items()
+)
+del _grouped_opportunities
+
+# Domain-authority report buckets: 0-10, 11-20, ..., 91-100.
+_DA_BUCKET_LABELS: tuple[str, ...] = (
+    "0-10", "11-20", "21-30", "31-40", "41-50",
+    "51-60", "61-70", "71-80", "81-90", "91-100",
+)
+
+# Outreach e-mail templates, compiled once.  ``$company_name``,
+# ``$company_url`` and ``$phone`` are filled in per call; bracketed
+# placeholders are left for the sender to complete.
+_OUTREACH_TEMPLATES: dict[str, Template] = {
+    # ---- Directory listing request -------------------------------------------
+    "directory_listing": Template(
+        "Subject: Request to Add ${company_name} to "
+        "[Website/Directory Name] Directory\n"
+        "\n"
+        "Dear [Contact Name],\n"
+        "\n"
+        "My name is [Your Name] and I am with ${company_name}, "
+        "a professional notary public and apostille service provider "
+        "serving the Washington DC metro area (DMV) and Southwest "
+        "Virginia.\n"
+        "\n"
+        "I noticed that [Website/Directory Name] maintains a directory of "
+        "legal and professional service providers in the region. I "
+        "would love the opportunity to be included so that individuals "
+        "and businesses searching for trusted notary and apostille "
+        "services can find us more easily.\n"
+        "\n"
+        "Here is a brief overview of our services:\n"
+        "  - Apostille & document authentication\n"
+        "  - Mobile notary services (available 7 days a week)\n"
+        "  - Loan signing / real-estate closing notary\n"
+        "  - Embassy legalization assistance\n"
+        "  - Remote online notarization\n"
+        "\n"
+        "Our website is ${company_url} and we maintain an "
+        "A+ rating with the Better Business Bureau.\n"
+        "\n"
+        "Please let me know what information you need to add our "
+        "listing.  I would be happy to provide any additional details.\n"
+        "\n"
+        "Thank you for your time and consideration.\n"
+        "\n"
+        "Best regards,\n"
+        "[Your Name]\n"
+        "${company_name}\n"
+        "${company_url}\n"
+        "${phone}\n"
+    ),
+
+    # ---- Guest post pitch ----------------------------------------------------
+    "guest_post": Template(
+        "Subject: Guest Article Contribution for [Website/Directory Name]\n"
+        "\n"
+        "Dear [Contact Name],\n"
+        "\n"
+        "I am [Your Name], owner of ${company_name}, a "
+        "professional notary and apostille service based in Virginia.\n"
+        "\n"
+        "I have been following [Website/Directory Name] and appreciate the "
+        "valuable content you provide to your audience.  I would love "
+        "to contribute a guest article on a topic relevant to your "
+        "readers.\n"
+        "\n"
+        "Here are a few article ideas I had in mind:\n"
+        "\n"
+        "  1. \"How to Get an Apostille in Virginia: A Step-by-Step "
+        "Guide\"\n"
+        "  2. \"5 Common Mistakes People Make When Getting Documents "
+        "Notarized\"\n"
+        "  3. \"Understanding the Difference Between Notarization and "
+        "Apostille\"\n"
+        "  4. \"What to Expect During a Mobile Notary Appointment\"\n"
+        "  5. \"Remote Online Notarization: What It Is and When You "
+        "Need It\"\n"
+        "\n"
+        "Each article would be original, well-researched, and written "
+        "specifically for your audience.  I am happy to follow your "
+        "editorial guidelines and include only a brief author bio with "
+        "a link to our website.\n"
+        "\n"
+        "Would any of these topics be a good fit?  I look forward to "
+        "hearing from you.\n"
+        "\n"
+        "Best regards,\n"
+        "[Your Name]\n"
+        "${company_name}\n"
+        "${company_url}\n"
+    ),
+
+    # ---- Partnership / cross-promotion ---------------------------------------
+    "partnership": Template(
+        "Subject: Partnership Opportunity Between ${company_name} "
+        "and [Organization Name]\n"
+        "\n"
+        "Dear [Contact Name],\n"
+        "\n"
+        "I am reaching out from ${company_name}, a trusted notary "
+        "public and apostille service provider serving the DMV area "
+        "and Southwest Virginia.  I believe there is a strong "
+        "opportunity for our businesses to support each other.\n"
+        "\n"
+        "Many of our clients require complementary services such as "
+        "legal counsel, real-estate assistance, immigration support, "
+        "or translation services.  Similarly, your clients may "
+        "occasionally need professional notarization or apostille "
+        "services.\n"
+        "\n"
+        "I would love to explore a referral partnership where we:\n"
+        "  - Feature each other on our respective websites\n"
+        "  - Exchange referrals for overlapping client needs\n"
+        "  - Co-create helpful content for our shared audiences\n"
+        "\n"
+        "Would you be open to a brief call or meeting to discuss how "
+        "we might work together?  I am flexible on timing and happy to "
+        "meet in person if you are in the Northern Virginia or Roanoke "
+        "area.\n"
+        "\n"
+        "Looking forward to connecting.\n"
+        "\n"
+        "Best regards,\n"
+        "[Your Name]\n"
+        "${company_name}\n"
+        "${company_url}\n"
+        "${phone}\n"
+    ),
+
+    # ---- Local business networking -------------------------------------------
+    "local_networking": Template(
+        "Subject: Connecting with [Organization Name] -- "
+        "${company_name}\n"
+        "\n"
+        "Dear [Contact Name],\n"
+        "\n"
+        "My name is [Your Name] from ${company_name}.  We are a "
+        "professional notary and apostille service based right here in "
+        "the community, and I am always looking to connect with fellow "
+        "local business owners.\n"
+        "\n"
+        "I came across your business and thought it would be great to "
+        "introduce myself.  We frequently serve clients who also need "
+        "the types of services you offer, and I would welcome the "
+        "opportunity to refer business your way.\n"
+        "\n"
+        "If you are open to it, I would love to:\n"
+        "  - Grab a coffee and learn more about your business\n"
+        "  - Discuss ways we can refer clients to each other\n"
+        "  - Explore co-marketing opportunities such as a joint "
+        "blog post or community event\n"
+        "\n"
+        "Please let me know if you would be interested in connecting.  "
+        "I am available most days and happy to work around your "
+        "schedule.\n"
+        "\n"
+        "Warm regards,\n"
+        "[Your Name]\n"
+        "${company_name}\n"
+        "${company_url}\n"
+        "${phone}\n"
+    ),
+
+    # ---- Industry association membership -------------------------------------
+    "association_membership": Template(
+        "Subject: Membership Inquiry -- ${company_name}\n"
+        "\n"
+        "Dear [Contact Name],\n"
+        "\n"
+        "I am [Your Name], owner and commissioned notary public at "
+        "${company_name}.  We provide apostille, notarization, "
+        "document authentication, and loan-signing services across "
+        "Virginia, Washington DC, and Maryland.\n"
+        "\n"
+        "I am interested in becoming a member of [Organization Name] "
+        "and would like to learn more about the membership benefits, "
+        "application process, and how our business can contribute to "
+        "the association.\n"
+        "\n"
+        "Specifically, I am interested in:\n"
+        "  - Being listed in your member / provider directory\n"
+        "  - Participating in upcoming events or webinars\n"
+        "  - Contributing articles or educational content\n"
+        "  - Networking with other members in the region\n"
+        "\n"
+        "Could you please send me information about membership tiers "
+        "and the application process?  I look forward to joining your "
+        "organisation.\n"
+        "\n"
+        "Thank you,\n"
+        "[Your Name]\n"
+        "${company_name}\n"
+        "${company_url}\n"
+        "${phone}\n"
+    ),
+}
+
+# Known domain authorities: the high-DA fallback table merged with the DA
+# recorded for each curated opportunity.  Domains found here never cost an
+# Ahrefs lookup.
+DA_BY_DOMAIN: dict[str, int] = {
+    **HIGH_DA_DOMAINS,
+    **{
+        urlparse(opp.target_url).netloc.lower().removeprefix("www."):
+            opp.domain_authority
+        for opp in LINK_OPPORTUNITIES
+    },
+}
+
+
+# ---------------------------------------------------------------------------
+# Module-level helpers
+# ---------------------------------------------------------------------------
+
+# The two memoised helpers below are pure functions of a string that repeats
+# heavily across a profile (many links per referring page / domain), so
+# results are cached per process.
+@lru_cache(maxsize=65536)
+def _domain_from_url(url: str) -> str:
+    """Extract a bare, lower-cased domain from a full URL."""
+    try:
+        return urlparse(url).netloc.lower().removeprefix("www.")
+    except Exception:
+        return url.lower().removeprefix("www.")
+
+
+@lru_cache(maxsize=65536)
+def _matches_spam_pattern(domain: str) -> bool:
+    """Return *True* if *domain* matches any of :data:`SPAM_DOMAIN_PATTERNS`."""
+    return _SPAM_DOMAIN_RE.search(domain.lower()) is not None
+
+
+def _bounded_text(soup: BeautifulSoup, limit: int) -> str:
+    """Return ``soup.get_text(" ", strip=True)[:limit]`` without building
+    the full document text -- string collection stops once *limit* is hit.
+    """
+    parts: list[str] = []
+    size = 0
+    for text in soup.stripped_strings:
+        parts.append(text)
+        size += len(text) + 1
+        if size > limit:
+            break
+    return " ".join(parts)[:limit]
+
+
+def _toxicity_scores_numpy(
+    da: np.ndarray,
+    is_spam: np.ndarray,
+    bad_tld: np.ndarray,
+    is_commercial: np.ndarray,
+    irrelevant: np.ndarray,
+    many_digits: np.ndarray,
+) -> np.ndarray:
+    """Combine the per-link toxicity signals into 0--100 scores."""
+    da_points = np.select([da < 5, da < 10, da < 15], [30, 20, 10], 0)
+    scores = (
+        da_points
+        + is_spam * 35
+        + bad_tld * 15
+        + is_commercial * 20
+        + irrelevant * 10
+        + many_digits * 15
+    )
+    return np.minimum(scores, 100).astype(np.float64)
+
+
+if _NUMBA_AVAILABLE:
+
+    @numba.njit(parallel=True, cache=True)
+    def _toxicity_scores(da, is_spam, bad_tld, is_commercial, irrelevant, many_digits):
+        """Fused, multi-threaded equivalent of :func:`_toxicity_scores_numpy`."""
+        n = da.shape[0]
+        scores = np.empty(n, dtype=np.float64)
+        for i in numba.prange(n):
+            if da[i] < 5:
+                score = 30
+            elif da[i] < 10:
+                score = 20
+            elif da[i] < 15:
+                score = 10
+            else:
+                score = 0
+            score += (
+                35 * is_spam[i]
+                + 15 * bad_tld[i]
+                + 20 * is_commercial[i]
+                + 10 * irrelevant[i]
+                + 15 * many_digits[i]
+            )
+            scores[i] = min(score, 100)
+        return scores
+
+else:
+    _toxicity_scores = _toxicity_scores_numpy
+
+
+def _link_composite_numpy(
+    da: np.ndarray, relevance: np.ndarray, link_type: np.ndarray, tld: np.ndarray
+) -> np.ndarray:
+    """Weighted link-score composite: DA 40 %, relevance 35 %, link type
+    15 %, TLD trust 10 %."""
+    return da * 0.40 + relevance * 0.35 + link_type * 0.15 + tld * 0.10
+
+
+if _NUMBA_AVAILABLE:
+
+    @numba.njit(parallel=True, cache=True)
+    def _link_composite(da, relevance, link_type, tld):
+        """Fused, multi-threaded equivalent of :func:`_link_composite_numpy`."""
+        n = da.shape[0]
+        overall = np.empty(n, dtype=np.float64)
+        for i in numba.prange(n):
+            overall[i] = (
+                da[i] * 0.40 + relevance[i] * 0.35 + link_type[i] * 0.15 + tld[i] * 0.10
+            )
+        return overall
+
+else:
+    _link_composite = _link_composite_numpy
+
 
 # ---------------------------------------------------------------------------
 # BacklinkBuilder class
@@ -399,6 +925,22 @@ class BacklinkBuilder:
         self.ahrefs_api_key: str = AHREFS_API_KEY
         self.semrush_api_key: str = SEMRUSH_API_KEY
         self.session = SessionLocal()
+        self._da_cache: TTLCache = TTLCache(maxsize=_DA_CACHE_SIZE, ttl=_DA_CACHE_TTL)
+        self._da_cache_lock = threading.Lock()
+        self.http = requests.Session()
+        self.http.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(500, 502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        self.http.mount("https://", adapter)
+        self.http.mount("http://", adapter)
         logger.info(
             "BacklinkBuilder initialised for domain '{}'", self.company_domain
         )
@@ -409,11 +951,7 @@ class BacklinkBuilder:
 
     def _get_domain(self, url: str) -> str:
         """Extract a bare domain from a full URL."""
-        try:
-            parsed = urlparse(url)
-            return parsed.netloc.lower().replace("www.", "")
-        except Exception:
-            return url.lower().replace("www.", "")
+        return _domain_from_url(url)
 
     def _safe_request(
         self,
@@ -421,120 +959,207 @@ class BacklinkBuilder:
         *,
         timeout: int = 30,
         headers: Optional[dict[str, str]] = None,
+        stream: bool = False,
     ) -> Optional[requests.Response]:
         """Perform an HTTP GET with error handling and a browser-like UA."""
-        default_headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            ),
-        }
-        if headers:
-            default_headers.update(headers)
         try:
-            response = requests.get(url, headers=default_headers, timeout=timeout)
+            response = self.http.get(
+                url, headers=headers, timeout=timeout, stream=stream
+            )
             response.raise_for_status()
             return response
         except requests.RequestException as exc:
             logger.warning("HTTP request failed for {}: {}", url, exc)
             return None
 
+    def _ahrefs_get(
+        self,
+        report: str,
+        target: str,
+        *,
+        limit: Optional[int] = None,
+        timeout: int = 30,
+    ) -> Optional[dict[str, Any]]:
+        """Fetch an Ahrefs v2 report, served from a 10-minute cache.
+
+        Returns the decoded JSON body, or *None* when the API answers with
+        a non-200 status.  Network errors propagate to the caller.
+        """
+        key = (report, target, limit)
+        # One lookup: the entry may expire between a membership test and
+        # an index, which would raise KeyError.
+        with _AHREFS_CACHE_LOCK:
+            cached = _AHREFS_CACHE.get(key)
+        if cached is not None:
+            return cached
+        params: dict[str, Any] = {
+            "token": self.ahrefs_api_key,
+            "from": report,
+            "target": target,
+            "mode": "domain",
+            "output": "json",
+        }
+        if limit is not None:
+            params["limit"] = limit
+        resp = self.http.get(
+            "https://apiv2.ahrefs.com", params=params, timeout=timeout
+        )
+        if resp.status_code != 200:
+            logger.warning(
+                "Ahrefs API returned status {} for {} ({})",
+                resp.status_code, target, report,
+            )
+            return None
+        data = orjson.loads(resp.content)
+        with _AHREFS_CACHE_LOCK:
+            _AHREFS_CACHE[key] = data
+        return data
+
     def _estimate_domain_authority(self, domain: str) -> int:
-        """Estimate domain authority using the Ahrefs API.
+        """Estimate domain authority for *domain*.
 
-        Falls back to a heuristic estimation when the API key is not
-        configured or the request fails.
+        Domains with a known DA (``DA_BY_DOMAIN``) are answered locally;
+        others go to the Ahrefs API, falling back to a conservative
+        baseline when the API key is not configured or the request
+        fails.  Real ratings are memoised per instance since many
+        backlinks share the same source domain; the baseline is not.
+        """
+        with self._da_cache_lock:
+            da = self._da_cache.get(domain)
+        if da is None:
+            da = self._lookup_domain_authority(domain)
+            if da is None:
+                return _DA_BASELINE
+            with self._da_cache_lock:
+                self._da_cache[domain] = da
+        return da
+
+    def _estimate_domain_authorities(
+        self, domains: Iterable[str]
+    ) -> dict[str, int]:
+        """Estimate domain authority for many domains at once.
+
+        Each distinct domain is resolved once; uncached domains are looked
+        up concurrently so a batch costs roughly one round trip of latency
+        rather than one per domain.
         """
-        # Attempt Ahrefs API first
+        unique = {d for d in domains if d is not None}
+        with self._da_cache_lock:
+            pending = [
+                d for d in unique
+                if d not in self._da_cache and d not in DA_BY_DOMAIN
+            ]
+        failed: set[str] = set()
+        if len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=_DA_LOOKUP_CONCURRENCY) as pool:
+                looked_up = list(pool.map(self._lookup_domain_authority, pending))
+            rated = {d: da for d, da in zip(pending, looked_up) if da is not None}
+            failed = set(pending) - rated.keys()
+            with self._da_cache_lock:
+                self._da_cache.update(rated)
+        return {
+            d: _DA_BASELINE if d in failed else self._estimate_domain_authority(d)
+            for d in unique
+        }
+
+    def _lookup_domain_authority(self, domain: str) -> Optional[int]:
+        """Uncached domain-authority lookup behind ``_estimate_domain_authority``.
+
+        Returns *None* when no rating is available.
+        """
+        # Known domains never need an API call.
+        if domain in DA_BY_DOMAIN:
+            return DA_BY_DOMAIN[domain]
+
         if self.ahrefs_api_key:
             try:
-                resp = requests.get(
-                    "https://apiv2.ahrefs.com",
-                    params={
-                        "token": self.ahrefs_api_key,
-                        "from": "domain_rating",
-                        "target": domain,
-                        "mode": "domain",
-                        "output": "json",
-                    },
-                    timeout=15,
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    if "domain_rating" in data:
-                        return int(data["domain_rating"])
+                data = self._ahrefs_get("domain_rating", domain, timeout=15)
+                if data and "domain_rating" in data:
+                    return int(data["domain_rating"])
             except Exception as exc:
                 logger.debug("Ahrefs DA lookup failed for {}: {}", domain, exc)
 
-        # Heuristic fallback: well-known high-DA domains get a fixed score;
-        # everything else receives a conservative baseline.
-        high_da_domains: dict[str, int] = {
-            "google.com": 100, "yelp.com": 93, "bbb.org": 88,
-            "yellowpages.com": 82, "findlaw.com": 82, "justia.com": 80,
-            "angi.com": 80, "mapquest.com": 78, "nolo.com": 75,
-            "thumbtack.com": 72, "avvo.com": 72, "lawyers.com": 70,
-            "scc.virginia.gov": 70, "bingplaces.com": 70,
-            "hg.org": 68, "virginia.org": 68, "manta.com": 62,
-            "lawinfo.com": 62, "nationalnotary.org": 60,
-            "alignable.com": 55, "virginiasbdc.org": 50,
-            "dcchamber.org": 50, "123notary.com": 48,
-            "notaryrotary.com": 45, "snapdocs.com": 45,
-            "fairfaxchamber.org": 47, "alexchamber.com": 45,
-            "roanokechamber.org": 44, "arlingtonchamber.org": 42,
-            "asnnotary.org": 42, "loudounchamber.org": 40,
-            "gwhcc.org": 40, "notary.net": 40, "notarycafe.com": 38,
-            "signingagent.com": 35, "montgomerycc.org": 32,
-            "s-rcchamber.org": 30, "closesimple.com": 30,
-            "virginianotaryassociation.org": 25,
-        }
-        return high_da_domains.get(domain, 15)
+        return None
 
     def _calculate_relevance_score(self, text: str) -> float:
         """Score how topically relevant a block of text is (0.0 -- 1.0)."""
-        if not text:
-            return 0.0
-        text_lower = text.lower()
-        matches = sum(1 for kw in RELEVANCE_KEYWORDS if kw in text_lower)
+        return float(self._calculate_relevance_scores([text])[0])
+
+    def _calculate_relevance_scores(self, texts: list[str]) -> np.ndarray:
+        """Vectorised :meth:`_calculate_relevance_score` over many *texts*.
+
+        The automaton is walked once per text and the normalisation is
+        applied to the whole vector, so callers scoring every backlink pay
+        the per-call overhead only once.
+        """
+        # Count distinct keywords, matching the previous ``kw in text`` scan.
+        matches = np.fromiter(
+            (
+                len({kw for _, kw in _RELEVANCE_AC.iter(text.lower())}) if text else 0
+                for text in texts
+            ),
+            dtype=np.float64,
+            count=len(texts),
+        )
         # Normalise against the total keyword list; cap at 1.0.
-        return min(matches / max(len(RELEVANCE_KEYWORDS) * 0.15, 1), 1.0)
+        return np.minimum(matches / max(len(RELEVANCE_KEYWORDS) * 0.15, 1), 1.0)
 
     def _is_spam_domain(self, domain: str) -> bool:
         """Return *True* if the domain matches known spam heuristic patterns."""
-        domain_lower = domain.lower()
-        for pattern in SPAM_DOMAIN_PATTERNS:
-            if re.search(pattern, domain_lower):
-                return True
-        return False
+        return _matches_spam_pattern(domain)
+
+    def _get_our_referring_domains(self) -> set[str]:
+        """Return the distinct source domains of our active backlinks."""
+        try:
+            return {
+                domain for (domain,) in self.session.execute(
+                    select(Backlink.source_domain)
+                    .where(
+                        Backlink.is_active.is_(True),
+                        Backlink.source_domain.isnot(None),
+                        Backlink.source_domain != "",
+                    )
+                    .distinct()
+                )
+            }
+        except Exception as exc:
+            logger.error("Error loading our backlinks: {}", exc)
+            return set()
 
     def _scrape_backlinks_from_page(self, page_url: str) -> list[dict[str, Any]]:
         """Attempt to scrape external links pointing to our domain from a page.
 
         This is a lightweight scraping helper -- not a replacement for
-        a full backlink index.  It inspects all ``<a>`` tags in the
-        response HTML and retains those whose ``href`` points to
-        ``self.company_domain``.
+        a full backlink index.  It parses the response with ``lxml`` and
+        retains the ``<a>`` tags whose ``href`` points to one of
+        ``OWN_DOMAINS``.
         """
         found: list[dict[str, Any]] = []
         response = self._safe_request(page_url)
         if not response:
             return found
+        # Cheap byte-level check: skip the parse entirely when the page
+        # never mentions any of our domains.
+        content = response.content
+        if not any(domain in content for domain in _OWN_DOMAINS_BYTES):
+            return found
         try:
-            soup = BeautifulSoup(response.text, "html.parser")
-            for link in soup.find_all("a", href=True):
-                href: str = link["href"]
-                if self.company_domain in href:
-                    rel_attrs = link.get("rel", [])
-                    link_type = (
-                        "nofollow" if "nofollow" in rel_attrs else "dofollow"
-                    )
-                    found.append({
-                        "source_url": page_url,
-                        "source_domain": self._get_domain(page_url),
-                        "target_url": href,
-                        "anchor_text": link.get_text(strip=True),
-                        "link_type": link_type,
-                    })
+            tree = lxml.html.fromstring(content)
+            for link in tree.xpath("//a[@href]"):
+                href = link.get("href")
+                if next(_OWN_DOMAINS_AC.iter(href), None) is None:
+                    continue
+                rel_attrs = (link.get("rel") or "").lower().split()
+                link_type = (
+                    "nofollow" if "nofollow" in rel_attrs else "dofollow"
+                )
+                found.append({
+                    "source_url": page_url,
+                    "source_domain": self._get_domain(page_url),
+                    "target_url": href,
+                    "anchor_text": link.text_content().strip(),
+                    "link_type": link_type,
+                })
         except Exception as exc:
             logger.warning("Scrape error on {}: {}", page_url, exc)
         return found
@@ -560,20 +1185,10 @@ class BacklinkBuilder:
         if self.ahrefs_api_key:
             logger.info("Querying Ahrefs API for backlinks")
             try:
-                resp = requests.get(
-                    "https://apiv2.ahrefs.com",
-                    params={
-                        "token": self.ahrefs_api_key,
-                        "from": "backlinks",
-                        "target": self.company_domain,
-                        "mode": "domain",
-                        "limit": 1000,
-                        "output": "json",
-                    },
-                    timeout=30,
+                data = self._ahrefs_get(
+                    "backlinks", self.company_domain, limit=1000
                 )
-                if resp.status_code == 200:
-                    data = resp.json()
+                if data is not None:
                     for link in data.get("refpages", []):
                         discovered_backlinks.append({
                             "source_url": link.get("url_from", ""),
@@ -590,10 +1205,6 @@ class BacklinkBuilder:
                     logger.info(
                         "Ahrefs returned {} backlinks", len(discovered_backlinks)
                     )
-                else:
-                    logger.warning(
-                        "Ahrefs API returned status {}", resp.status_code
-                    )
             except Exception as exc:
                 logger.error("Ahrefs API error: {}", exc)
 
@@ -601,7 +1212,7 @@ class BacklinkBuilder:
         if not discovered_backlinks and self.semrush_api_key:
             logger.info("Querying SEMrush API for backlinks")
             try:
-                resp = requests.get(
+                with self.http.get(
                     "https://api.semrush.com/analytics/v1/",
                     params={
                         "key": self.semrush_api_key,
@@ -614,25 +1225,32 @@ class BacklinkBuilder:
                         ),
                     },
                     timeout=30,
-                )
-                if resp.status_code == 200:
-                    for line in resp.text.strip().split("\n")[1:]:
-                        parts = line.split("\t")
-                        if len(parts) >= 2:
-                            source_url = parts[0]
-                            discovered_backlinks.append({
-                                "source_url": source_url,
-                                "source_domain": self._get_domain(source_url),
-                                "target_url": self.company_url,
-                                "anchor_text": parts[1] if len(parts) > 1 else "",
-                                "link_type": "dofollow",
-                                "domain_authority": self._estimate_domain_authority(
-                                    self._get_domain(source_url)
-                                ),
-                            })
-                    logger.info(
-                        "SEMrush returned {} backlinks", len(discovered_backlinks)
-                    )
+                    stream=True,
+                ) as resp:
+                    if resp.status_code == 200:
+                        resp.encoding = resp.encoding or "utf-8"
+                        lines = resp.iter_lines(decode_unicode=True)
+                        next(lines, None)  # skip header row
+                        for line in lines:
+                            parts = line.split("\t")
+                            if len(parts) >= 2:
+                                source_url = parts[0]
+                                discovered_backlinks.append({
+                                    "source_url": source_url,
+                                    "source_domain": self._get_domain(source_url),
+                                    "target_url": self.company_url,
+                                    "anchor_text": parts[1],
+                                    "link_type": "dofollow",
+                                })
+                        da_map = self._estimate_domain_authorities(
+                            bl["source_domain"] for bl in discovered_backlinks
+                        )
+                        for bl in discovered_backlinks:
+                            bl["domain_authority"] = da_map[bl["source_domain"]]
+                        logger.info(
+                            "SEMrush returned {} backlinks",
+                            len(discovered_backlinks),
+                        )
             except Exception as exc:
                 logger.error("SEMrush API error: {}", exc)
 
@@ -645,8 +1263,12 @@ class BacklinkBuilder:
                     .filter(Backlink.is_active.is_(True))
                     .all()
                 )
-                for bl in existing:
-                    scraped = self._scrape_backlinks_from_page(bl.source_url)
+                with ThreadPoolExecutor(max_workers=_SCRAPE_CONCURRENCY) as pool:
+                    results = list(pool.map(
+                        self._scrape_backlinks_from_page,
+                        [bl.source_url for bl in existing],
+                    ))
+                for bl, scraped in zip(existing, results):
                     if scraped:
                         discovered_backlinks.extend(scraped)
                     else:
@@ -663,13 +1285,39 @@ class BacklinkBuilder:
         # ---- Persist discovered backlinks ------------------------------------
         today = datetime.date.today()
         new_count = 0
-        for bl_data in discovered_backlinks:
-            try:
-                existing = (
+        existing_map: dict[str, Backlink] = {}
+        # Pages often carry several anchors to us; keep one entry per URL
+        # (the last one seen, as the per-row update previously did).
+        unique_backlinks = {
+            bl["source_url"]: bl
+            for bl in discovered_backlinks
+            if bl.get("source_url")
+        }
+        urls = list(unique_backlinks)
+        try:
+            for start in range(0, len(urls), _IN_CLAUSE_CHUNK):
+                for bl in (
                     self.session.query(Backlink)
-                    .filter_by(source_url=bl_data["source_url"])
-                    .first()
-                )
+                    .filter(
+                        Backlink.source_url.in_(
+                            urls[start:start + _IN_CLAUSE_CHUNK]
+                        )
+                    )
+                    .all()
+                ):
+                    existing_map.setdefault(bl.source_url, bl)
+        except Exception as exc:
+            logger.error("Error loading existing backlinks: {}", exc)
+
+        da_map = self._estimate_domain_authorities(
+            bl.get("source_domain", "")
+            for url, bl in unique_backlinks.items()
+            if url not in existing_map and bl.get("domain_authority") is None
+        )
+        new_rows: list[dict[str, Any]] = []
+        for bl_data in unique_backlinks.values():
+            try:
+                existing = existing_map.get(bl_data["source_url"])
                 if existing:
                     existing.last_checked = today
                     existing.is_active = True
@@ -680,29 +1328,28 @@ class BacklinkBuilder:
                         "link_type", existing.link_type
                     )
                 else:
-                    da = bl_data.get(
-                        "domain_authority",
-                        self._estimate_domain_authority(
-                            bl_data.get("source_domain", "")
-                        ),
-                    )
-                    new_backlink = Backlink(
-                        source_url=bl_data["source_url"],
-                        source_domain=bl_data.get("source_domain", ""),
-                        target_url=bl_data.get("target_url", self.company_url),
-                        anchor_text=bl_data.get("anchor_text", ""),
-                        link_type=bl_data.get("link_type", "dofollow"),
-                        domain_authority=da,
-                        is_active=True,
-                        first_seen=today,
-                        last_checked=today,
-                    )
-                    self.session.add(new_backlink)
+                    da = bl_data.get("domain_authority")
+                    if da is None:
+                        da = da_map[bl_data.get("source_domain", "")]
+                    new_rows.append({
+                        "source_url": bl_data["source_url"],
+                        "source_domain": bl_data.get("source_domain", ""),
+                        "target_url": bl_data.get("target_url", self.company_url),
+                        "anchor_text": bl_data.get("anchor_text", ""),
+                        "link_type": bl_data.get("link_type", "dofollow"),
+                        "domain_authority": da,
+                        "is_active": True,
+                        "first_seen": today,
+                        "last_checked": today,
+                    })
                     new_count += 1
             except Exception as exc:
                 logger.warning("Error persisting backlink: {}", exc)
 
         try:
+            if new_rows:
+                # Core executemany: no per-row ORM objects or identity map.
+                self.session.execute(insert(Backlink), new_rows)
             self.session.commit()
         except Exception as exc:
             self.session.rollback()
@@ -739,62 +1386,192 @@ class BacklinkBuilder:
         """
         logger.info("Loading link-building opportunities")
 
-        for opp in LINK_OPPORTUNITIES:
-            try:
-                existing = (
-                    self.session.query(BacklinkOpportunity)
-                    .filter_by(target_url=opp["target_url"])
-                    .first()
-                )
-                if not existing:
-                    record = BacklinkOpportunity(
-                        target_site=opp["target_site"],
-                        target_url=opp["target_url"],
-                        category=opp["category"],
-                        domain_authority=opp.get("domain_authority"),
-                        notes=opp.get("notes", ""),
-                        outreach_status="identified",
+        try:
+            existing = {
+                url for (url,) in self.session.execute(
+                    select(BacklinkOpportunity.target_url).where(
+                        BacklinkOpportunity.target_url.in_(
+                            [opp.target_url for opp in LINK_OPPORTUNITIES]
+                        )
                     )
-                    self.session.add(record)
-            except Exception as exc:
-                logger.warning(
-                    "Error storing opportunity '{}': {}",
-                    opp["target_site"], exc,
                 )
-
-        try:
+            }
+            rows = [
+                {
+                    "target_site": opp.target_site,
+                    "target_url": opp.target_url,
+                    "category": opp.category,
+                    "domain_authority": opp.domain_authority,
+                    "notes": opp.notes,
+                    "outreach_status": "identified",
+                }
+                for opp in LINK_OPPORTUNITIES
+                if opp.target_url not in existing
+            ]
+            if rows:
+                self.session.execute(insert(BacklinkOpportunity), rows)
             self.session.commit()
         except Exception as exc:
             self.session.rollback()
             logger.error("Database commit error in find_opportunities: {}", exc)
 
-        # Organise by category for the caller
-        by_category: dict[str, list[dict[str, Any]]] = defaultdict(list)
-        for opp in LINK_OPPORTUNITIES:
-            by_category[opp["category"]].append(opp)
-
-        result = [
-            {
-                "category": cat,
-                "count": len(items),
-                "opportunities": items,
-            }
-            for cat, items in by_category.items()
-        ]
-
         logger.info(
             "Identified {} opportunities across {} categories",
             len(LINK_OPPORTUNITIES),
-            len(by_category),
+            len(_OPPORTUNITIES_BY_CATEGORY),
         )
-        return result
+        return list(_OPPORTUNITIES_BY_CATEGORY)
+
+    def _fetch_ahrefs_competitor_backlinks(
+        self, competitor_domain: str
+    ) -> list[dict[str, Any]]:
+        """Fetch up to 1000 backlinks pointing at a competitor from Ahrefs."""
+        backlinks: list[dict[str, Any]] = []
+        try:
+            data = self._ahrefs_get("backlinks", competitor_domain, limit=1000)
+            if data is not None:
+                for link in data.get("refpages", []):
+                    backlinks.append({
+                        "source_url": link.get("url_from", ""),
+                        "source_domain": self._get_domain(
+                            link.get("url_from", "")
+                        ),
+                        "anchor_text": link.get("anchor", ""),
+                        "domain_authority": link.get("ahrefs_rank", 0),
+                        "link_type": (
+                            "nofollow" if link.get("nofollow") else "dofollow"
+                        ),
+                    })
+        except Exception as exc:
+            logger.error(
+                "Ahrefs competitor lookup error for {}: {}",
+                competitor_domain, exc,
+            )
+        return backlinks
+
+    def _fetch_semrush_competitor_backlinks(
+        self, competitor_domain: str
+    ) -> list[dict[str, Any]]:
+        """Fetch a competitor's backlinks from SEMrush (without DA)."""
+        backlinks: list[dict[str, Any]] = []
+        try:
+            with self.http.get(
+                "https://api.semrush.com/analytics/v1/",
+                params={
+                    "key": self.semrush_api_key,
+                    "type": "backlinks",
+                    "target": competitor_domain,
+                    "target_type": "root_domain",
+                },
+                timeout=30,
+                stream=True,
+            ) as resp:
+                if resp.status_code == 200:
+                    resp.encoding = resp.encoding or "utf-8"
+                    # SEMrush returns unquoted TSV; parse rows as they stream in.
+                    reader = csv.reader(
+                        resp.iter_lines(decode_unicode=True),
+                        delimiter="\t",
+                        quoting=csv.QUOTE_NONE,
+                    )
+                    next(reader, None)  # skip header row
+                    for parts in reader:
+                        if parts:
+                            source_url = parts[0]
+                            backlinks.append({
+                                "source_url": source_url,
+                                "source_domain": self._get_domain(source_url),
+                                "anchor_text": parts[1] if len(parts) > 1 else "",
+                                "link_type": "dofollow",
+                            })
+        except Exception as exc:
+            logger.error(
+                "SEMrush competitor lookup error for {}: {}",
+                competitor_domain, exc,
+            )
+        return backlinks
+
+    def _fetch_competitor_backlinks(
+        self, competitor_domain: str, rebuild: bool = False
+    ) -> list[dict[str, Any]]:
+        """Fetch a competitor's backlinks, preferring Ahrefs over SEMrush.
+
+        Results are cached per competitor domain; pass ``rebuild=True``
+        to bypass the cache and refresh it.  SEMrush is only queried when
+        Ahrefs comes back empty.  With
+        ``COMPETITOR_BACKLINK_CONCURRENT_PROVIDERS`` enabled and both
+        providers configured, the two requests are issued concurrently so
+        the fallback costs no extra latency; the trade-off is that every
+        uncached lookup then spends SEMrush API units even when Ahrefs
+        answers.  SEMrush rows are only enriched with DA estimates if
+        Ahrefs came back empty.
+        """
+        if not rebuild:
+            with _COMPETITOR_BACKLINK_CACHE_LOCK:
+                cached = _COMPETITOR_BACKLINK_CACHE.get(competitor_domain)
+            if cached is not None:
+                logger.debug(
+                    "Competitor backlink cache hit for '{}'", competitor_domain
+                )
+                return list(cached)
+        logger.debug(
+            "Competitor backlink cache miss for '{}'", competitor_domain
+        )
+
+        backlinks: list[dict[str, Any]] = []
+        semrush_backlinks: list[dict[str, Any]] = []
+        if (
+            COMPETITOR_BACKLINK_CONCURRENT_PROVIDERS
+            and self.ahrefs_api_key
+            and self.semrush_api_key
+        ):
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                ahrefs_future = pool.submit(
+                    self._fetch_ahrefs_competitor_backlinks, competitor_domain
+                )
+                semrush_future = pool.submit(
+                    self._fetch_semrush_competitor_backlinks, competitor_domain
+                )
+                backlinks = ahrefs_future.result()
+                if backlinks:
+                    # Drop SEMrush if it has not started; a request already
+                    # in flight is waited for when the pool closes.
+                    semrush_future.cancel()
+                else:
+                    semrush_backlinks = semrush_future.result()
+        else:
+            if self.ahrefs_api_key:
+                backlinks = self._fetch_ahrefs_competitor_backlinks(
+                    competitor_domain
+                )
+            if not backlinks and self.semrush_api_key:
+                semrush_backlinks = self._fetch_semrush_competitor_backlinks(
+                    competitor_domain
+                )
+
+        if not backlinks and semrush_backlinks:
+            da_map = self._estimate_domain_authorities(
+                bl["source_domain"] for bl in semrush_backlinks
+            )
+            for bl in semrush_backlinks:
+                bl["domain_authority"] = da_map[bl["source_domain"]]
+            backlinks = semrush_backlinks
+
+        # Empty results usually mean a failed lookup; do not pin those.
+        if backlinks:
+            with _COMPETITOR_BACKLINK_CACHE_LOCK:
+                _COMPETITOR_BACKLINK_CACHE[competitor_domain] = backlinks
+        return list(backlinks)
 
     # ------------------------------------------------------------------
     # 3. Track competitor backlinks
     # ------------------------------------------------------------------
 
     def track_competitor_backlinks(
-        self, competitor_domain: str
+        self,
+        competitor_domain: str,
+        rebuild: bool = False,
+        our_domains: Optional[set[str]] = None,
     ) -> dict[str, Any]:
         """Analyse a competitor's backlink profile and identify gaps.
 
@@ -805,6 +1582,11 @@ class BacklinkBuilder:
         Args:
             competitor_domain: The bare domain of the competitor
                 (e.g. ``"competitornotary.com"``).
+            rebuild: Ignore any cached backlink profile for the
+                competitor and query the APIs again.
+            our_domains: Our referring domains, if the caller has already
+                loaded them.  When given, the database is not touched, so
+                the call is safe to run from a worker thread.
 
         Returns:
             A dictionary with the competitor's backlink summary and a
@@ -813,103 +1595,26 @@ class BacklinkBuilder:
         logger.info(
             "Tracking competitor backlinks for '{}'", competitor_domain
         )
-        competitor_backlinks: list[dict[str, Any]] = []
-
-        # ---- Ahrefs ----------------------------------------------------------
-        if self.ahrefs_api_key:
-            try:
-                resp = requests.get(
-                    "https://apiv2.ahrefs.com",
-                    params={
-                        "token": self.ahrefs_api_key,
-                        "from": "backlinks",
-                        "target": competitor_domain,
-                        "mode": "domain",
-                        "limit": 1000,
-                        "output": "json",
-                    },
-                    timeout=30,
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    for link in data.get("refpages", []):
-                        competitor_backlinks.append({
-                            "source_url": link.get("url_from", ""),
-                            "source_domain": self._get_domain(
-                                link.get("url_from", "")
-                            ),
-                            "anchor_text": link.get("anchor", ""),
-                            "domain_authority": link.get("ahrefs_rank", 0),
-                            "link_type": (
-                                "nofollow"
-                                if link.get("nofollow")
-                                else "dofollow"
-                            ),
-                        })
-            except Exception as exc:
-                logger.error(
-                    "Ahrefs competitor lookup error for {}: {}",
-                    competitor_domain, exc,
-                )
-
-        # ---- SEMrush fallback ------------------------------------------------
-        if not competitor_backlinks and self.semrush_api_key:
-            try:
-                resp = requests.get(
-                    "https://api.semrush.com/analytics/v1/",
-                    params={
-                        "key": self.semrush_api_key,
-                        "type": "backlinks",
-                        "target": competitor_domain,
-                        "target_type": "root_domain",
-                    },
-                    timeout=30,
-                )
-                if resp.status_code == 200:
-                    for line in resp.text.strip().split("\n")[1:]:
-                        parts = line.split("\t")
-                        if parts:
-                            source_url = parts[0]
-                            competitor_backlinks.append({
-                                "source_url": source_url,
-                                "source_domain": self._get_domain(source_url),
-                                "anchor_text": (
-                                    parts[1] if len(parts) > 1 else ""
-                                ),
-                                "domain_authority": self._estimate_domain_authority(
-                                    self._get_domain(source_url)
-                                ),
-                                "link_type": "dofollow",
-                            })
-            except Exception as exc:
-                logger.error(
-                    "SEMrush competitor lookup error for {}: {}",
-                    competitor_domain, exc,
-                )
+        competitor_backlinks = self._fetch_competitor_backlinks(
+            competitor_domain, rebuild=rebuild
+        )
 
         # ---- Gap analysis: competitor domains vs. our domains ----------------
-        our_domains: set[str] = set()
-        try:
-            our_links = (
-                self.session.query(Backlink)
-                .filter(Backlink.is_active.is_(True))
-                .all()
-            )
-            our_domains = {bl.source_domain for bl in our_links if bl.source_domain}
-        except Exception as exc:
-            logger.error("Error loading our backlinks: {}", exc)
-
-        competitor_domains = {
-            bl["source_domain"]
-            for bl in competitor_backlinks
-            if bl.get("source_domain")
-        }
-        gap_domains = competitor_domains - our_domains
-
-        gap_opportunities: list[dict[str, Any]] = [
-            bl for bl in competitor_backlinks
-            if bl.get("source_domain") in gap_domains
-        ]
+        if our_domains is None:
+            our_domains = self._get_our_referring_domains()
+
+        # One pass collects the competitor's domains and the gap links.
+        competitor_domains: set[str] = set()
+        gap_domains: set[str] = set()
+        gap_opportunities: list[dict[str, Any]] = []
+        for bl in competitor_backlinks:
+            domain = bl.get("source_domain")
+            if not domain:
+                continue
+            competitor_domains.add(domain)
+            if domain not in our_domains:
+                gap_domains.add(domain)
+                gap_opportunities.append(bl)
 
         result: dict[str, Any] = {
             "competitor_domain": competitor_domain,
@@ -917,11 +1622,11 @@ class BacklinkBuilder:
             "unique_competitor_domains": len(competitor_domains),
             "our_unique_domains": len(our_domains),
             "gap_count": len(gap_domains),
-            "gap_opportunities": sorted(
+            "gap_opportunities": heapq.nlargest(
+                100,
                 gap_opportunities,
-                key=lambda x: x.get("domain_authority", 0),
-                reverse=True,
-            )[:100],
+                key=lambda x: x.get("domain_authority", 0) or 0,
+            ),
         }
         logger.info(
             "Competitor analysis for '{}': {} backlinks, {} gap opportunities",
@@ -953,206 +1658,20 @@ class BacklinkBuilder:
             "Generating outreach template for type '{}'", opportunity_type
         )
 
-        contact_name_placeholder = "[Contact Name]"
-        org_placeholder = "[Organization Name]"
-        site_placeholder = "[Website/Directory Name]"
-
-        templates: dict[str, str] = {
-            # ---- Directory listing request -----------------------------------
-            "directory_listing": (
-                f"Subject: Request to Add {self.company_name} to "
-                f"{site_placeholder} Directory\n"
-                "\n"
-                f"Dear {contact_name_placeholder},\n"
-                "\n"
-                f"My name is [Your Name] and I am with {self.company_name}, "
-                "a professional notary public and apostille service provider "
-                "serving the Washington DC metro area (DMV) and Southwest "
-                "Virginia.\n"
-                "\n"
-                f"I noticed that {site_placeholder} maintains a directory of "
-                "legal and professional service providers in the region. I "
-                "would love the opportunity to be included so that individuals "
-                "and businesses searching for trusted notary and apostille "
-                "services can find us more easily.\n"
-                "\n"
-                "Here is a brief overview of our services:\n"
-                "  - Apostille & document authentication\n"
-                "  - Mobile notary services (available 7 days a week)\n"
-                "  - Loan signing / real-estate closing notary\n"
-                "  - Embassy legalization assistance\n"
-                "  - Remote online notarization\n"
-                "\n"
-                "Our website is " + self.company_url + " and we maintain an "
-                "A+ rating with the Better Business Bureau.\n"
-                "\n"
-                "Please let me know what information you need to add our "
-                "listing.  I would be happy to provide any additional details.\n"
-                "\n"
-                "Thank you for your time and consideration.\n"
-                "\n"
-                "Best regards,\n"
-                "[Your Name]\n"
-                f"{self.company_name}\n"
-                f"{self.company_url}\n"
-                f"{COMPANY.get('phone', '[Phone]')}\n"
-            ),
-
-            # ---- Guest post pitch --------------------------------------------
-            "guest_post": (
-                f"Subject: Guest Article Contribution for {site_placeholder}\n"
-                "\n"
-                f"Dear {contact_name_placeholder},\n"
-                "\n"
-                f"I am [Your Name], owner of {self.company_name}, a "
-                "professional notary and apostille service based in Virginia.\n"
-                "\n"
-                f"I have been following {site_placeholder} and appreciate the "
-                "valuable content you provide to your audience.  I would love "
-                "to contribute a guest article on a topic relevant to your "
-                "readers.\n"
-                "\n"
-                "Here are a few article ideas I had in mind:\n"
-                "\n"
-                "  1. \"How to Get an Apostille in Virginia: A Step-by-Step "
-                "Guide\"\n"
-                "  2. \"5 Common Mistakes People Make When Getting Documents "
-                "Notarized\"\n"
-                "  3. \"Understanding the Difference Between Notarization and "
-                "Apostille\"\n"
-                "  4. \"What to Expect During a Mobile Notary Appointment\"\n"
-                "  5. \"Remote Online Notarization: What It Is and When You "
-                "Need It\"\n"
-                "\n"
-                "Each article would be original, well-researched, and written "
-                "specifically for your audience.  I am happy to follow your "
-                "editorial guidelines and include only a brief author bio with "
-                "a link to our website.\n"
-                "\n"
-                "Would any of these topics be a good fit?  I look forward to "
-                "hearing from you.\n"
-                "\n"
-                "Best regards,\n"
-                "[Your Name]\n"
-                f"{self.company_name}\n"
-                f"{self.company_url}\n"
-            ),
-
-            # ---- Partnership / cross-promotion -------------------------------
-            "partnership": (
-                f"Subject: Partnership Opportunity Between {self.company_name} "
-                f"and {org_placeholder}\n"
-                "\n"
-                f"Dear {contact_name_placeholder},\n"
-                "\n"
-                f"I am reaching out from {self.company_name}, a trusted notary "
-                "public and apostille service provider serving the DMV area "
-                "and Southwest Virginia.  I believe there is a strong "
-                "opportunity for our businesses to support each other.\n"
-                "\n"
-                "Many of our clients require complementary services such as "
-                "legal counsel, real-estate assistance, immigration support, "
-                "or translation services.  Similarly, your clients may "
-                "occasionally need professional notarization or apostille "
-                "services.\n"
-                "\n"
-                "I would love to explore a referral partnership where we:\n"
-                "  - Feature each other on our respective websites\n"
-                "  - Exchange referrals for overlapping client needs\n"
-                "  - Co-create helpful content for our shared audiences\n"
-                "\n"
-                "Would you be open to a brief call or meeting to discuss how "
-                "we might work together?  I am flexible on timing and happy to "
-                "meet in person if you are in the Northern Virginia or Roanoke "
-                "area.\n"
-                "\n"
-                "Looking forward to connecting.\n"
-                "\n"
-                "Best regards,\n"
-                "[Your Name]\n"
-                f"{self.company_name}\n"
-                f"{self.company_url}\n"
-                f"{COMPANY.get('phone', '[Phone]')}\n"
-            ),
-
-            # ---- Local business networking -----------------------------------
-            "local_networking": (
-                f"Subject: Connecting with {org_placeholder} -- "
-                f"{self.company_name}\n"
-                "\n"
-                f"Dear {contact_name_placeholder},\n"
-                "\n"
-                f"My name is [Your Name] from {self.company_name}.  We are a "
-                "professional notary and apostille service based right here in "
-                "the community, and I am always looking to connect with fellow "
-                "local business owners.\n"
-                "\n"
-                "I came across your business and thought it would be great to "
-                "introduce myself.  We frequently serve clients who also need "
-                "the types of services you offer, and I would welcome the "
-                "opportunity to refer business your way.\n"
-                "\n"
-                "If you are open to it, I would love to:\n"
-                "  - Grab a coffee and learn more about your business\n"
-                "  - Discuss ways we can refer clients to each other\n"
-                "  - Explore co-marketing opportunities such as a joint "
-                "blog post or community event\n"
-                "\n"
-                "Please let me know if you would be interested in connecting.  "
-                "I am available most days and happy to work around your "
-                "schedule.\n"
-                "\n"
-                "Warm regards,\n"
-                "[Your Name]\n"
-                f"{self.company_name}\n"
-                f"{self.company_url}\n"
-                f"{COMPANY.get('phone', '[Phone]')}\n"
-            ),
-
-            # ---- Industry association membership -----------------------------
-            "association_membership": (
-                f"Subject: Membership Inquiry -- {self.company_name}\n"
-                "\n"
-                f"Dear {contact_name_placeholder},\n"
-                "\n"
-                f"I am [Your Name], owner and commissioned notary public at "
-                f"{self.company_name}.  We provide apostille, notarization, "
-                "document authentication, and loan-signing services across "
-                "Virginia, Washington DC, and Maryland.\n"
-                "\n"
-                f"I am interested in becoming a member of {org_placeholder} "
-                "and would like to learn more about the membership benefits, "
-                "application process, and how our business can contribute to "
-                "the association.\n"
-                "\n"
-                "Specifically, I am interested in:\n"
-                "  - Being listed in your member / provider directory\n"
-                "  - Participating in upcoming events or webinars\n"
-                "  - Contributing articles or educational content\n"
-                "  - Networking with other members in the region\n"
-                "\n"
-                "Could you please send me information about membership tiers "
-                "and the application process?  I look forward to joining your "
-                "organisation.\n"
-                "\n"
-                "Thank you,\n"
-                "[Your Name]\n"
-                f"{self.company_name}\n"
-                f"{self.company_url}\n"
-                f"{COMPANY.get('phone', '[Phone]')}\n"
-            ),
-        }
-
-        template = templates.get(opportunity_type)
+        template = _OUTREACH_TEMPLATES.get(opportunity_type)
         if template is None:
-            valid_types = ", ".join(sorted(templates.keys()))
+            valid_types = ", ".join(sorted(_OUTREACH_TEMPLATES))
             raise ValueError(
                 f"Unknown opportunity_type '{opportunity_type}'. "
                 f"Valid types: {valid_types}"
             )
 
         logger.info("Outreach template generated for '{}'", opportunity_type)
-        return template
+        return template.substitute(
+            company_name=self.company_name,
+            company_url=self.company_url,
+            phone=COMPANY.get("phone", "[Phone]"),
+        )
 
     # ------------------------------------------------------------------
     # 5. Detect toxic backlinks
@@ -1178,91 +1697,101 @@ class BacklinkBuilder:
         toxic_links: list[dict[str, Any]] = []
 
         try:
-            backlinks = (
-                self.session.query(Backlink)
-                .filter(Backlink.is_active.is_(True))
-                .all()
+            df = pd.read_sql(
+                select(
+                    Backlink.id,
+                    Backlink.source_url,
+                    Backlink.source_domain,
+                    Backlink.anchor_text,
+                    Backlink.domain_authority,
+                    Backlink.toxicity_score,
+                    Backlink.is_toxic,
+                ).where(Backlink.is_active.is_(True)),
+                self.session.connection(),
             )
         except Exception as exc:
             logger.error("Error loading backlinks for toxicity scan: {}", exc)
             return toxic_links
 
-        commercial_anchors = {
-            "click here", "buy now", "cheap", "best price",
-            "order now", "free", "discount", "deal",
-        }
+        # Every check is evaluated column-wise over the whole profile.
+        da = df["domain_authority"].fillna(0).astype(int)
+        domain = df["source_domain"].fillna("")
+        anchor = df["anchor_text"].fillna("").str.lower().str.strip()
+
+        is_spam = domain.map(_matches_spam_pattern).astype(bool)
+        bad_tld = domain.str.extract(_SUSPICIOUS_TLD_RE, expand=False)
+        is_commercial = anchor.isin(COMMERCIAL_ANCHORS)
+        relevance = self._calculate_relevance_scores((domain + " " + anchor).tolist())
+        irrelevant = (domain != "") & ~is_spam & (relevance == 0)
+        domain_len = domain.str.len()
+        digit_count = domain_len - domain.str.translate(_DIGIT_DEL).str.len()
+        many_digits = (digit_count / domain_len.clip(lower=1)) > 0.3
+
+        scores = pd.Series(
+            _toxicity_scores(
+                da.to_numpy(np.int64),
+                is_spam.to_numpy(np.int64),
+                bad_tld.notna().to_numpy(np.int64),
+                is_commercial.to_numpy(np.int64),
+                irrelevant.to_numpy(np.int64),
+                many_digits.to_numpy(np.int64),
+            ),
+            index=df.index,
+        )
+        is_toxic = scores >= 60
 
-        for bl in backlinks:
-            toxicity_score: float = 0.0
+        # ---- Explain only the flagged links ----------------------------------
+        flagged = df[is_toxic].astype(object).where(df.notna(), None)
+        for idx in flagged.index:
             reasons: list[str] = []
-
-            # ---- Low domain authority ----------------------------------------
-            da = bl.domain_authority or 0
-            if da < 5:
-                toxicity_score += 30
-                reasons.append(f"Very low domain authority ({da})")
-            elif da < 10:
-                toxicity_score += 20
-                reasons.append(f"Low domain authority ({da})")
-            elif da < 15:
-                toxicity_score += 10
-                reasons.append(f"Below-average domain authority ({da})")
-
-            # ---- Spam domain pattern -----------------------------------------
-            domain = bl.source_domain or ""
-            if self._is_spam_domain(domain):
-                toxicity_score += 35
+            link_da = da[idx]
+            if link_da < 5:
+                reasons.append(f"Very low domain authority ({link_da})")
+            elif link_da < 10:
+                reasons.append(f"Low domain authority ({link_da})")
+            elif link_da < 15:
+                reasons.append(f"Below-average domain authority ({link_da})")
+            if is_spam[idx]:
                 reasons.append("Domain matches spam pattern")
-
-            # ---- Suspicious TLD ----------------------------------------------
-            suspicious_tlds = {
-                ".xyz", ".top", ".pw", ".cc", ".tk", ".ga",
-                ".cf", ".gq", ".ml", ".buzz", ".click",
-            }
-            for tld in suspicious_tlds:
-                if domain.endswith(tld):
-                    toxicity_score += 15
-                    reasons.append(f"Suspicious TLD ({tld})")
-                    break
-
-            # ---- Over-optimised anchor text ----------------------------------
-            anchor = (bl.anchor_text or "").lower().strip()
-            if anchor in commercial_anchors:
-                toxicity_score += 20
-                reasons.append(f"Commercial / spammy anchor text: '{anchor}'")
-
-            # ---- Irrelevant niche (requires page content check) --------------
-            if domain and not self._is_spam_domain(domain):
-                relevance = self._calculate_relevance_score(domain + " " + anchor)
-                if relevance == 0.0:
-                    toxicity_score += 10
-                    reasons.append("No topical relevance detected in domain/anchor")
-
-            # ---- Excessive numbers in domain (e.g. abc123xyz789.com) ---------
-            digit_ratio = sum(c.isdigit() for c in domain) / max(len(domain), 1)
-            if digit_ratio > 0.3:
-                toxicity_score += 15
+            if pd.notna(bad_tld[idx]):
+                reasons.append(f"Suspicious TLD ({bad_tld[idx]})")
+            if is_commercial[idx]:
+                reasons.append(
+                    f"Commercial / spammy anchor text: '{anchor[idx]}'"
+                )
+            if irrelevant[idx]:
+                reasons.append("No topical relevance detected in domain/anchor")
+            if many_digits[idx]:
                 reasons.append("High digit ratio in domain name")
 
-            # ---- Flag and persist --------------------------------------------
-            toxicity_score = min(toxicity_score, 100.0)
-            is_toxic = toxicity_score >= 60
-
-            bl.toxicity_score = toxicity_score
-            bl.is_toxic = is_toxic
-
-            if is_toxic:
-                toxic_links.append({
-                    "id": bl.id,
-                    "source_url": bl.source_url,
-                    "source_domain": bl.source_domain,
-                    "anchor_text": bl.anchor_text,
-                    "domain_authority": bl.domain_authority,
-                    "toxicity_score": toxicity_score,
-                    "reasons": reasons,
-                })
+            raw_da = flagged.at[idx, "domain_authority"]
+            toxic_links.append({
+                "id": int(flagged.at[idx, "id"]),
+                "source_url": flagged.at[idx, "source_url"],
+                "source_domain": flagged.at[idx, "source_domain"],
+                "anchor_text": flagged.at[idx, "anchor_text"],
+                "domain_authority": None if raw_da is None else int(raw_da),
+                "toxicity_score": float(scores[idx]),
+                "reasons": reasons,
+            })
 
+        # ---- Persist changed scores with bulk UPDATEs ------------------------
+        # Only rows whose score or flag moved are written; a re-scan of an
+        # unchanged profile issues no UPDATEs at all.
+        changed = (df["toxicity_score"] != scores) | (
+            df["is_toxic"].fillna(False).astype(bool) != is_toxic
+        )
+        updates = [
+            {"id": int(row_id), "toxicity_score": float(score), "is_toxic": bool(flag)}
+            for row_id, score, flag in zip(
+                df["id"][changed], scores[changed], is_toxic[changed]
+            )
+        ]
         try:
+            for start in range(0, len(updates), _BULK_UPDATE_CHUNK):
+                self.session.execute(
+                    update(Backlink), updates[start:start + _BULK_UPDATE_CHUNK]
+                )
             self.session.commit()
         except Exception as exc:
             self.session.rollback()
@@ -1271,7 +1800,7 @@ class BacklinkBuilder:
         logger.info(
             "Toxic backlink scan complete: {} toxic out of {} total",
             len(toxic_links),
-            len(backlinks),
+            len(df),
         )
         return toxic_links
 
@@ -1300,97 +1829,152 @@ class BacklinkBuilder:
         days = period_days.get(period, 30)
         cutoff_date = datetime.date.today() - datetime.timedelta(days=days)
 
+        is_active = Backlink.is_active.is_(True)
+        is_new = and_(is_active, Backlink.first_seen >= cutoff_date)
+        is_lost = and_(
+            or_(Backlink.is_active.is_(False), Backlink.is_active.is_(None)),
+            Backlink.last_checked >= cutoff_date,
+        )
+        is_toxic = and_(is_active, Backlink.is_toxic.is_(True))
+
         try:
-            all_backlinks = self.session.query(Backlink).all()
+            # ---- Summary counts, aggregated in the database ------------------
+            summary = self.session.execute(
+                select(
+                    func.count(case((is_active, 1))).label("active"),
+                    func.count(case((is_new, 1))).label("new"),
+                    func.count(case((is_lost, 1))).label("lost"),
+                    func.count(case((is_toxic, 1))).label("toxic"),
+                    func.count(
+                        case((
+                            and_(
+                                is_active,
+                                func.lower(Backlink.link_type) == "dofollow",
+                            ),
+                            1,
+                        ))
+                    ).label("dofollow"),
+                    func.count(
+                        distinct(
+                            case((
+                                and_(is_active, Backlink.source_domain != ""),
+                                Backlink.source_domain,
+                            ))
+                        )
+                    ).label("referring_domains"),
+                )
+            ).one()
+
+            # Detail rows keep the previous in-Python order: insertion (id)
+            # order, new links by DA descending with ties in id order.  An
+            # explicit ORDER BY stops it following the query plan.
+            new_links = self.session.execute(
+                select(
+                    Backlink.source_url,
+                    Backlink.source_domain,
+                    Backlink.anchor_text,
+                    Backlink.domain_authority,
+                    Backlink.first_seen,
+                )
+                .where(is_new)
+                .order_by(
+                    func.coalesce(Backlink.domain_authority, 0).desc(), Backlink.id
+                )
+            ).all()
+            lost_links = self.session.execute(
+                select(
+                    Backlink.source_url,
+                    Backlink.source_domain,
+                    Backlink.last_checked,
+                )
+                .where(is_lost)
+                .order_by(Backlink.id)
+            ).all()
+            toxic_links = self.session.execute(
+                select(
+                    Backlink.source_url,
+                    Backlink.source_domain,
+                    Backlink.toxicity_score,
+                )
+                .where(is_toxic)
+                .order_by(Backlink.id)
+            ).all()
+
+            # ---- DA and anchor distributions, streamed -----------------------
+            # Only the active rows' DA and anchor feed the distributions; they
+            # are consumed in fixed-size partitions so memory stays bounded by
+            # the batch size rather than the profile size.  DA is kept as a
+            # count per distinct value, enough for the mean, median and range.
+            bucket_counts = np.zeros(len(_DA_BUCKET_LABELS), dtype=np.int64)
+            da_counts: Counter[int] = Counter()
+            anchor_counter: Counter[str] = Counter()
+            active_links = self.session.execute(
+                select(Backlink.domain_authority, Backlink.anchor_text)
+                .where(is_active)
+                .order_by(Backlink.id)  # most_common breaks ties by first seen
+                .execution_options(yield_per=_REPORT_PARTITION_SIZE)
+            )
+            for partition in active_links.partitions():
+                da_chunk = np.fromiter(
+                    (bl.domain_authority or 0 for bl in partition),
+                    dtype=np.int64,
+                    count=len(partition),
+                )
+                # Buckets close on 10, 20, ...; ``(da - 1) // 10`` maps 0-10
+                # to 0, 11-20 to 1, etc.  Out-of-range values fall into the
+                # end buckets.
+                bucket_counts += np.bincount(
+                    np.clip((da_chunk - 1) // 10, 0, len(_DA_BUCKET_LABELS) - 1),
+                    minlength=len(_DA_BUCKET_LABELS),
+                )
+                values, counts = np.unique(da_chunk, return_counts=True)
+                da_counts.update(dict(zip(values.tolist(), counts.tolist())))
+
+                anchor_counter.update(
+                    (bl.anchor_text or "").strip().lower() or "[no anchor / image]"
+                    for bl in partition
+                )
         except Exception as exc:
             logger.error("Error loading backlinks for report: {}", exc)
             return {"error": str(exc)}
 
-        active_links = [bl for bl in all_backlinks if bl.is_active]
-        new_links = [
-            bl for bl in active_links
-            if bl.first_seen and bl.first_seen >= cutoff_date
-        ]
-        lost_links = [
-            bl for bl in all_backlinks
-            if not bl.is_active
-            and bl.last_checked
-            and bl.last_checked >= cutoff_date
-        ]
-        toxic_links = [bl for bl in active_links if bl.is_toxic]
-
-        # ---- Domain-authority distribution -----------------------------------
-        da_buckets: dict[str, int] = {
-            "0-10": 0, "11-20": 0, "21-30": 0, "31-40": 0,
-            "41-50": 0, "51-60": 0, "61-70": 0, "71-80": 0,
-            "81-90": 0, "91-100": 0,
-        }
-        da_values: list[int] = []
-        for bl in active_links:
-            da = bl.domain_authority or 0
-            da_values.append(da)
-            if da <= 10:
-                da_buckets["0-10"] += 1
-            elif da <= 20:
-                da_buckets["11-20"] += 1
-            elif da <= 30:
-                da_buckets["21-30"] += 1
-            elif da <= 40:
-                da_buckets["31-40"] += 1
-            elif da <= 50:
-                da_buckets["41-50"] += 1
-            elif da <= 60:
-                da_buckets["51-60"] += 1
-            elif da <= 70:
-                da_buckets["61-70"] += 1
-            elif da <= 80:
-                da_buckets["71-80"] += 1
-            elif da <= 90:
-                da_buckets["81-90"] += 1
-            else:
-                da_buckets["91-100"] += 1
-
-        avg_da = round(statistics.mean(da_values), 1) if da_values else 0.0
-        median_da = round(statistics.median(da_values), 1) if da_values else 0.0
-
-        # ---- Anchor-text distribution ----------------------------------------
-        anchor_counter: Counter[str] = Counter()
-        for bl in active_links:
-            anchor = (bl.anchor_text or "").strip()
-            if anchor:
-                anchor_counter[anchor.lower()] += 1
-            else:
-                anchor_counter["[no anchor / image]"] += 1
-
-        # ---- Link-type distribution ------------------------------------------
-        dofollow_count = sum(
-            1 for bl in active_links if (bl.link_type or "").lower() == "dofollow"
+        da_buckets: dict[str, int] = dict(
+            zip(_DA_BUCKET_LABELS, bucket_counts.tolist())
         )
-        nofollow_count = len(active_links) - dofollow_count
-
-        # ---- Unique referring domains ----------------------------------------
-        referring_domains: set[str] = {
-            bl.source_domain for bl in active_links if bl.source_domain
-        }
+        if da_counts:
+            da_values = np.array(sorted(da_counts), dtype=np.int64)
+            da_weights = np.array([da_counts[v] for v in da_values], dtype=np.int64)
+            n = int(da_weights.sum())
+            avg_da = round(float((da_values * da_weights).sum()) / n, 1)
+            # The k-th smallest DA is the first value whose running count
+            # exceeds k; the median averages the two middle ones.
+            running = np.cumsum(da_weights)
+            lower = da_values[np.searchsorted(running, (n - 1) // 2, side="right")]
+            upper = da_values[np.searchsorted(running, n // 2, side="right")]
+            median_da = round((int(lower) + int(upper)) / 2, 1)
+            min_da, max_da = int(da_values[0]), int(da_values[-1])
+        else:
+            avg_da = median_da = 0.0
+            min_da = max_da = 0
 
         report: dict[str, Any] = {
             "period": period,
             "generated_at": datetime.datetime.now().isoformat(),
             "summary": {
-                "total_active_backlinks": len(active_links),
-                "unique_referring_domains": len(referring_domains),
-                "new_backlinks": len(new_links),
-                "lost_backlinks": len(lost_links),
-                "toxic_backlinks": len(toxic_links),
-                "dofollow_links": dofollow_count,
-                "nofollow_links": nofollow_count,
+                "total_active_backlinks": summary.active,
+                "unique_referring_domains": summary.referring_domains,
+                "new_backlinks": summary.new,
+                "lost_backlinks": summary.lost,
+                "toxic_backlinks": summary.toxic,
+                "dofollow_links": summary.dofollow,
+                "nofollow_links": summary.active - summary.dofollow,
             },
             "domain_authority_distribution": da_buckets,
             "domain_authority_stats": {
                 "average": avg_da,
                 "median": median_da,
-                "min": min(da_values) if da_values else 0,
-                "max": max(da_values) if da_values else 0,
+                "min": min_da,
+                "max": max_da,
             },
             "top_anchors": anchor_counter.most_common(20),
             "new_backlinks_detail": [
@@ -1401,11 +1985,7 @@ class BacklinkBuilder:
                     "domain_authority": bl.domain_authority,
                     "first_seen": bl.first_seen.isoformat() if bl.first_seen else None,
                 }
-                for bl in sorted(
-                    new_links,
-                    key=lambda b: b.domain_authority or 0,
-                    reverse=True,
-                )
+                for bl in new_links
             ],
             "lost_backlinks_detail": [
                 {
@@ -1454,75 +2034,122 @@ class BacklinkBuilder:
             A dictionary with the overall score, component scores, and a
             human-readable recommendation.
         """
-        logger.info("Calculating link score for '{}'", url)
-        domain = self._get_domain(url)
+        return self.calculate_link_scores([url])[0]
+
+    def calculate_link_scores(self, urls: list[str]) -> list[dict[str, Any]]:
+        """Score many potential backlink opportunities at once.
+
+        Batch form of :meth:`calculate_link_score`: domain authorities are
+        resolved together, pages are fetched concurrently, and the
+        component scores are combined as NumPy arrays.
+
+        Args:
+            urls: The URLs of the potential linking pages.
+
+        Returns:
+            One result dictionary per URL, in input order, shaped as
+            returned by :meth:`calculate_link_score`.
+        """
+        logger.info("Calculating link scores for {} URL(s)", len(urls))
+        if not urls:
+            return []
+        domains = [self._get_domain(url) for url in urls]
 
         # ---- Component 1: Domain authority (0--100) --------------------------
-        da = self._estimate_domain_authority(domain)
-        da_score = min(da, 100)
+        da_map = self._estimate_domain_authorities(domains)
+        da_scores = np.minimum(
+            np.fromiter(
+                (da_map[d] for d in domains), dtype=np.int64, count=len(domains)
+            ),
+            100,
+        )
 
         # ---- Component 2: Relevance (0--100) ---------------------------------
-        page_text = ""
-        response = self._safe_request(url, timeout=15)
-        if response:
-            try:
-                soup = BeautifulSoup(response.text, "html.parser")
-                page_text = soup.get_text(separator=" ", strip=True)[:5000]
-            except Exception:
-                pass
-        relevance_raw = self._calculate_relevance_score(page_text or domain)
-        relevance_score = round(relevance_raw * 100, 1)
+        if len(urls) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(_SCRAPE_CONCURRENCY, len(urls))
+            ) as pool:
+                page_texts = list(pool.map(self._fetch_page_text, urls))
+        else:
+            page_texts = [self._fetch_page_text(urls[0])]
+        relevance_raw = self._calculate_relevance_scores(
+            [text or domain for text, domain in zip(page_texts, domains)]
+        )
+        relevance_scores = np.round(relevance_raw * 100, 1)
 
         # ---- Component 3: Link-type expectation (0 or 100) -------------------
         # Directories and associations are likely dofollow; social sites are not.
-        nofollow_likely_domains = {
-            "facebook.com", "twitter.com", "x.com", "instagram.com",
-            "linkedin.com", "reddit.com", "quora.com", "pinterest.com",
-            "youtube.com", "tiktok.com", "medium.com", "wikipedia.org",
-        }
-        link_type_score: float = 0.0 if domain in nofollow_likely_domains else 100.0
+        link_type_scores = np.fromiter(
+            (
+                0.0 if d in NOFOLLOW_LIKELY_DOMAINS or d.endswith(_NOFOLLOW_SUFFIXES)
+                else 100.0
+                for d in domains
+            ),
+            dtype=np.float64,
+            count=len(domains),
+        )
 
         # ---- Component 4: Trust TLD (0--100) ---------------------------------
-        trusted_tlds = {".gov", ".edu", ".org", ".com", ".net", ".us"}
-        tld = "." + domain.split(".")[-1] if "." in domain else ""
-        tld_score: float = 100.0 if tld in trusted_tlds else 40.0
+        tlds = ["." + d.rpartition(".")[2] if "." in d else "" for d in domains]
+        tld_scores = np.where(np.isin(tlds, list(TRUSTED_TLDS)), 100.0, 40.0)
 
         # ---- Composite score -------------------------------------------------
-        overall = round(
-            da_score * 0.40
-            + relevance_score * 0.35
-            + link_type_score * 0.15
-            + tld_score * 0.10,
+        overall_scores = np.round(
+            _link_composite(
+                da_scores.astype(np.float64),
+                relevance_scores,
+                link_type_scores,
+                tld_scores,
+            ),
             1,
         )
 
-        # ---- Recommendation --------------------------------------------------
-        if overall >= 75:
-            recommendation = "Excellent opportunity -- pursue immediately."
-        elif overall >= 50:
-            recommendation = "Good opportunity -- worth pursuing."
-        elif overall >= 30:
-            recommendation = "Moderate opportunity -- pursue if low effort."
-        else:
-            recommendation = "Low-value opportunity -- skip unless strategic."
-
-        result: dict[str, Any] = {
-            "url": url,
-            "domain": domain,
-            "overall_score": overall,
-            "components": {
-                "domain_authority": {"score": da_score, "weight": "40%"},
-                "relevance": {"score": relevance_score, "weight": "35%"},
-                "link_type": {"score": link_type_score, "weight": "15%"},
-                "tld_trust": {"score": tld_score, "weight": "10%"},
-            },
-            "recommendation": recommendation,
-        }
+        results: list[dict[str, Any]] = []
+        for i, (url, domain) in enumerate(zip(urls, domains)):
+            overall = float(overall_scores[i])
+            # ---- Recommendation ----------------------------------------------
+            if overall >= 75:
+                recommendation = "Excellent opportunity -- pursue immediately."
+            elif overall >= 50:
+                recommendation = "Good opportunity -- worth pursuing."
+            elif overall >= 30:
+                recommendation = "Moderate opportunity -- pursue if low effort."
+            else:
+                recommendation = "Low-value opportunity -- skip unless strategic."
+
+            results.append({
+                "url": url,
+                "domain": domain,
+                "overall_score": overall,
+                "components": {
+                    "domain_authority": {
+                        "score": int(da_scores[i]), "weight": "40%",
+                    },
+                    "relevance": {
+                        "score": float(relevance_scores[i]), "weight": "35%",
+                    },
+                    "link_type": {
+                        "score": float(link_type_scores[i]), "weight": "15%",
+                    },
+                    "tld_trust": {"score": float(tld_scores[i]), "weight": "10%"},
+                },
+                "recommendation": recommendation,
+            })
+            logger.info(
+                "Link score for '{}': {} ({})", url, overall, recommendation
+            )
+        return results
 
-        logger.info(
-            "Link score for '{}': {} ({})", url, overall, recommendation
-        )
-        return result
+    def _fetch_page_text(self, url: str) -> str:
+        """Return up to 5000 characters of visible text from *url*."""
+        response = self._safe_request(url, timeout=15, stream=True)
+        if response:
+            try:
+                html = read_capped(response, _PAGE_BYTE_CAP)
+                return _bounded_text(BeautifulSoup(html, "lxml"), 5000)
+            except Exception:
+                pass
+        return ""
 
     # ------------------------------------------------------------------
     # 8. Backlink gap analysis
@@ -1551,17 +2178,23 @@ class BacklinkBuilder:
             len(competitors),
         )
 
-        # Our referring domains
-        our_domains: set[str] = set()
-        try:
-            our_links = (
-                self.session.query(Backlink)
-                .filter(Backlink.is_active.is_(True))
-                .all()
-            )
-            our_domains = {bl.source_domain for bl in our_links if bl.source_domain}
-        except Exception as exc:
-            logger.error("Error loading our backlinks for gap analysis: {}", exc)
+        # Our referring domains, loaded once on this thread and shared with
+        # the competitor workers, which therefore never touch the session.
+        our_domains = self._get_our_referring_domains()
+
+        # Competitor profiles are fetched concurrently; each is dominated by
+        # blocking API round-trips.
+        comp_results: list[dict[str, Any]] = []
+        if competitors:
+            with ThreadPoolExecutor(
+                max_workers=min(_COMPETITOR_CONCURRENCY, len(competitors))
+            ) as pool:
+                comp_results = list(pool.map(
+                    lambda domain: self.track_competitor_backlinks(
+                        domain, our_domains=our_domains
+                    ),
+                    competitors,
+                ))
 
         # Per-competitor analysis
         competitor_results: dict[str, dict[str, Any]] = {}
@@ -1570,19 +2203,20 @@ class BacklinkBuilder:
         # Stores detailed info per gap domain
         gap_domain_details: dict[str, dict[str, Any]] = {}
 
-        for comp_domain in competitors:
-            comp_data = self.track_competitor_backlinks(comp_domain)
-            comp_domains: set[str] = set()
+        for comp_domain, comp_data in zip(competitors, comp_results):
+            # Insertion-ordered set, so tie order in the final ranking is stable.
+            comp_domains: dict[str, None] = {}
             for opp in comp_data.get("gap_opportunities", []):
                 sd = opp.get("source_domain", "")
                 if sd:
-                    comp_domains.add(sd)
-                    gap_domain_counts[sd] += 1
+                    comp_domains[sd] = None
                     # Keep the highest DA record per gap domain
                     if sd not in gap_domain_details or opp.get(
                         "domain_authority", 0
                     ) > gap_domain_details[sd].get("domain_authority", 0):
                         gap_domain_details[sd] = opp
+            # Each competitor counts once per gap domain it links from.
+            gap_domain_counts.update(comp_domains.keys())
 
             competitor_results[comp_domain] = {
                 "total_backlinks": comp_data.get("total_competitor_backlinks", 0),
@@ -1591,34 +2225,41 @@ class BacklinkBuilder:
             }
 
         # Consolidated gap list, scored by how many competitors share it and DA
-        consolidated_gaps: list[dict[str, Any]] = []
-        for domain, count in gap_domain_counts.most_common():
+        # Gaps are held as compact tuples; only the returned top 100 are
+        # expanded into dictionaries.
+        consolidated_gaps: list[GapDomain] = []
+        for domain, count in gap_domain_counts.items():
             detail = gap_domain_details.get(domain, {})
-            consolidated_gaps.append({
-                "source_domain": domain,
-                "competitors_linking": count,
-                "domain_authority": detail.get("domain_authority", 0),
-                "source_url": detail.get("source_url", ""),
-                "anchor_text": detail.get("anchor_text", ""),
-                "priority": (
-                    "high" if count >= 2 and detail.get("domain_authority", 0) >= 40
-                    else "medium" if count >= 2 or detail.get("domain_authority", 0) >= 40
+            da = detail.get("domain_authority", 0)
+            shared = count >= 2
+            strong = da >= 40
+            consolidated_gaps.append(GapDomain(
+                source_domain=domain,
+                competitors_linking=count,
+                domain_authority=da,
+                source_url=detail.get("source_url", ""),
+                anchor_text=detail.get("anchor_text", ""),
+                priority=(
+                    "high" if shared and strong
+                    else "medium" if shared or strong
                     else "low"
                 ),
-            })
-
-        # Sort: most shared first, then by DA
-        consolidated_gaps.sort(
-            key=lambda g: (g["competitors_linking"], g["domain_authority"]),
-            reverse=True,
-        )
+            ))
 
         result: dict[str, Any] = {
             "our_referring_domains": len(our_domains),
             "competitors_analyzed": len(competitors),
             "per_competitor": competitor_results,
             "total_gap_domains": len(consolidated_gaps),
-            "gap_opportunities": consolidated_gaps[:100],
+            # Top 100: most shared first, then by DA
+            "gap_opportunities": [
+                gap._asdict()
+                for gap in heapq.nlargest(
+                    100,
+                    consolidated_gaps,
+                    key=attrgetter("competitors_linking", "domain_authority"),
+                )
+            ],
         }
 
         logger.info(
@@ -1633,7 +2274,8 @@ class BacklinkBuilder:
     # ------------------------------------------------------------------
 
     def close(self) -> None:
-        """Close the database session."""
+        """Close the database session and the pooled HTTP session."""
+        self.http.close()
         try:
             self.session.close()
             logger.info("BacklinkBuilder database session closed")
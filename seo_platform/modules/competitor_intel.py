@@ -10,18 +10,29 @@ intelligence reports with prioritized action items.
 
 from __future__ import annotations
 
+import copy
 import datetime
 import hashlib
 import re
+import threading
 import time
-from collections import defaultdict
-from typing import Any, Dict, List, Optional, Tuple
+from collections import Counter, defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
+import ahocorasick
+import lxml.etree
+import lxml.html
 import requests
 from bs4 import BeautifulSoup
+from cachetools import TTLCache, cached
 from loguru import logger
-from sqlalchemy import desc, func
+from requests.adapters import HTTPAdapter
+from sqlalchemy import and_, desc, func, insert, select
+from sqlalchemy.orm import aliased
+from tenacity import stop_after_attempt
+from urllib3.util.retry import Retry
 
 from config.settings import (
     COMPANY,
@@ -39,9 +50,21 @@ from database.models import (
     KeywordRanking,
     Keyword,
     Alert,
-    SessionLocal,
+    engine,
+    has_unique_competitor_domain,
+    session_scope,
 )
-from utils.helpers import extract_domain, fetch_url, normalize_url
+from utils.helpers import extract_domain, fetch_url, normalize_url, read_capped
+
+# INSERT ... ON CONFLICT DO NOTHING is available on PostgreSQL and SQLite;
+# other backends, and tables still missing the unique domain index, fall
+# back to checking for existing rows first.
+if engine.dialect.name == "postgresql":
+    from sqlalchemy.dialects.postgresql import insert as _conflict_insert
+elif engine.dialect.name == "sqlite":
+    from sqlalchemy.dialects.sqlite import insert as _conflict_insert
+else:
+    _conflict_insert = None
 
 
 # ---------------------------------------------------------------------------
@@ -83,6 +106,168 @@ _SEARCH_QUERIES_BY_TYPE: Dict[str, List[str]] = {
 
 _OUR_DOMAIN: str = extract_domain(COMPANY["website"])
 
+# Major platforms and directories that show up in SERPs but are not
+# competitors.
+_SKIP_DOMAINS: frozenset[str] = frozenset({
+    "google.com", "yelp.com", "facebook.com", "bbb.org",
+    "yellowpages.com", "mapquest.com", "thumbtack.com",
+    "angi.com", "homeadvisor.com", "nextdoor.com",
+    "linkedin.com", "twitter.com", "instagram.com",
+    "youtube.com", "wikipedia.org", "reddit.com",
+})
+
+# Largest body read from a competitor page.  Kept above the 3000 KB
+# "large page" threshold in _assess_technical_quality so that check still
+# fires.
+_PAGE_BYTE_CAP: int = 4 * 1_048_576
+
+# Maximum Custom Search API requests in flight at once.
+_SEARCH_CONCURRENCY: int = 5
+
+# SERP scraping is throttled by one token bucket shared by every thread:
+# sustained requests per second and burst size.
+_SCRAPE_RATE: float = 1.0
+_SCRAPE_BURST: int = 3
+
+# Worker threads used to fetch the independent dimensions of one
+# competitor analysis.
+_ANALYSIS_CONCURRENCY: int = 7
+
+# Pages fetched in parallel while crawling one competitor site.
+_CRAWL_CONCURRENCY: int = 4
+
+# Keyword variants combined into one boolean-OR discovery query.  Keeps each
+# query well inside Google's query-length limits.
+_OR_QUERY_CHUNK: int = 8
+
+# Google SERP parsing: compiled once, evaluated directly on the lxml tree.
+# ``_has_class`` matches a whole class token, as a CSS ``.cls`` selector does.
+def _has_class(cls: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+
+
+_SERP_RESULT_XPATH = lxml.etree.XPath(
+    f"//div[{_has_class('tF2Cxc')} or {_has_class('g')}]"
+)
+_SERP_LINK_XPATH = lxml.etree.XPath("(.//a[@href])[1]/@href")
+_SERP_TITLE_XPATH = lxml.etree.XPath("(.//h3)[1]")
+_SERP_SNIPPET_XPATH = lxml.etree.XPath(
+    f"(.//div[{_has_class('VwiC3b')}] | .//span[{_has_class('aCOpRe')}])[1]"
+)
+_TEXT_NODES_XPATH = lxml.etree.XPath(".//text()")
+
+# Crawled-page extraction, mirroring what BeautifulSoup's ``soup.title``,
+# ``find_all(["h1", "h2", "h3"])``, ``find_all("a", href=True)`` and
+# ``get_text()`` (which skips script/style/template text) returned.
+_PAGE_TITLE_XPATH = lxml.etree.XPath("(//title)[1]")
+_PAGE_HEADINGS_XPATH = lxml.etree.XPath("//h1 | //h2 | //h3")
+_PAGE_HREFS_XPATH = lxml.etree.XPath("//a/@href")
+_PAGE_TEXT_XPATH = lxml.etree.XPath(
+    "//text()[not(parent::script or parent::style or parent::template)]"
+)
+_GOOGLE_REDIRECT_RE = re.compile(r"^/url\?q=([^&]*)")
+
+# Service names recognised on competitor sites, and an Aho-Corasick
+# automaton over them so a page is scanned once rather than once per name.
+_SERVICE_KEYWORDS: Tuple[str, ...] = (
+    "notary", "apostille", "mobile notary", "loan signing",
+    "real estate closing", "power of attorney", "document authentication",
+    "embassy legalization", "remote online notarization",
+    "certified translation", "foreign document", "hospital notary",
+)
+_SERVICE_AC = ahocorasick.Automaton()
+for _svc in _SERVICE_KEYWORDS:
+    _SERVICE_AC.add_word(_svc, _svc)
+_SERVICE_AC.make_automaton()
+
+# Page-type hints for _classify_single_page, in precedence order (lower rank
+# wins), compiled into one automaton for URLs and one for titles so each
+# string is scanned once instead of once per keyword.
+_URL_PAGE_TYPE_HINTS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("blog", ("/blog", "/post", "/article", "/news")),
+    ("service", ("/service", "/notary", "/apostille", "/pricing")),
+    ("landing_page", (
+        "/location", "/area", "/city", "/county", "near-me", "near_me",
+    )),
+)
+_TITLE_PAGE_TYPE_HINTS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("blog", ("blog", "article", "news", "post")),
+    ("service", ("service", "notary", "apostille", "pricing", "cost")),
+)
+
+
+def _page_type_automaton(
+    hints: Tuple[Tuple[str, Tuple[str, ...]], ...]
+) -> ahocorasick.Automaton:
+    automaton = ahocorasick.Automaton()
+    for rank, (page_type, keywords) in enumerate(hints):
+        for kw in keywords:
+            # First (highest-precedence) group wins for a shared keyword
+            if kw not in automaton:
+                automaton.add_word(kw, (rank, page_type))
+    automaton.make_automaton()
+    return automaton
+
+
+_URL_PAGE_TYPE_AC = _page_type_automaton(_URL_PAGE_TYPE_HINTS)
+_TITLE_PAGE_TYPE_AC = _page_type_automaton(_TITLE_PAGE_TYPE_HINTS)
+
+# Shared keep-alive session for every outbound request in this module, so
+# repeated calls to the same host reuse pooled connections instead of paying
+# a TCP + TLS handshake each time.  Throttling (429) and transient server
+# errors are retried with exponential backoff, honouring Retry-After; the
+# last response is handed back so callers' raise_for_status() still applies.
+_HTTP = requests.Session()
+_HTTP.headers.update({"User-Agent": _USER_AGENT, "Connection": "keep-alive"})
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False,
+    ),
+)
+_HTTP.mount("https://", _HTTP_ADAPTER)
+_HTTP.mount("http://", _HTTP_ADAPTER)
+
+# fetch_url's own tenacity retries would stack on top of the adapter's
+# (up to 12 GETs per throttled URL, bypassing the scrape token bucket), so
+# this module calls it with a single attempt and leaves retrying to _HTTP.
+_fetch_url_once = fetch_url.retry_with(stop=stop_after_attempt(1), reraise=True)
+
+
+class _TokenBucket:
+    """Thread-safe token-bucket rate limiter.
+
+    ``acquire`` reserves a token and sleeps until it is due, so concurrent
+    callers are spaced out to *rate* per second after an initial burst of
+    *capacity*.
+    """
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+
+_SCRAPE_LIMITER = _TokenBucket(_SCRAPE_RATE, _SCRAPE_BURST)
+
 
 # ---------------------------------------------------------------------------
 # Helpers (module-private)
@@ -94,21 +279,165 @@ def _area_label(area: Dict[str, str]) -> str:
     return f"{area.get('city', 'Unknown')}, {area.get('state', '')}"
 
 
+def _ranked_analyses():
+    """Return a subquery of all analyses with a per-competitor recency rank.
+
+    The ``rn`` column is 1 for a competitor's latest snapshot, 2 for the
+    one before it, and so on.
+    """
+    return select(
+        CompetitorAnalysis,
+        func.row_number()
+        .over(
+            partition_by=CompetitorAnalysis.competitor_id,
+            order_by=(
+                desc(CompetitorAnalysis.analysis_date),
+                desc(CompetitorAnalysis.id),
+            ),
+        )
+        .label("rn"),
+    ).subquery()
+
+
+# Latest-analysis columns read by the report, ranking and market-overview
+# methods and by ``_compute_seo_strength``.
+_LATEST_ANALYSIS_COLUMNS: Tuple[str, ...] = (
+    "domain_authority", "total_backlinks", "organic_keywords",
+    "estimated_traffic", "total_reviews", "google_rating",
+    "keyword_gaps", "content_gaps", "strengths", "weaknesses",
+)
+
+
+def _competitors_with_latest_analysis(db: Any, *criteria: Any) -> List[Tuple[Any, Any]]:
+    """Return ``(competitor, latest)`` pairs for competitors matching *criteria*.
+
+    Both are lightweight column rows (``id``, ``name``, ``domain``,
+    ``market``, and ``_LATEST_ANALYSIS_COLUMNS``) rather than ORM objects;
+    *latest* is None for a competitor that has not been analysed yet.
+    """
+    ranked = _ranked_analyses()
+    rows = db.execute(
+        select(
+            Competitor.id,
+            Competitor.name,
+            Competitor.domain,
+            Competitor.market,
+            ranked.c.id.label("analysis_id"),
+            *(ranked.c[name] for name in _LATEST_ANALYSIS_COLUMNS),
+        )
+        .outerjoin(
+            ranked, and_(ranked.c.competitor_id == Competitor.id, ranked.c.rn == 1)
+        )
+        .where(*criteria)
+    ).all()
+    return [(row, row if row.analysis_id is not None else None) for row in rows]
+
+
+def _future_result(future: Future, default: Any, domain: str) -> Any:
+    """Return *future*'s result, or *default* (logged) if it raised."""
+    try:
+        return future.result()
+    except Exception as exc:
+        logger.warning("Analysis step failed for {}: {}", domain, exc)
+        return default
+
+
+def _or_queries(base_queries: List[str], geo: str) -> List[str]:
+    """Combine *base_queries* into ``("a" OR "b" ...) geo`` search queries.
+
+    Variants are grouped ``_OR_QUERY_CHUNK`` at a time, so a handful of
+    keyword phrases costs one search instead of one each.
+    """
+    combined: List[str] = []
+    for start in range(0, len(base_queries), _OR_QUERY_CHUNK):
+        chunk = base_queries[start:start + _OR_QUERY_CHUNK]
+        terms = " OR ".join(f'"{q}"' for q in chunk)
+        combined.append(f"({terms}) {geo}".strip())
+    return combined
+
+
 def _hash_id(*parts: str) -> str:
     """Produce a short deterministic hex digest for deduplication."""
     raw = "|".join(str(p).lower().strip() for p in parts)
-    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+    # Non-cryptographic dedup key: BLAKE2b with an 8-byte digest yields the
+    # same 16 hex characters as the truncated SHA-256 did, for less work.
+    return hashlib.blake2b(raw.encode(), digest_size=8).hexdigest()
 
 
-def _safe_get(url: str, timeout: int = 20) -> Optional[requests.Response]:
+def _safe_get(
+    url: str, timeout: int = 20, stream: bool = False
+) -> Optional[requests.Response]:
     """Attempt a GET request; return *None* on failure instead of raising."""
     try:
-        return fetch_url(url, timeout=timeout)
+        return _fetch_url_once(url, timeout=timeout, session=_HTTP, stream=stream)
     except Exception as exc:
         logger.warning("Failed to fetch {}: {}", url, exc)
         return None
 
 
+class _ParsedPage(NamedTuple):
+    """A fetched page: final URL after redirects, status, body size in
+    characters (capped at ``_PAGE_BYTE_CAP``), and parse tree."""
+
+    url: str
+    status_code: int
+    size: int
+    soup: BeautifulSoup
+
+
+class _FetchFailed(Exception):
+    """Raised inside cached helpers so a failed fetch is not memoised."""
+
+
+@cached(cache=TTLCache(maxsize=128, ttl=600), lock=threading.Lock())
+def _fetch_and_parse_cached(url: str, timeout: int) -> _ParsedPage:
+    """Cached body of ``_fetch_and_parse``; raises ``_FetchFailed``."""
+    resp = _safe_get(url, timeout=timeout, stream=True)
+    if resp is None:
+        raise _FetchFailed(url)
+    html = read_capped(resp, _PAGE_BYTE_CAP)
+    return _ParsedPage(resp.url, resp.status_code, len(html), BeautifulSoup(html, "lxml"))
+
+
+def _fetch_and_parse(url: str, timeout: int = 15) -> Optional[_ParsedPage]:
+    """Fetch and parse *url*, sharing the result for ten minutes.
+
+    A single competitor analysis reads the same homepage for its
+    services, technical checks and schema audit; they all reuse one
+    request and one parse.  The returned soup is shared, so callers must
+    treat it as read-only.  Failures return *None* and are not cached, so
+    the next caller retries.
+    """
+    try:
+        return _fetch_and_parse_cached(url, timeout)
+    except _FetchFailed:
+        return None
+
+
+def _word_count(tree: lxml.html.HtmlElement) -> int:
+    """Count words the way ``len(soup.get_text(strip=True).split())`` did.
+
+    That joined the stripped text nodes with no separator, so neighbouring
+    nodes merge their boundary words; counting per node and subtracting the
+    joins gives the same figure without building the page's full text.
+    """
+    words = parts = 0
+    for part in _PAGE_TEXT_XPATH(tree):
+        part = part.strip()
+        if part:
+            words += len(part.split())
+            parts += 1
+    return words - parts + 1 if parts else 0
+
+
+def _fetch_page_html(url: str) -> Optional[str]:
+    """Fetch *url* and return its body (capped at ``_PAGE_BYTE_CAP``), or None."""
+    resp = _safe_get(url, timeout=15, stream=True)
+    if resp is None:
+        return None
+    return read_capped(resp, _PAGE_BYTE_CAP)
+
+
 def _google_custom_search(query: str, num: int = 10) -> List[Dict[str, Any]]:
     """Execute a Google Custom Search JSON API call.
 
@@ -128,7 +457,7 @@ def _google_custom_search(query: str, num: int = 10) -> List[Dict[str, Any]]:
         "num": min(num, 10),
     }
     try:
-        resp = requests.get(url, params=params, timeout=15)
+        resp = _HTTP.get(url, params=params, timeout=15)
         resp.raise_for_status()
         data = resp.json()
         return data.get("items", [])
@@ -137,34 +466,57 @@ def _google_custom_search(query: str, num: int = 10) -> List[Dict[str, Any]]:
         return []
 
 
+def _parse_html(html: str) -> lxml.html.HtmlElement:
+    """Parse *html* into an lxml document, as leniently as BeautifulSoup.
+
+    Text is re-encoded so pages carrying an XML encoding declaration parse,
+    and an empty body yields an empty document instead of an error.
+    """
+    if not html.strip():
+        html = "<html></html>"
+    return lxml.html.document_fromstring(
+        html.encode("utf-8"), parser=lxml.html.HTMLParser(encoding="utf-8")
+    )
+
+
+def _stripped_text(element: Any) -> str:
+    """Join an element's text nodes, each stripped (``get_text(strip=True)``)."""
+    return "".join(part.strip() for part in _TEXT_NODES_XPATH(element))
+
+
 def _scrape_serp_results(query: str, num: int = 20) -> List[Dict[str, Any]]:
     """Scrape organic Google results for *query* via HTML parsing.
 
     This is a best-effort fallback when the Custom Search JSON API is not
-    available.  Results may be limited by rate-limits and CAPTCHAs.
+    available.  Requests go through ``_SCRAPE_LIMITER`` and the session's
+    retry policy backs off when Google throttles; results may still be
+    limited by CAPTCHAs.
     """
     results: List[Dict[str, Any]] = []
     search_url = "https://www.google.com/search"
     params = {"q": query, "num": num, "hl": "en"}
-    headers = {"User-Agent": _USER_AGENT}
 
     try:
-        resp = requests.get(search_url, params=params, headers=headers, timeout=15)
+        _SCRAPE_LIMITER.acquire()
+        resp = _HTTP.get(search_url, params=params, timeout=15)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-
-        for g in soup.select("div.tF2Cxc, div.g"):
-            link_tag = g.select_one("a[href]")
-            title_tag = g.select_one("h3")
-            snippet_tag = g.select_one("div.VwiC3b, span.aCOpRe")
-            if link_tag and title_tag:
-                href = link_tag["href"]
-                if href.startswith("/url?q="):
-                    href = href.split("/url?q=")[1].split("&")[0]
+        if not resp.text.strip():
+            return results
+        tree = lxml.html.fromstring(resp.text)
+
+        for g in _SERP_RESULT_XPATH(tree):
+            links = _SERP_LINK_XPATH(g)
+            titles = _SERP_TITLE_XPATH(g)
+            if links and titles:
+                href = str(links[0])
+                redirect = _GOOGLE_REDIRECT_RE.match(href)
+                if redirect:
+                    href = redirect.group(1)
+                snippets = _SERP_SNIPPET_XPATH(g)
                 results.append({
-                    "title": title_tag.get_text(strip=True),
+                    "title": _stripped_text(titles[0]),
                     "link": href,
-                    "snippet": snippet_tag.get_text(strip=True) if snippet_tag else "",
+                    "snippet": _stripped_text(snippets[0]) if snippets else "",
                     "displayLink": extract_domain(href),
                 })
     except Exception as exc:
@@ -173,43 +525,90 @@ def _scrape_serp_results(query: str, num: int = 20) -> List[Dict[str, Any]]:
     return results
 
 
+def _run_searches(
+    queries: List[str],
+    num: int = 10,
+    scrape_num: Optional[int] = None,
+) -> List[List[Dict[str, Any]]]:
+    """Run several searches, returning one result list per query, in order.
+
+    Custom Search API calls are issued concurrently (at most
+    ``_SEARCH_CONCURRENCY`` in flight).  Queries the API could not answer
+    fall back to SERP scraping, also concurrent; ``_SCRAPE_LIMITER`` keeps
+    the scrape rate polite to Google.
+    """
+    if not queries:
+        return []
+    with ThreadPoolExecutor(
+        max_workers=min(_SEARCH_CONCURRENCY, len(queries))
+    ) as pool:
+        all_results = list(
+            pool.map(_google_custom_search, queries, [num] * len(queries))
+        )
+        pending = [idx for idx, results in enumerate(all_results) if not results]
+        scraped = pool.map(
+            _scrape_serp_results,
+            [queries[idx] for idx in pending],
+            [scrape_num or num] * len(pending),
+        )
+        for idx, results in zip(pending, scraped):
+            all_results[idx] = results
+    return all_results
+
+
 def _estimate_domain_authority(domain: str) -> int:
     """Return a rough 0-100 domain-authority estimate.
 
     Uses simple heuristics (homepage status, page count, HTTPS) when
     third-party APIs are unavailable.  This is intentionally conservative.
+    Scores are cached per domain for a day, since discovery and backlink
+    comparison revisit the same domains repeatedly; an unreachable
+    homepage scores 0 without being cached.
     """
-    score = 0
-    url = f"https://{domain}"
-    resp = _safe_get(url, timeout=10)
-    if resp is None:
+    try:
+        return _domain_authority_cached(domain)
+    except _FetchFailed:
         return 0
 
+
+@cached(cache=TTLCache(maxsize=4096, ttl=86400), lock=threading.Lock())
+def _domain_authority_cached(domain: str) -> int:
+    """Cached body of ``_estimate_domain_authority``; raises ``_FetchFailed``."""
+    score = 0
+    page = _fetch_and_parse_cached(f"https://{domain}", 10)
+
     # HTTPS available
-    if resp.url.startswith("https://"):
+    if page.url.startswith("https://"):
         score += 15
 
     # Homepage loads correctly
-    if resp.status_code == 200:
+    if page.status_code == 200:
         score += 10
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = page.soup
         # Has title
         if soup.title:
             score += 5
         # Has meta description
         if soup.find("meta", attrs={"name": "description"}):
             score += 5
-        # Count internal links as a rough proxy of site size
-        internal_links = [
-            a["href"]
-            for a in soup.find_all("a", href=True)
-            if domain in a["href"] or a["href"].startswith("/")
-        ]
-        if len(internal_links) > 30:
+        # Count internal links as a rough proxy of site size.  Only the
+        # 5 / 15 / 30 thresholds matter, so stop counting past 30.
+        host = domain.lower()
+        internal_prefixes = (
+            "/", f"http://{host}", f"https://{host}",
+            f"http://www.{host}", f"https://www.{host}",
+        )
+        internal_links = 0
+        for a in soup.find_all("a", href=True):
+            if a["href"].lower().startswith(internal_prefixes):
+                internal_links += 1
+                if internal_links > 30:
+                    break
+        if internal_links > 30:
             score += 15
-        elif len(internal_links) > 15:
+        elif internal_links > 15:
             score += 10
-        elif len(internal_links) > 5:
+        elif internal_links > 5:
             score += 5
 
         # Schema markup present
@@ -229,12 +628,11 @@ def _estimate_domain_authority(domain: str) -> int:
 def _extract_page_topics(url: str) -> List[str]:
     """Fetch a page and return a list of topic strings from its headings."""
     topics: List[str] = []
-    resp = _safe_get(url, timeout=15)
-    if resp is None:
+    page = _fetch_and_parse(url)
+    if page is None:
         return topics
 
-    soup = BeautifulSoup(resp.text, "html.parser")
-    for tag in soup.find_all(["h1", "h2", "h3"]):
+    for tag in page.soup.find_all(["h1", "h2", "h3"]):
         text = tag.get_text(strip=True)
         if text and len(text) > 3:
             topics.append(text)
@@ -250,9 +648,9 @@ class CompetitorIntelligence:
     """Discover, analyze, and monitor competitors in the notary / apostille
     market across the DMV area and Southwest Virginia.
 
-    All database interactions use short-lived sessions created from
-    ``SessionLocal`` to stay compatible with the platform's session
-    management strategy.
+    All database interactions use short-lived sessions opened with
+    ``session_scope``, which commits, rolls back on error, and closes them
+    in line with the platform's session management strategy.
     """
 
     def __init__(self) -> None:
@@ -298,30 +696,19 @@ class CompetitorIntelligence:
         seen_domains: set[str] = set()
         discovered: List[Dict[str, Any]] = []
 
-        for base_query in queries:
-            full_query = f"{base_query} {geo}"
-            logger.debug("Searching: {}", full_query)
-
-            # Prefer the official API; fall back to scraping
-            results = _google_custom_search(full_query)
-            if not results:
-                results = _scrape_serp_results(full_query)
-                # Be polite to Google when scraping
-                time.sleep(2)
+        full_queries = _or_queries(queries, geo)
+        logger.debug("Searching: {}", full_queries)
 
+        # Prefer the official API; fall back to (rate-limited) scraping only
+        # for a combined query the API returned nothing for
+        search_results = _run_searches(full_queries, num=10, scrape_num=20)
+        for full_query, results in zip(full_queries, search_results):
             for item in results:
                 domain = extract_domain(item.get("link", ""))
                 if not domain or domain == self.our_domain or domain in seen_domains:
                     continue
                 # Skip obvious non-competitors (major platforms, directories)
-                skip_domains = {
-                    "google.com", "yelp.com", "facebook.com", "bbb.org",
-                    "yellowpages.com", "mapquest.com", "thumbtack.com",
-                    "angi.com", "homeadvisor.com", "nextdoor.com",
-                    "linkedin.com", "twitter.com", "instagram.com",
-                    "youtube.com", "wikipedia.org", "reddit.com",
-                }
-                if domain in skip_domains:
+                if domain in _SKIP_DOMAINS:
                     continue
 
                 seen_domains.add(domain)
@@ -342,32 +729,45 @@ class CompetitorIntelligence:
             market = "dmv"
 
         # Persist to database
-        db = SessionLocal()
         new_count = 0
         try:
-            for comp in discovered:
-                exists = (
-                    db.query(Competitor)
-                    .filter(Competitor.domain == comp["domain"])
-                    .first()
-                )
-                if not exists:
-                    db.add(
-                        Competitor(
-                            name=comp["name"],
-                            domain=comp["domain"],
-                            service_areas=[_area_label(area)],
-                            market=market,
-                            is_active=True,
-                        )
+            with session_scope() as db:
+                rows = [
+                    {
+                        "name": comp["name"],
+                        "domain": comp["domain"],
+                        "service_areas": [label],
+                        "market": market,
+                        "is_active": True,
+                    }
+                    for comp in discovered
+                ]
+                if (
+                    rows
+                    and _conflict_insert is not None
+                    and has_unique_competitor_domain(db.connection())
+                ):
+                    # The unique domain index decides what is new
+                    stmt = (
+                        _conflict_insert(Competitor)
+                        .values(rows)
+                        .on_conflict_do_nothing(index_elements=["domain"])
+                        .returning(Competitor.id)
                     )
-                    new_count += 1
-            db.commit()
+                    new_count = len(db.execute(stmt).scalars().all())
+                elif rows:
+                    existing = {
+                        domain
+                        for (domain,) in db.query(Competitor.domain)
+                        .filter(Competitor.domain.in_([r["domain"] for r in rows]))
+                        .all()
+                    }
+                    new_rows = [r for r in rows if r["domain"] not in existing]
+                    if new_rows:
+                        db.execute(insert(Competitor), new_rows)
+                        new_count = len(new_rows)
         except Exception as exc:
-            db.rollback()
             logger.error("DB error persisting competitors: {}", exc)
-        finally:
-            db.close()
 
         logger.info(
             "Discovered {} competitors in {} ({} new)",
@@ -396,68 +796,86 @@ class CompetitorIntelligence:
             A dict containing every analysis dimension, or an empty dict
             if the competitor is not found.
         """
-        db = SessionLocal()
         try:
-            competitor = db.query(Competitor).filter(Competitor.id == competitor_id).first()
-            if not competitor:
-                logger.warning("Competitor id={} not found", competitor_id)
-                return {}
-
-            domain = competitor.domain
-            comp_url = f"https://{domain}"
-            logger.info("Analyzing competitor: {} ({})", competitor.name, domain)
-
-            # --- Domain authority & backlink estimate ---
-            da = _estimate_domain_authority(domain)
-            backlink_estimate = self._estimate_backlinks(domain)
-
-            # --- Keyword rankings overlap ---
-            keyword_overlap = self._analyze_keyword_overlap(domain, db)
-
-            # --- Content analysis ---
-            content_analysis = self._analyze_content(comp_url)
-
-            # --- Google reviews ---
-            reviews = self._fetch_google_reviews(competitor.name, domain)
-
-            # --- Service offerings ---
-            services = self._extract_services(comp_url)
-            our_services = self._get_our_services()
-            service_comparison = {
-                "competitor_services": services,
-                "our_services": our_services,
-                "they_have_we_dont": [s for s in services if s.lower() not in {o.lower() for o in our_services}],
-                "we_have_they_dont": [s for s in our_services if s.lower() not in {o.lower() for o in services}],
-            }
+            with session_scope() as db:
+                competitor = db.query(Competitor).filter(Competitor.id == competitor_id).first()
+                if not competitor:
+                    logger.warning("Competitor id={} not found", competitor_id)
+                    return {}
+
+                domain = competitor.domain
+                comp_url = f"https://{domain}"
+                logger.info("Analyzing competitor: {} ({})", competitor.name, domain)
+
+                # The network-bound dimensions are independent, so fetch them
+                # concurrently; keyword overlap needs ``db`` and stays on this
+                # thread.
+                with ThreadPoolExecutor(max_workers=_ANALYSIS_CONCURRENCY) as pool:
+                    futures = {
+                        "domain_authority": pool.submit(_estimate_domain_authority, domain),
+                        "backlink_profile": pool.submit(self._estimate_backlinks, domain),
+                        "content_analysis": pool.submit(self._analyze_content, comp_url),
+                        "google_reviews": pool.submit(
+                            self._fetch_google_reviews, competitor.name, domain
+                        ),
+                        "services": pool.submit(self._extract_services, comp_url),
+                        "our_services": pool.submit(self._get_our_services),
+                        "technical_quality": pool.submit(
+                            self._assess_technical_quality, comp_url
+                        ),
+                    }
+
+                    # --- Keyword rankings overlap ---
+                    keyword_overlap = self._analyze_keyword_overlap(domain, db)
+
+                # --- Domain authority & backlink estimate ---
+                da = _future_result(futures["domain_authority"], 0, domain)
+                backlink_estimate = _future_result(futures["backlink_profile"], {}, domain)
+
+                # --- Content analysis ---
+                content_analysis = _future_result(futures["content_analysis"], {}, domain)
+
+                # --- Google reviews ---
+                reviews = _future_result(futures["google_reviews"], {}, domain)
+
+                # --- Service offerings ---
+                services = _future_result(futures["services"], [], domain)
+                our_services = _future_result(futures["our_services"], [], domain)
+                our_lower = {o.lower() for o in our_services}
+                their_lower = {s.lower() for s in services}
+                service_comparison = {
+                    "competitor_services": services,
+                    "our_services": our_services,
+                    "they_have_we_dont": [s for s in services if s.lower() not in our_lower],
+                    "we_have_they_dont": [s for s in our_services if s.lower() not in their_lower],
+                }
 
-            # --- Technical quality estimate ---
-            tech_quality = self._assess_technical_quality(comp_url)
-
-            analysis_result: Dict[str, Any] = {
-                "competitor_id": competitor_id,
-                "competitor_name": competitor.name,
-                "domain": domain,
-                "analysis_date": datetime.date.today().isoformat(),
-                "domain_authority": da,
-                "backlink_profile": backlink_estimate,
-                "keyword_overlap": keyword_overlap,
-                "content_analysis": content_analysis,
-                "google_reviews": reviews,
-                "service_comparison": service_comparison,
-                "technical_quality": tech_quality,
-            }
+                # --- Technical quality estimate ---
+                tech_quality = _future_result(futures["technical_quality"], {}, domain)
 
-            # Persist analysis snapshot
-            self._save_analysis(competitor_id, analysis_result, db)
+                analysis_result: Dict[str, Any] = {
+                    "competitor_id": competitor_id,
+                    "competitor_name": competitor.name,
+                    "domain": domain,
+                    "analysis_date": datetime.date.today().isoformat(),
+                    "domain_authority": da,
+                    "backlink_profile": backlink_estimate,
+                    "keyword_overlap": keyword_overlap,
+                    "content_analysis": content_analysis,
+                    "google_reviews": reviews,
+                    "service_comparison": service_comparison,
+                    "technical_quality": tech_quality,
+                }
 
-            logger.info("Analysis complete for {} (DA ~{})", competitor.name, da)
-            return analysis_result
+                # Persist analysis snapshot
+                self._save_analysis(competitor_id, analysis_result, db)
+
+                logger.info("Analysis complete for {} (DA ~{})", competitor.name, da)
+                return analysis_result
 
         except Exception as exc:
             logger.error("Error analysing competitor {}: {}", competitor_id, exc)
             return {}
-        finally:
-            db.close()
 
     # ------------------------------------------------------------------
     # 3. compare_keywords
@@ -475,76 +893,86 @@ class CompetitorIntelligence:
             A dict with keys ``overlap``, ``their_exclusive``,
             ``our_exclusive``, and ``summary``.
         """
-        db = SessionLocal()
         try:
-            competitor = db.query(Competitor).filter(Competitor.id == competitor_id).first()
-            if not competitor:
-                logger.warning("Competitor id={} not found", competitor_id)
-                return {}
-
-            logger.info("Comparing keywords with {}", competitor.name)
-
-            # Gather our latest rankings
-            our_rankings = self._get_our_keyword_rankings(db)
-            # Estimate competitor keyword rankings
-            their_rankings = self._estimate_competitor_keywords(competitor.domain)
-
-            our_kws = set(our_rankings.keys())
-            their_kws = set(their_rankings.keys())
-
-            overlap = our_kws & their_kws
-            their_exclusive = their_kws - our_kws
-            our_exclusive = our_kws - their_kws
-
-            overlap_detail = []
-            for kw in sorted(overlap):
-                our_pos = our_rankings[kw]
-                their_pos = their_rankings[kw]
-                overlap_detail.append({
-                    "keyword": kw,
-                    "our_position": our_pos,
-                    "their_position": their_pos,
-                    "we_win": our_pos < their_pos if our_pos and their_pos else None,
-                })
-
-            their_exclusive_detail = [
-                {"keyword": kw, "their_position": their_rankings[kw]}
-                for kw in sorted(their_exclusive)
-            ]
-
-            our_exclusive_detail = [
-                {"keyword": kw, "our_position": our_rankings[kw]}
-                for kw in sorted(our_exclusive)
-            ]
+            with session_scope() as db:
+                competitor = db.query(Competitor).filter(Competitor.id == competitor_id).first()
+                if not competitor:
+                    logger.warning("Competitor id={} not found", competitor_id)
+                    return {}
+
+                logger.info("Comparing keywords with {}", competitor.name)
+
+                # Gather our latest rankings
+                our_rankings = self._get_our_keyword_rankings(db)
+                # Estimate competitor keyword rankings
+                their_rankings = self._estimate_competitor_keywords(competitor.domain)
+
+                # One merge pass over both sorted keyword lists yields the
+                # overlap and each side's exclusives already in order.
+                our_sorted = sorted(our_rankings)
+                their_sorted = sorted(their_rankings)
+                overlap_detail: List[Dict[str, Any]] = []
+                their_exclusive_detail: List[Dict[str, Any]] = []
+                our_exclusive_detail: List[Dict[str, Any]] = []
+                i = j = 0
+                while i < len(our_sorted) and j < len(their_sorted):
+                    our_kw, their_kw = our_sorted[i], their_sorted[j]
+                    if our_kw == their_kw:
+                        our_pos = our_rankings[our_kw]
+                        their_pos = their_rankings[their_kw]
+                        overlap_detail.append({
+                            "keyword": our_kw,
+                            "our_position": our_pos,
+                            "their_position": their_pos,
+                            "we_win": our_pos < their_pos if our_pos and their_pos else None,
+                        })
+                        i += 1
+                        j += 1
+                    elif our_kw < their_kw:
+                        our_exclusive_detail.append(
+                            {"keyword": our_kw, "our_position": our_rankings[our_kw]}
+                        )
+                        i += 1
+                    else:
+                        their_exclusive_detail.append(
+                            {"keyword": their_kw, "their_position": their_rankings[their_kw]}
+                        )
+                        j += 1
+                our_exclusive_detail.extend(
+                    {"keyword": kw, "our_position": our_rankings[kw]}
+                    for kw in our_sorted[i:]
+                )
+                their_exclusive_detail.extend(
+                    {"keyword": kw, "their_position": their_rankings[kw]}
+                    for kw in their_sorted[j:]
+                )
 
-            result = {
-                "competitor_id": competitor_id,
-                "competitor_name": competitor.name,
-                "overlap": overlap_detail,
-                "their_exclusive": their_exclusive_detail,
-                "our_exclusive": our_exclusive_detail,
-                "summary": {
-                    "total_overlap": len(overlap),
-                    "keyword_gaps": len(their_exclusive),
-                    "our_advantages": len(our_exclusive),
-                    "top_gaps": their_exclusive_detail[:10],
-                },
-            }
+                result = {
+                    "competitor_id": competitor_id,
+                    "competitor_name": competitor.name,
+                    "overlap": overlap_detail,
+                    "their_exclusive": their_exclusive_detail,
+                    "our_exclusive": our_exclusive_detail,
+                    "summary": {
+                        "total_overlap": len(overlap_detail),
+                        "keyword_gaps": len(their_exclusive_detail),
+                        "our_advantages": len(our_exclusive_detail),
+                        "top_gaps": their_exclusive_detail[:10],
+                    },
+                }
 
-            logger.info(
-                "Keyword comparison with {}: {} overlap, {} gaps, {} advantages",
-                competitor.name,
-                len(overlap),
-                len(their_exclusive),
-                len(our_exclusive),
-            )
-            return result
+                logger.info(
+                    "Keyword comparison with {}: {} overlap, {} gaps, {} advantages",
+                    competitor.name,
+                    len(overlap_detail),
+                    len(their_exclusive_detail),
+                    len(our_exclusive_detail),
+                )
+                return result
 
         except Exception as exc:
             logger.error("Keyword comparison failed for competitor {}: {}", competitor_id, exc)
             return {}
-        finally:
-            db.close()
 
     # ------------------------------------------------------------------
     # 4. compare_content
@@ -561,83 +989,82 @@ class CompetitorIntelligence:
             A dict with ``their_pages``, ``our_pages``, ``content_gaps``,
             and ``recommendations``.
         """
-        db = SessionLocal()
         try:
-            competitor = db.query(Competitor).filter(Competitor.id == competitor_id).first()
-            if not competitor:
-                logger.warning("Competitor id={} not found", competitor_id)
-                return {}
-
-            logger.info("Comparing content with {}", competitor.name)
+            with session_scope() as db:
+                competitor = db.query(Competitor).filter(Competitor.id == competitor_id).first()
+                if not competitor:
+                    logger.warning("Competitor id={} not found", competitor_id)
+                    return {}
 
-            their_pages = self._crawl_site_pages(f"https://{competitor.domain}")
-            our_pages = self._crawl_site_pages(self.our_website)
+                logger.info("Comparing content with {}", competitor.name)
 
-            their_topics = set()
-            for page in their_pages:
-                for topic in page.get("topics", []):
-                    their_topics.add(topic.lower().strip())
+                their_pages = self._crawl_site_pages(f"https://{competitor.domain}")
+                our_pages = self._crawl_site_pages(self.our_website)
 
-            our_topics = set()
-            for page in our_pages:
-                for topic in page.get("topics", []):
-                    our_topics.add(topic.lower().strip())
+                their_topics = {
+                    topic.lower().strip()
+                    for page in their_pages
+                    for topic in page.get("topics", [])
+                }
+                our_topics = {
+                    topic.lower().strip()
+                    for page in our_pages
+                    for topic in page.get("topics", [])
+                }
 
-            content_gaps = sorted(their_topics - our_topics)
-            our_unique = sorted(our_topics - their_topics)
+                content_gaps = sorted(their_topics - our_topics)
+                our_unique = sorted(our_topics - their_topics)
 
-            # Classify page types
-            their_page_types = self._classify_pages(their_pages)
-            our_page_types = self._classify_pages(our_pages)
+                # Classify page types
+                their_page_types = self._classify_pages(their_pages)
+                our_page_types = self._classify_pages(our_pages)
 
-            missing_page_types = {
-                ptype: count
-                for ptype, count in their_page_types.items()
-                if count > our_page_types.get(ptype, 0)
-            }
+                missing_page_types = {
+                    ptype: count
+                    for ptype, count in their_page_types.items()
+                    if count > our_page_types.get(ptype, 0)
+                }
 
-            recommendations: List[str] = []
-            if missing_page_types.get("blog", 0) > 0:
-                recommendations.append(
-                    f"Competitor has ~{their_page_types.get('blog', 0)} blog posts vs "
-                    f"our ~{our_page_types.get('blog', 0)}. Consider increasing blog output."
-                )
-            if missing_page_types.get("landing_page", 0) > 0:
-                recommendations.append(
-                    "Competitor has more location/service landing pages. "
-                    "Create dedicated pages for under-served areas."
-                )
-            if content_gaps:
-                top_gaps = content_gaps[:5]
-                recommendations.append(
-                    f"Top content-topic gaps to fill: {', '.join(top_gaps)}"
-                )
+                recommendations: List[str] = []
+                if missing_page_types.get("blog", 0) > 0:
+                    recommendations.append(
+                        f"Competitor has ~{their_page_types.get('blog', 0)} blog posts vs "
+                        f"our ~{our_page_types.get('blog', 0)}. Consider increasing blog output."
+                    )
+                if missing_page_types.get("landing_page", 0) > 0:
+                    recommendations.append(
+                        "Competitor has more location/service landing pages. "
+                        "Create dedicated pages for under-served areas."
+                    )
+                if content_gaps:
+                    top_gaps = content_gaps[:5]
+                    recommendations.append(
+                        f"Top content-topic gaps to fill: {', '.join(top_gaps)}"
+                    )
 
-            result = {
-                "competitor_id": competitor_id,
-                "competitor_name": competitor.name,
-                "their_pages": their_pages,
-                "our_pages": our_pages,
-                "their_page_types": their_page_types,
-                "our_page_types": our_page_types,
-                "content_gaps": content_gaps,
-                "our_unique_topics": our_unique,
-                "missing_page_types": missing_page_types,
-                "recommendations": recommendations,
-            }
+                result = {
+                    "competitor_id": competitor_id,
+                    "competitor_name": competitor.name,
+                    "their_pages": their_pages,
+                    "our_pages": our_pages,
+                    "their_page_types": their_page_types,
+                    "our_page_types": our_page_types,
+                    "content_gaps": content_gaps,
+                    "our_unique_topics": our_unique,
+                    "missing_page_types": missing_page_types,
+                    "recommendations": recommendations,
+                }
 
-            logger.info(
-                "Content comparison with {}: {} gaps found",
-                competitor.name,
-                len(content_gaps),
-            )
-            return result
+                logger.info(
+                    "Content comparison with {}: {} gaps found",
+                    competitor.name,
+                    len(content_gaps),
+                )
+                return result
 
         except Exception as exc:
             logger.error("Content comparison failed for competitor {}: {}", competitor_id, exc)
             return {}
-        finally:
-            db.close()
 
     # ------------------------------------------------------------------
     # 5. compare_backlinks
@@ -652,83 +1079,79 @@ class CompetitorIntelligence:
             A dict with ``our_backlinks``, ``their_backlinks``,
             ``link_gaps``, and ``recommendations``.
         """
-        db = SessionLocal()
         try:
-            competitor = db.query(Competitor).filter(Competitor.id == competitor_id).first()
-            if not competitor:
-                logger.warning("Competitor id={} not found", competitor_id)
-                return {}
-
-            logger.info("Comparing backlinks with {}", competitor.name)
-
-            # Our backlinks from the database
-            our_backlinks_rows = (
-                db.query(Backlink)
-                .filter(Backlink.is_active.is_(True))
-                .all()
-            )
-            our_domains = {
-                b.source_domain for b in our_backlinks_rows if b.source_domain
-            }
-            our_backlink_list = [
-                {
-                    "source_domain": b.source_domain,
-                    "source_url": b.source_url,
-                    "anchor_text": b.anchor_text,
-                    "domain_authority": b.domain_authority,
-                    "link_type": b.link_type,
+            with session_scope() as db:
+                competitor = db.query(Competitor).filter(Competitor.id == competitor_id).first()
+                if not competitor:
+                    logger.warning("Competitor id={} not found", competitor_id)
+                    return {}
+
+                logger.info("Comparing backlinks with {}", competitor.name)
+
+                # Our backlinks: the database returns just the count and the
+                # distinct referring domains (an index-only scan on
+                # idx_backlink_active_domain) rather than every row.
+                our_backlinks_count = db.execute(
+                    select(func.count())
+                    .select_from(Backlink)
+                    .where(Backlink.is_active.is_(True))
+                ).scalar_one()
+                our_domains = {
+                    d
+                    for d in db.execute(
+                        select(Backlink.source_domain)
+                        .distinct()
+                        .where(Backlink.is_active.is_(True))
+                    ).scalars()
+                    if d
                 }
-                for b in our_backlinks_rows
-            ]
 
-            # Competitor backlinks - estimate via common directories/sources
-            their_backlinks = self._discover_competitor_backlinks(competitor.domain)
-            their_domains = {b["source_domain"] for b in their_backlinks}
+                # Competitor backlinks - estimate via common directories/sources
+                their_backlinks = self._discover_competitor_backlinks(competitor.domain)
+                their_domains = {b["source_domain"] for b in their_backlinks}
 
-            # Gaps: domains linking to them but not to us
-            gap_domains = their_domains - our_domains
-            link_gaps = [b for b in their_backlinks if b["source_domain"] in gap_domains]
+                # Gaps: domains linking to them but not to us
+                gap_domains = their_domains - our_domains
+                link_gaps = [b for b in their_backlinks if b["source_domain"] in gap_domains]
 
-            # Sort gaps by estimated authority descending
-            link_gaps.sort(key=lambda x: x.get("domain_authority", 0), reverse=True)
+                # Sort gaps by estimated authority descending
+                link_gaps.sort(key=lambda x: x.get("domain_authority", 0), reverse=True)
 
-            recommendations: List[str] = []
-            high_value_gaps = [g for g in link_gaps if g.get("domain_authority", 0) >= 30]
-            if high_value_gaps:
-                recommendations.append(
-                    f"Found {len(high_value_gaps)} high-authority link gaps (DA >= 30). "
-                    "Prioritize outreach to these domains."
-                )
-            if link_gaps:
-                top_sources = [g["source_domain"] for g in link_gaps[:5]]
-                recommendations.append(
-                    f"Top link-gap sources to target: {', '.join(top_sources)}"
-                )
+                recommendations: List[str] = []
+                high_value_gaps = [g for g in link_gaps if g.get("domain_authority", 0) >= 30]
+                if high_value_gaps:
+                    recommendations.append(
+                        f"Found {len(high_value_gaps)} high-authority link gaps (DA >= 30). "
+                        "Prioritize outreach to these domains."
+                    )
+                if link_gaps:
+                    top_sources = [g["source_domain"] for g in link_gaps[:5]]
+                    recommendations.append(
+                        f"Top link-gap sources to target: {', '.join(top_sources)}"
+                    )
 
-            result = {
-                "competitor_id": competitor_id,
-                "competitor_name": competitor.name,
-                "our_backlinks_count": len(our_backlinks_rows),
-                "our_referring_domains": len(our_domains),
-                "their_backlinks_count": len(their_backlinks),
-                "their_referring_domains": len(their_domains),
-                "link_gaps": link_gaps,
-                "gap_count": len(link_gaps),
-                "recommendations": recommendations,
-            }
+                result = {
+                    "competitor_id": competitor_id,
+                    "competitor_name": competitor.name,
+                    "our_backlinks_count": our_backlinks_count,
+                    "our_referring_domains": len(our_domains),
+                    "their_backlinks_count": len(their_backlinks),
+                    "their_referring_domains": len(their_domains),
+                    "link_gaps": link_gaps,
+                    "gap_count": len(link_gaps),
+                    "recommendations": recommendations,
+                }
 
-            logger.info(
-                "Backlink comparison with {}: {} gap domains found",
-                competitor.name,
-                len(gap_domains),
-            )
-            return result
+                logger.info(
+                    "Backlink comparison with {}: {} gap domains found",
+                    competitor.name,
+                    len(gap_domains),
+                )
+                return result
 
         except Exception as exc:
             logger.error("Backlink comparison failed for competitor {}: {}", competitor_id, exc)
             return {}
-        finally:
-            db.close()
 
     # ------------------------------------------------------------------
     # 6. monitor_competitor_changes
@@ -750,50 +1173,66 @@ class CompetitorIntelligence:
         logger.info("Monitoring competitor changes")
         alerts: List[Dict[str, Any]] = []
 
-        db = SessionLocal()
-        try:
-            competitors = (
-                db.query(Competitor)
-                .filter(Competitor.is_active.is_(True))
-                .all()
-            )
+        # A monitoring run starts a new report cycle; drop cached lookups
+        # so no cycle sees data older than the cache TTLs.
+        _domain_authority_cached.cache_clear()
+        CompetitorIntelligence._crawl_site_pages_cached.cache_clear()
+        CompetitorIntelligence._google_reviews_cached.cache_clear()
+        CompetitorIntelligence._get_our_services.cache_clear()
+        CompetitorIntelligence._backlink_estimate_cached.cache_clear()
+        CompetitorIntelligence._technical_quality_cached.cache_clear()
 
-            for comp in competitors:
-                analyses = (
-                    db.query(CompetitorAnalysis)
-                    .filter(CompetitorAnalysis.competitor_id == comp.id)
-                    .order_by(desc(CompetitorAnalysis.analysis_date))
-                    .limit(2)
+        try:
+            with session_scope() as db:
+                # Latest two analyses for every active competitor in one query
+                ranked = _ranked_analyses()
+                analysis = aliased(CompetitorAnalysis, ranked)
+                rows = (
+                    db.query(Competitor, analysis)
+                    .outerjoin(
+                        analysis,
+                        and_(analysis.competitor_id == Competitor.id, ranked.c.rn <= 2),
+                    )
+                    .filter(Competitor.is_active.is_(True))
+                    .order_by(Competitor.id, ranked.c.rn)
                     .all()
                 )
-
-                if len(analyses) < 2:
-                    logger.debug(
-                        "Skipping {} - fewer than 2 analyses available", comp.name
-                    )
-                    continue
-
-                latest = analyses[0]
-                previous = analyses[1]
-
-                comp_alerts = self._detect_changes(comp, latest, previous)
-                for alert_data in comp_alerts:
-                    alert = Alert(
-                        alert_type="competitor_change",
-                        severity=alert_data["severity"],
-                        title=alert_data["title"],
-                        message=alert_data["message"],
-                        data=alert_data.get("data"),
-                    )
-                    db.add(alert)
-                    alerts.append(alert_data)
-
-            db.commit()
+                analyses_by_comp: Dict[int, List[CompetitorAnalysis]] = {}
+                competitors: Dict[int, Competitor] = {}
+                for comp, snapshot in rows:
+                    competitors[comp.id] = comp
+                    comp_analyses = analyses_by_comp.setdefault(comp.id, [])
+                    if snapshot is not None:
+                        comp_analyses.append(snapshot)
+
+                alert_rows: List[Dict[str, Any]] = []
+                for comp_id, comp in competitors.items():
+                    analyses = analyses_by_comp[comp_id]
+
+                    if len(analyses) < 2:
+                        logger.debug(
+                            "Skipping {} - fewer than 2 analyses available", comp.name
+                        )
+                        continue
+
+                    latest = analyses[0]
+                    previous = analyses[1]
+
+                    comp_alerts = self._detect_changes(comp, latest, previous)
+                    for alert_data in comp_alerts:
+                        alert_rows.append({
+                            "alert_type": "competitor_change",
+                            "severity": alert_data["severity"],
+                            "title": alert_data["title"],
+                            "message": alert_data["message"],
+                            "data": alert_data.get("data"),
+                        })
+                        alerts.append(alert_data)
+
+                if alert_rows:
+                    db.execute(insert(Alert), alert_rows)
         except Exception as exc:
-            db.rollback()
             logger.error("Error monitoring competitor changes: {}", exc)
-        finally:
-            db.close()
 
         logger.info("Competitor monitoring complete: {} alerts generated", len(alerts))
         return alerts
@@ -815,92 +1254,90 @@ class CompetitorIntelligence:
         Returns:
             A dict grouping weaknesses by category with recommendations.
         """
-        db = SessionLocal()
         try:
-            competitor = db.query(Competitor).filter(Competitor.id == competitor_id).first()
-            if not competitor:
-                logger.warning("Competitor id={} not found", competitor_id)
-                return {}
+            with session_scope() as db:
+                competitor = db.query(Competitor).filter(Competitor.id == competitor_id).first()
+                if not competitor:
+                    logger.warning("Competitor id={} not found", competitor_id)
+                    return {}
 
-            logger.info("Identifying weaknesses for {}", competitor.name)
-            comp_url = f"https://{competitor.domain}"
+                logger.info("Identifying weaknesses for {}", competitor.name)
+                comp_url = f"https://{competitor.domain}"
 
-            # --- Thin content ---
-            thin_content = self._find_thin_content(comp_url)
+                # --- Thin content ---
+                thin_content = self._find_thin_content(comp_url)
 
-            # --- Locations not served well ---
-            underserved = self._find_underserved_areas(competitor)
+                # --- Locations not served well ---
+                underserved = self._find_underserved_areas(competitor)
 
-            # --- Negative reviews ---
-            negative_reviews = self._find_negative_reviews(competitor.name, competitor.domain)
+                # --- Negative reviews ---
+                negative_reviews = self._find_negative_reviews(competitor.name, competitor.domain)
 
-            # --- Technical issues ---
-            tech_issues = self._find_technical_issues(comp_url)
+                # --- Technical issues ---
+                tech_issues = self._find_technical_issues(comp_url)
 
-            # --- Missing schema ---
-            schema_issues = self._check_schema_markup(comp_url)
+                # --- Missing schema ---
+                schema_issues = self._check_schema_markup(comp_url)
 
-            # --- Build recommendations ---
-            recommendations: List[str] = []
-            if thin_content:
-                recommendations.append(
-                    f"Competitor has {len(thin_content)} pages with thin content. "
-                    "Create in-depth content on the same topics to outrank them."
-                )
-            if underserved:
-                areas_str = ", ".join(underserved[:5])
-                recommendations.append(
-                    f"Competitor is weak in these areas: {areas_str}. "
-                    "Create geo-specific landing pages to capture local traffic."
-                )
-            if negative_reviews:
-                common_complaints = list({r.get("theme", "") for r in negative_reviews if r.get("theme")})
-                if common_complaints:
+                # --- Build recommendations ---
+                recommendations: List[str] = []
+                if thin_content:
                     recommendations.append(
-                        "Common competitor complaints: "
-                        + ", ".join(common_complaints[:3])
-                        + ". Highlight our strengths in these areas."
+                        f"Competitor has {len(thin_content)} pages with thin content. "
+                        "Create in-depth content on the same topics to outrank them."
+                    )
+                if underserved:
+                    areas_str = ", ".join(underserved[:5])
+                    recommendations.append(
+                        f"Competitor is weak in these areas: {areas_str}. "
+                        "Create geo-specific landing pages to capture local traffic."
+                    )
+                if negative_reviews:
+                    common_complaints = list({r.get("theme", "") for r in negative_reviews if r.get("theme")})
+                    if common_complaints:
+                        recommendations.append(
+                            "Common competitor complaints: "
+                            + ", ".join(common_complaints[:3])
+                            + ". Highlight our strengths in these areas."
+                        )
+                if tech_issues:
+                    recommendations.append(
+                        f"Competitor has {len(tech_issues)} technical SEO issues. "
+                        "Ensure our site is technically superior."
+                    )
+                if schema_issues.get("missing_types"):
+                    recommendations.append(
+                        "Competitor is missing schema types: "
+                        + ", ".join(schema_issues["missing_types"])
+                        + ". Ensure ours are implemented for a competitive edge."
                     )
-            if tech_issues:
-                recommendations.append(
-                    f"Competitor has {len(tech_issues)} technical SEO issues. "
-                    "Ensure our site is technically superior."
-                )
-            if schema_issues.get("missing_types"):
-                recommendations.append(
-                    "Competitor is missing schema types: "
-                    + ", ".join(schema_issues["missing_types"])
-                    + ". Ensure ours are implemented for a competitive edge."
-                )
 
-            result = {
-                "competitor_id": competitor_id,
-                "competitor_name": competitor.name,
-                "weaknesses": {
-                    "thin_content": thin_content,
-                    "underserved_areas": underserved,
-                    "negative_reviews": negative_reviews,
-                    "technical_issues": tech_issues,
-                    "schema_issues": schema_issues,
-                },
-                "recommendations": recommendations,
-                "weakness_score": self._calculate_weakness_score(
-                    thin_content, underserved, negative_reviews, tech_issues, schema_issues
-                ),
-            }
+                result = {
+                    "competitor_id": competitor_id,
+                    "competitor_name": competitor.name,
+                    "weaknesses": {
+                        "thin_content": thin_content,
+                        "underserved_areas": underserved,
+                        "negative_reviews": negative_reviews,
+                        "technical_issues": tech_issues,
+                        "schema_issues": schema_issues,
+                    },
+                    "recommendations": recommendations,
+                    "weakness_score": self._calculate_weakness_score(
+                        thin_content, underserved, negative_reviews, tech_issues, schema_issues
+                    ),
+                }
 
-            logger.info(
-                "Weakness analysis for {}: score={}/100",
-                competitor.name,
-                result["weakness_score"],
-            )
-            return result
+                logger.info(
+                    "Weakness analysis for {}: score={}/100",
+                    competitor.name,
+                    result["weakness_score"],
+                )
+                return result
 
         except Exception as exc:
             logger.error("Weakness analysis failed for competitor {}: {}", competitor_id, exc)
             return {}
-        finally:
-            db.close()
 
     # ------------------------------------------------------------------
     # 8. get_market_overview
@@ -916,91 +1353,82 @@ class CompetitorIntelligence:
         label = _area_label(area)
         logger.info("Generating market overview for {}", label)
 
-        db = SessionLocal()
         try:
-            region = area.get("region", "").lower()
-            if "southwest" in region or "swva" in region:
-                market_key = "swva"
-            else:
-                market_key = "dmv"
-
-            competitors = (
-                db.query(Competitor)
-                .filter(Competitor.is_active.is_(True), Competitor.market == market_key)
-                .all()
-            )
-
-            comp_summaries: List[Dict[str, Any]] = []
-            total_da = 0
-            total_reviews = 0
-            rating_sum = 0.0
-            rated_count = 0
-
-            for comp in competitors:
-                latest = (
-                    db.query(CompetitorAnalysis)
-                    .filter(CompetitorAnalysis.competitor_id == comp.id)
-                    .order_by(desc(CompetitorAnalysis.analysis_date))
-                    .first()
+            with session_scope() as db:
+                region = area.get("region", "").lower()
+                if "southwest" in region or "swva" in region:
+                    market_key = "swva"
+                else:
+                    market_key = "dmv"
+
+                # Each competitor with its latest analysis, if any
+                rows = _competitors_with_latest_analysis(
+                    db, Competitor.is_active.is_(True), Competitor.market == market_key
                 )
-                da = latest.domain_authority if latest and latest.domain_authority else 0
-                reviews = latest.total_reviews if latest and latest.total_reviews else 0
-                rating = latest.google_rating if latest and latest.google_rating else None
-
-                total_da += da
-                total_reviews += reviews
-                if rating is not None:
-                    rating_sum += rating
-                    rated_count += 1
-
-                comp_summaries.append({
-                    "name": comp.name,
-                    "domain": comp.domain,
-                    "domain_authority": da,
-                    "total_reviews": reviews,
-                    "google_rating": rating,
-                })
 
-            count = len(competitors)
-            avg_da = round(total_da / count, 1) if count else 0
-            avg_rating = round(rating_sum / rated_count, 2) if rated_count else None
-            avg_reviews = round(total_reviews / count) if count else 0
-
-            # Market difficulty: simple heuristic
-            if avg_da >= 40 and count >= 10:
-                difficulty = "high"
-            elif avg_da >= 25 or count >= 6:
-                difficulty = "medium"
-            else:
-                difficulty = "low"
-
-            result = {
-                "area": label,
-                "market": market_key,
-                "competitor_count": count,
-                "competitors": comp_summaries,
-                "average_domain_authority": avg_da,
-                "average_google_rating": avg_rating,
-                "average_review_count": avg_reviews,
-                "total_reviews_in_market": total_reviews,
-                "market_difficulty": difficulty,
-                "generated_at": datetime.datetime.utcnow().isoformat(),
-            }
+                comp_summaries: List[Dict[str, Any]] = []
+                total_da = 0
+                total_reviews = 0
+                rating_sum = 0.0
+                rated_count = 0
+
+                for comp, latest in rows:
+                    da = latest.domain_authority if latest and latest.domain_authority else 0
+                    reviews = latest.total_reviews if latest and latest.total_reviews else 0
+                    rating = latest.google_rating if latest and latest.google_rating else None
+
+                    total_da += da
+                    total_reviews += reviews
+                    if rating is not None:
+                        rating_sum += rating
+                        rated_count += 1
+
+                    comp_summaries.append({
+                        "name": comp.name,
+                        "domain": comp.domain,
+                        "domain_authority": da,
+                        "total_reviews": reviews,
+                        "google_rating": rating,
+                    })
 
-            logger.info(
-                "Market overview for {}: {} competitors, avg DA {}, difficulty={}",
-                label,
-                count,
-                avg_da,
-                difficulty,
-            )
-            return result
+                count = len(rows)
+                avg_da = round(total_da / count, 1) if count else 0
+                avg_rating = round(rating_sum / rated_count, 2) if rated_count else None
+                avg_reviews = round(total_reviews / count) if count else 0
+
+                # Market difficulty: simple heuristic
+                if avg_da >= 40 and count >= 10:
+                    difficulty = "high"
+                elif avg_da >= 25 or count >= 6:
+                    difficulty = "medium"
+                else:
+                    difficulty = "low"
+
+                result = {
+                    "area": label,
+                    "market": market_key,
+                    "competitor_count": count,
+                    "competitors": comp_summaries,
+                    "average_domain_authority": avg_da,
+                    "average_google_rating": avg_rating,
+                    "average_review_count": avg_reviews,
+                    "total_reviews_in_market": total_reviews,
+                    "market_difficulty": difficulty,
+                    "generated_at": datetime.datetime.utcnow().isoformat(),
+                }
+
+                logger.info(
+                    "Market overview for {}: {} competitors, avg DA {}, difficulty={}",
+                    label,
+                    count,
+                    avg_da,
+                    difficulty,
+                )
+                return result
 
         except Exception as exc:
             logger.error("Market overview failed for {}: {}", label, exc)
             return {}
-        finally:
-            db.close()
 
     # ------------------------------------------------------------------
     # 9. get_competitor_report
@@ -1019,122 +1447,111 @@ class CompetitorIntelligence:
         """
         logger.info("Generating comprehensive competitor report")
 
-        db = SessionLocal()
         try:
-            competitors = (
-                db.query(Competitor)
-                .filter(Competitor.is_active.is_(True))
-                .all()
-            )
-
-            scorecards: List[Dict[str, Any]] = []
-            all_keyword_gaps: List[str] = []
-            all_content_gaps: List[str] = []
-            all_link_gaps: List[Dict[str, Any]] = []
-            action_items: List[Dict[str, Any]] = []
-
-            for comp in competitors:
-                latest: Optional[CompetitorAnalysis] = (
-                    db.query(CompetitorAnalysis)
-                    .filter(CompetitorAnalysis.competitor_id == comp.id)
-                    .order_by(desc(CompetitorAnalysis.analysis_date))
-                    .first()
+            with session_scope() as db:
+                # Each active competitor with its latest analysis, if any
+                competitors = _competitors_with_latest_analysis(
+                    db, Competitor.is_active.is_(True)
                 )
 
-                da = latest.domain_authority if latest else None
-                reviews = latest.total_reviews if latest else None
-                rating = latest.google_rating if latest else None
-                kw_gaps = latest.keyword_gaps if latest and latest.keyword_gaps else []
-                ct_gaps = latest.content_gaps if latest and latest.content_gaps else []
-                strengths = latest.strengths if latest and latest.strengths else []
-                weaknesses = latest.weaknesses if latest and latest.weaknesses else []
-
-                seo_score = self._compute_seo_strength(latest)
-
-                scorecards.append({
-                    "competitor_id": comp.id,
-                    "name": comp.name,
-                    "domain": comp.domain,
-                    "market": comp.market,
-                    "domain_authority": da,
-                    "total_reviews": reviews,
-                    "google_rating": rating,
-                    "seo_strength_score": seo_score,
-                    "strengths": strengths,
-                    "weaknesses": weaknesses,
-                })
+                scorecards: List[Dict[str, Any]] = []
+                all_keyword_gaps: List[str] = []
+                all_content_gaps: List[str] = []
+                all_link_gaps: List[Dict[str, Any]] = []
+                action_items: List[Dict[str, Any]] = []
+
+                for comp, latest in competitors:
+
+                    da = latest.domain_authority if latest else None
+                    reviews = latest.total_reviews if latest else None
+                    rating = latest.google_rating if latest else None
+                    kw_gaps = latest.keyword_gaps if latest and latest.keyword_gaps else []
+                    ct_gaps = latest.content_gaps if latest and latest.content_gaps else []
+                    strengths = latest.strengths if latest and latest.strengths else []
+                    weaknesses = latest.weaknesses if latest and latest.weaknesses else []
+
+                    seo_score = self._compute_seo_strength(latest)
+
+                    scorecards.append({
+                        "competitor_id": comp.id,
+                        "name": comp.name,
+                        "domain": comp.domain,
+                        "market": comp.market,
+                        "domain_authority": da,
+                        "total_reviews": reviews,
+                        "google_rating": rating,
+                        "seo_strength_score": seo_score,
+                        "strengths": strengths,
+                        "weaknesses": weaknesses,
+                    })
 
-                all_keyword_gaps.extend(kw_gaps if isinstance(kw_gaps, list) else [])
-                all_content_gaps.extend(ct_gaps if isinstance(ct_gaps, list) else [])
-
-            # Deduplicate gaps
-            unique_keyword_gaps = sorted(set(all_keyword_gaps))
-            unique_content_gaps = sorted(set(all_content_gaps))
-
-            # Build action items from most common gaps
-            kw_gap_counts = defaultdict(int)
-            for kw in all_keyword_gaps:
-                kw_gap_counts[kw] += 1
-            top_kw_gaps = sorted(kw_gap_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-
-            for kw, count in top_kw_gaps:
-                action_items.append({
-                    "type": "keyword_gap",
-                    "priority": "high" if count >= 2 else "medium",
-                    "action": f"Create or optimize content targeting '{kw}' "
-                              f"({count} competitors rank for this).",
-                })
+                    all_keyword_gaps.extend(kw_gaps if isinstance(kw_gaps, list) else [])
+                    all_content_gaps.extend(ct_gaps if isinstance(ct_gaps, list) else [])
+
+                # Deduplicate gaps
+                kw_gap_counts = Counter(all_keyword_gaps)
+                unique_keyword_gaps = sorted(kw_gap_counts)
+                unique_content_gaps = sorted(set(all_content_gaps))
+
+                # Build action items from most common gaps
+                top_kw_gaps = kw_gap_counts.most_common(10)
 
-            if unique_content_gaps:
-                for topic in unique_content_gaps[:5]:
+                for kw, count in top_kw_gaps:
                     action_items.append({
-                        "type": "content_gap",
-                        "priority": "medium",
-                        "action": f"Develop content covering: {topic}",
+                        "type": "keyword_gap",
+                        "priority": "high" if count >= 2 else "medium",
+                        "action": f"Create or optimize content targeting '{kw}' "
+                                  f"({count} competitors rank for this).",
                     })
 
-            # Sort scorecards by strength
-            scorecards.sort(key=lambda s: s["seo_strength_score"], reverse=True)
-
-            # Executive summary
-            strongest = scorecards[0] if scorecards else None
-            summary_parts = [
-                f"Tracking {len(competitors)} active competitors.",
-            ]
-            if strongest:
+                if unique_content_gaps:
+                    for topic in unique_content_gaps[:5]:
+                        action_items.append({
+                            "type": "content_gap",
+                            "priority": "medium",
+                            "action": f"Develop content covering: {topic}",
+                        })
+
+                # Sort scorecards by strength
+                scorecards.sort(key=lambda s: s["seo_strength_score"], reverse=True)
+
+                # Executive summary
+                strongest = scorecards[0] if scorecards else None
+                summary_parts = [
+                    f"Tracking {len(competitors)} active competitors.",
+                ]
+                if strongest:
+                    summary_parts.append(
+                        f"Strongest competitor: {strongest['name']} "
+                        f"(SEO score {strongest['seo_strength_score']}/100)."
+                    )
                 summary_parts.append(
-                    f"Strongest competitor: {strongest['name']} "
-                    f"(SEO score {strongest['seo_strength_score']}/100)."
+                    f"Identified {len(unique_keyword_gaps)} unique keyword gaps "
+                    f"and {len(unique_content_gaps)} content-topic gaps."
                 )
-            summary_parts.append(
-                f"Identified {len(unique_keyword_gaps)} unique keyword gaps "
-                f"and {len(unique_content_gaps)} content-topic gaps."
-            )
 
-            report = {
-                "report_date": datetime.date.today().isoformat(),
-                "executive_summary": " ".join(summary_parts),
-                "competitor_count": len(competitors),
-                "scorecards": scorecards,
-                "keyword_gaps": unique_keyword_gaps,
-                "content_gaps": unique_content_gaps,
-                "link_gaps": all_link_gaps,
-                "action_items": action_items,
-                "generated_at": datetime.datetime.utcnow().isoformat(),
-            }
+                report = {
+                    "report_date": datetime.date.today().isoformat(),
+                    "executive_summary": " ".join(summary_parts),
+                    "competitor_count": len(competitors),
+                    "scorecards": scorecards,
+                    "keyword_gaps": unique_keyword_gaps,
+                    "content_gaps": unique_content_gaps,
+                    "link_gaps": all_link_gaps,
+                    "action_items": action_items,
+                    "generated_at": datetime.datetime.utcnow().isoformat(),
+                }
 
-            logger.info(
-                "Competitor report generated: {} competitors, {} action items",
-                len(competitors),
-                len(action_items),
-            )
-            return report
+                logger.info(
+                    "Competitor report generated: {} competitors, {} action items",
+                    len(competitors),
+                    len(action_items),
+                )
+                return report
 
         except Exception as exc:
             logger.error("Competitor report generation failed: {}", exc)
             return {}
-        finally:
-            db.close()
 
     # ------------------------------------------------------------------
     # 10. rank_competitors
@@ -1152,85 +1569,120 @@ class CompetitorIntelligence:
         label = _area_label(area)
         logger.info("Ranking competitors in {}", label)
 
-        db = SessionLocal()
         try:
-            region = area.get("region", "").lower()
-            if "southwest" in region or "swva" in region:
-                market_key = "swva"
-            else:
-                market_key = "dmv"
-
-            competitors = (
-                db.query(Competitor)
-                .filter(Competitor.is_active.is_(True), Competitor.market == market_key)
-                .all()
-            )
-
-            ranked: List[Dict[str, Any]] = []
-            for comp in competitors:
-                latest: Optional[CompetitorAnalysis] = (
-                    db.query(CompetitorAnalysis)
-                    .filter(CompetitorAnalysis.competitor_id == comp.id)
-                    .order_by(desc(CompetitorAnalysis.analysis_date))
-                    .first()
+            with session_scope() as db:
+                region = area.get("region", "").lower()
+                if "southwest" in region or "swva" in region:
+                    market_key = "swva"
+                else:
+                    market_key = "dmv"
+
+                # Each competitor with its latest analysis, if any
+                competitors = _competitors_with_latest_analysis(
+                    db, Competitor.is_active.is_(True), Competitor.market == market_key
                 )
 
-                seo_score = self._compute_seo_strength(latest)
-
-                ranked.append({
-                    "competitor_id": comp.id,
-                    "name": comp.name,
-                    "domain": comp.domain,
-                    "seo_strength_score": seo_score,
-                    "domain_authority": latest.domain_authority if latest else None,
-                    "total_backlinks": latest.total_backlinks if latest else None,
-                    "organic_keywords": latest.organic_keywords if latest else None,
-                    "total_reviews": latest.total_reviews if latest else None,
-                    "google_rating": latest.google_rating if latest else None,
-                })
+                ranked: List[Dict[str, Any]] = []
+                for comp, latest in competitors:
+
+                    seo_score = self._compute_seo_strength(latest)
+
+                    ranked.append({
+                        "competitor_id": comp.id,
+                        "name": comp.name,
+                        "domain": comp.domain,
+                        "seo_strength_score": seo_score,
+                        "domain_authority": latest.domain_authority if latest else None,
+                        "total_backlinks": latest.total_backlinks if latest else None,
+                        "organic_keywords": latest.organic_keywords if latest else None,
+                        "total_reviews": latest.total_reviews if latest else None,
+                        "google_rating": latest.google_rating if latest else None,
+                    })
 
-            ranked.sort(key=lambda r: r["seo_strength_score"], reverse=True)
+                ranked.sort(key=lambda r: r["seo_strength_score"], reverse=True)
 
-            # Assign ordinal rank
-            for idx, entry in enumerate(ranked, start=1):
-                entry["rank"] = idx
+                # Assign ordinal rank
+                for idx, entry in enumerate(ranked, start=1):
+                    entry["rank"] = idx
 
-            logger.info(
-                "Ranked {} competitors in {}; top={} (score {})",
-                len(ranked),
-                label,
-                ranked[0]["name"] if ranked else "N/A",
-                ranked[0]["seo_strength_score"] if ranked else 0,
-            )
-            return ranked
+                logger.info(
+                    "Ranked {} competitors in {}; top={} (score {})",
+                    len(ranked),
+                    label,
+                    ranked[0]["name"] if ranked else "N/A",
+                    ranked[0]["seo_strength_score"] if ranked else 0,
+                )
+                return ranked
 
         except Exception as exc:
             logger.error("Competitor ranking failed for {}: {}", label, exc)
             return []
-        finally:
-            db.close()
 
     # ==================================================================
     # Internal / private helper methods
     # ==================================================================
 
     def _estimate_backlinks(self, domain: str) -> Dict[str, Any]:
-        """Return a rough backlink-profile estimate for *domain*."""
+        """Return a rough backlink-profile estimate for *domain*.
+
+        Results are cached per domain for an hour.  When every search
+        comes back empty the all-zero estimate is returned uncached, since
+        that is what a throttled or failed search looks like.
+        """
+        try:
+            return copy.deepcopy(self._backlink_estimate_cached(domain))
+        except _FetchFailed:
+            return {
+                "estimated_referring_domains": 0,
+                "known_directory_links": [],
+                "estimated_total_backlinks": 0,
+            }
+
+    @cached(
+        cache=TTLCache(maxsize=1024, ttl=3600),
+        key=lambda self, domain: domain,
+        lock=threading.Lock(),
+    )
+    def _backlink_estimate_cached(self, domain: str) -> Dict[str, Any]:
+        """Cached body of ``_estimate_backlinks``; raises ``_FetchFailed``."""
         # Check for links from well-known directories / sources
         known_sources = [
             "yelp.com", "bbb.org", "yellowpages.com", "superpages.com",
             "manta.com", "chamberofcommerce.com", "notary.net",
             "123notary.com", "notarycafe.com", "signingagent.com",
         ]
-        found_sources: List[str] = []
-        for source in known_sources:
-            search_query = f"site:{source} {domain}"
-            results = _google_custom_search(search_query, num=3)
-            if not results:
-                results = _scrape_serp_results(search_query, num=5)
-                time.sleep(1)
-            if results:
-                found_sources.append(source)
+        # One combined "site:a OR site:b ..." search, attributing each hit
+        # to the directory it came from
+        combined_query = (
+            "(" + " OR ".join(f"site:{source}" for source in known_sources)
+            + f") {domain}"
+        )
+        (combined_results,) = _run_searches(
+            [combined_query], num=10, scrape_num=5 * len(known_sources)
+        )
+        hit_domains = {
+            extract_domain(r.get("link", "")) for r in combined_results
+        }
+        found_sources: List[str] = [
+            source
+            for source in known_sources
+            if any(d == source or d.endswith("." + source) for d in hit_domains)
+        ]
+
+        if not combined_results:
+            # Nothing came back for the combined query; probe each directory
+            search_results = _run_searches(
+                [f"site:{source} {domain}" for source in known_sources],
+                num=3,
+                scrape_num=5,
+            )
+            if not any(search_results):
+                raise _FetchFailed(domain)
+            found_sources = [
+                source
+                for source, results in zip(known_sources, search_results)
+                if results
+            ]
 
         return {
             "estimated_referring_domains": len(found_sources) * 3,  # rough multiplier
@@ -1253,12 +1705,9 @@ class CompetitorIntelligence:
         competitor_only: List[str] = []
 
         sample_keywords = our_keywords[:30]  # limit to avoid rate-limit issues
-        for kw in sample_keywords:
-            results = _google_custom_search(f"{kw}", num=10)
-            if not results:
-                results = _scrape_serp_results(kw, num=10)
-                time.sleep(1)
-
+        for kw, results in zip(
+            sample_keywords, _run_searches(sample_keywords, num=10)
+        ):
             found_us = False
             found_them = False
             for r in results:
@@ -1302,7 +1751,25 @@ class CompetitorIntelligence:
     def _fetch_google_reviews(
         self, business_name: str, domain: str
     ) -> Dict[str, Any]:
-        """Attempt to retrieve Google review data for a competitor."""
+        """Attempt to retrieve Google review data for a competitor.
+
+        Results are cached per domain for an hour; a lookup that found no
+        rating or count is not cached.
+        """
+        try:
+            return dict(self._google_reviews_cached(business_name, domain))
+        except _FetchFailed:
+            return {"google_rating": None, "review_count": None}
+
+    @cached(
+        cache=TTLCache(maxsize=1024, ttl=3600),
+        key=lambda self, business_name, domain: domain,
+        lock=threading.Lock(),
+    )
+    def _google_reviews_cached(
+        self, business_name: str, domain: str
+    ) -> Dict[str, Any]:
+        """Cached body of ``_fetch_google_reviews``; raises ``_FetchFailed``."""
         query = f"{business_name} reviews"
         results = _google_custom_search(query, num=5)
         if not results:
@@ -1321,6 +1788,8 @@ class CompetitorIntelligence:
             if count_match and count is None:
                 count = int(count_match.group(1).replace(",", ""))
 
+        if rating is None and count is None:
+            raise _FetchFailed(query)
         return {
             "google_rating": rating,
             "review_count": count,
@@ -1328,36 +1797,34 @@ class CompetitorIntelligence:
 
     def _extract_services(self, base_url: str) -> List[str]:
         """Extract service names from a competitor's website."""
-        services: List[str] = []
-        resp = _safe_get(base_url, timeout=15)
-        if resp is None:
-            return services
-
-        soup = BeautifulSoup(resp.text, "html.parser")
-
-        service_keywords = [
-            "notary", "apostille", "mobile notary", "loan signing",
-            "real estate closing", "power of attorney", "document authentication",
-            "embassy legalization", "remote online notarization",
-            "certified translation", "foreign document", "hospital notary",
-        ]
+        page = _fetch_and_parse(base_url)
+        if page is None:
+            return []
 
-        text = soup.get_text(" ", strip=True).lower()
-        for svc in service_keywords:
-            if svc in text:
-                services.append(svc.title())
+        soup = page.soup
 
-        # Check navigation links for more service pages
-        for a in soup.find_all("a", href=True):
-            link_text = a.get_text(strip=True).lower()
-            for svc in service_keywords:
-                if svc in link_text and svc.title() not in services:
-                    services.append(svc.title())
+        text = soup.get_text(" ", strip=True).lower()
+        # Check navigation links for more service pages; the newline keeps a
+        # match from spanning two links.
+        link_text = "\n".join(
+            a.get_text(strip=True).lower() for a in soup.find_all("a", href=True)
+        )
+        found = {svc for _, svc in _SERVICE_AC.iter(text)}
+        found.update(svc for _, svc in _SERVICE_AC.iter(link_text))
 
-        return sorted(set(services))
+        return sorted({svc.title() for svc in found})
 
+    @cached(
+        cache=TTLCache(maxsize=8, ttl=3600),
+        key=lambda self: self.our_website,
+        lock=threading.Lock(),
+    )
     def _get_our_services(self) -> List[str]:
-        """Return the list of services we offer (from site or hardcoded)."""
+        """Return the list of services we offer (from site or hardcoded).
+
+        Cached for an hour, so analysing several competitors in one cycle
+        reads our own site once; treat the returned list as read-only.
+        """
         services = self._extract_services(self.our_website)
         if not services:
             # Fallback from config keywords
@@ -1371,20 +1838,36 @@ class CompetitorIntelligence:
         return services
 
     def _assess_technical_quality(self, url: str) -> Dict[str, Any]:
-        """Assess the technical SEO quality of a competitor site."""
+        """Assess the technical SEO quality of a competitor site.
+
+        Results are cached per URL for an hour; an unreachable site is
+        reported without being cached.
+        """
+        try:
+            return copy.deepcopy(self._technical_quality_cached(url))
+        except _FetchFailed:
+            return {"score": 0, "issues": ["Site unreachable"], "checks": {}}
+
+    @cached(
+        cache=TTLCache(maxsize=1024, ttl=3600),
+        key=lambda self, url: url,
+        lock=threading.Lock(),
+    )
+    def _technical_quality_cached(self, url: str) -> Dict[str, Any]:
+        """Cached body of ``_assess_technical_quality``; raises ``_FetchFailed``."""
         issues: List[str] = []
         checks: Dict[str, bool] = {}
 
-        resp = _safe_get(url, timeout=15)
-        if resp is None:
-            return {"score": 0, "issues": ["Site unreachable"], "checks": {}}
+        page = _fetch_and_parse(url)
+        if page is None:
+            raise _FetchFailed(url)
 
         # HTTPS
-        checks["https"] = resp.url.startswith("https://")
+        checks["https"] = page.url.startswith("https://")
         if not checks["https"]:
             issues.append("Site does not use HTTPS")
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = page.soup
 
         # Title tag
         checks["has_title"] = soup.title is not None and len(soup.title.string or "") > 0
@@ -1436,7 +1919,7 @@ class CompetitorIntelligence:
             issues.append("No sitemap.xml found")
 
         # Page load size
-        page_size_kb = len(resp.content) / 1024
+        page_size_kb = page.size / 1024
         checks["reasonable_page_size"] = page_size_kb < 3000
         if not checks["reasonable_page_size"]:
             issues.append(f"Large page size: {page_size_kb:.0f} KB")
@@ -1456,75 +1939,98 @@ class CompetitorIntelligence:
     def _crawl_site_pages(self, base_url: str, max_pages: int = 50) -> List[Dict[str, Any]]:
         """Crawl a site starting from *base_url* and return page metadata.
 
-        Follows internal links up to *max_pages*.
+        Follows internal links up to *max_pages*.  Crawls are cached for an
+        hour, so comparing several competitors against our own site crawls
+        it once; each caller gets its own copy.  A crawl that found no
+        pages is not cached.
         """
+        try:
+            return copy.deepcopy(self._crawl_site_pages_cached(base_url, max_pages))
+        except _FetchFailed:
+            return []
+
+    @cached(
+        cache=TTLCache(maxsize=256, ttl=3600),
+        key=lambda self, base_url, max_pages: (base_url, max_pages),
+        lock=threading.Lock(),
+    )
+    def _crawl_site_pages_cached(
+        self, base_url: str, max_pages: int
+    ) -> List[Dict[str, Any]]:
+        """Cached body of ``_crawl_site_pages``; raises ``_FetchFailed``."""
         domain = extract_domain(base_url)
         visited: set[str] = set()
-        to_visit: List[str] = [base_url]
+        to_visit: Deque[str] = deque([base_url])
         pages: List[Dict[str, Any]] = []
+        in_flight: Dict[Future, str] = {}
+
+        # Fetches run on a small pool; parsing stays on this thread.  No more
+        # fetches are started than there are page slots left to fill.
+        with ThreadPoolExecutor(max_workers=_CRAWL_CONCURRENCY) as pool:
+            while len(pages) < max_pages:
+                while (
+                    to_visit
+                    and len(in_flight) < _CRAWL_CONCURRENCY
+                    and len(pages) + len(in_flight) < max_pages
+                ):
+                    url = to_visit.popleft()
+                    normalized = normalize_url(url)
+                    if normalized in visited:
+                        continue
+                    visited.add(normalized)
+                    in_flight[pool.submit(_fetch_page_html, url)] = url
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url = in_flight.pop(future)
+                    html = future.result()
+                    if html is None or len(pages) >= max_pages:
+                        continue
+
+                    # Parse straight into an lxml tree and query it with
+                    # compiled XPath; the crawl only needs a few fields per page.
+                    tree = _parse_html(html)
+
+                    titles = _PAGE_TITLE_XPATH(tree)
+                    title = (titles[0].text or "").strip() if titles else ""
+                    headings = [_stripped_text(h) for h in _PAGE_HEADINGS_XPATH(tree)]
+                    word_count = _word_count(tree)
+
+                    page_type = self._classify_single_page(url, title, headings)
+
+                    pages.append({
+                        "url": url,
+                        "title": title,
+                        "type": page_type,
+                        "word_count": word_count,
+                        "topics": headings,
+                    })
 
-        while to_visit and len(pages) < max_pages:
-            url = to_visit.pop(0)
-            normalized = normalize_url(url)
-            if normalized in visited:
-                continue
-            visited.add(normalized)
-
-            resp = _safe_get(url, timeout=15)
-            if resp is None:
-                continue
-
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            title = soup.title.string.strip() if soup.title and soup.title.string else ""
-            headings = [h.get_text(strip=True) for h in soup.find_all(["h1", "h2", "h3"])]
-            word_count = len(soup.get_text(strip=True).split())
-
-            page_type = self._classify_single_page(url, title, headings)
-
-            pages.append({
-                "url": url,
-                "title": title,
-                "type": page_type,
-                "word_count": word_count,
-                "topics": headings,
-            })
-
-            # Discover internal links
-            for a in soup.find_all("a", href=True):
-                href = urljoin(url, a["href"])
-                href_domain = extract_domain(href)
-                if href_domain == domain and normalize_url(href) not in visited:
-                    to_visit.append(href)
+                    # Discover internal links
+                    for raw_href in _PAGE_HREFS_XPATH(tree):
+                        href = urljoin(url, raw_href)
+                        href_domain = extract_domain(href)
+                        if href_domain == domain and normalize_url(href) not in visited:
+                            to_visit.append(href)
 
+        if not pages:
+            raise _FetchFailed(base_url)
         return pages
 
     def _classify_single_page(
         self, url: str, title: str, headings: List[str]
     ) -> str:
         """Heuristically classify a page as blog, service, landing, or other."""
-        url_lower = url.lower()
-        title_lower = title.lower()
-
-        if any(kw in url_lower for kw in ("/blog", "/post", "/article", "/news")):
-            return "blog"
-        if any(kw in url_lower for kw in ("/service", "/notary", "/apostille", "/pricing")):
-            return "service"
-        if any(
-            kw in url_lower
-            for kw in (
-                "/location", "/area", "/city", "/county",
-                "near-me", "near_me",
-            )
+        # URL hints take precedence over title hints
+        for automaton, text in (
+            (_URL_PAGE_TYPE_AC, url.lower()),
+            (_TITLE_PAGE_TYPE_AC, title.lower()),
         ):
-            return "landing_page"
-        if any(kw in title_lower for kw in ("blog", "article", "news", "post")):
-            return "blog"
-        if any(
-            kw in title_lower
-            for kw in ("service", "notary", "apostille", "pricing", "cost")
-        ):
-            return "service"
+            matches = [value for _, value in automaton.iter(text)]
+            if matches:
+                return min(matches)[1]
         return "other"
 
     def _classify_pages(
@@ -1558,24 +2064,16 @@ class CompetitorIntelligence:
     ) -> Dict[str, Optional[int]]:
         """Estimate which of our tracked keywords the competitor ranks for."""
         rankings: Dict[str, Optional[int]] = {}
-        db = SessionLocal()
-        try:
+        with session_scope() as db:
             keywords = db.query(Keyword).filter(Keyword.is_active.is_(True)).all()
-            sample = keywords[:30]
-
-            for kw in sample:
-                results = _google_custom_search(kw.keyword, num=10)
-                if not results:
-                    results = _scrape_serp_results(kw.keyword, num=10)
-                    time.sleep(1)
+            sample = [kw.keyword for kw in keywords[:30]]
 
+            for keyword, results in zip(sample, _run_searches(sample, num=10)):
                 for idx, r in enumerate(results, start=1):
                     rd = extract_domain(r.get("link", ""))
                     if rd == domain:
-                        rankings[kw.keyword] = idx
+                        rankings[keyword] = idx
                         break
-        finally:
-            db.close()
         return rankings
 
     def _discover_competitor_backlinks(
@@ -1590,12 +2088,7 @@ class CompetitorIntelligence:
             f'"{domain}" -site:{domain}',
             f'intext:"{domain}" notary apostille',
         ]
-        for query in queries:
-            results = _google_custom_search(query, num=10)
-            if not results:
-                results = _scrape_serp_results(query, num=10)
-                time.sleep(1)
-
+        for results in _run_searches(queries, num=10):
             for r in results:
                 src_domain = extract_domain(r.get("link", ""))
                 if src_domain and src_domain != domain and src_domain not in seen:
@@ -1746,10 +2239,10 @@ class CompetitorIntelligence:
 
         underserved: List[str] = []
         comp_url = f"https://{competitor.domain}"
-        resp = _safe_get(comp_url, timeout=15)
+        page = _fetch_and_parse(comp_url)
         site_text = ""
-        if resp is not None:
-            site_text = BeautifulSoup(resp.text, "html.parser").get_text(" ", strip=True).lower()
+        if page is not None:
+            site_text = page.soup.get_text(" ", strip=True).lower()
 
         for area in all_areas:
             label = _area_label(area).lower()
@@ -1770,12 +2263,7 @@ class CompetitorIntelligence:
             f'"{domain}" 1 star review',
         ]
 
-        for query in queries:
-            results = _google_custom_search(query, num=5)
-            if not results:
-                results = _scrape_serp_results(query, num=5)
-                time.sleep(1)
-
+        for results in _run_searches(queries, num=5):
             for r in results:
                 snippet = r.get("snippet", "").lower()
                 themes: List[str] = []
@@ -1805,11 +2293,11 @@ class CompetitorIntelligence:
 
     def _check_schema_markup(self, url: str) -> Dict[str, Any]:
         """Check for missing schema types on a competitor site."""
-        resp = _safe_get(url, timeout=15)
+        page = _fetch_and_parse(url)
         found_types: List[str] = []
 
-        if resp is not None:
-            soup = BeautifulSoup(resp.text, "html.parser")
+        if page is not None:
+            soup = page.soup
             for script in soup.find_all("script", attrs={"type": "application/ld+json"}):
                 try:
                     import json
@@ -1959,10 +2447,12 @@ class CompetitorIntelligence:
 
         return weaknesses
 
-    def _compute_seo_strength(
-        self, analysis: Optional[CompetitorAnalysis]
-    ) -> int:
-        """Compute a 0-100 composite SEO-strength score from an analysis row."""
+    def _compute_seo_strength(self, analysis: Optional[Any]) -> int:
+        """Compute a 0-100 composite SEO-strength score from an analysis row.
+
+        *analysis* may be a ``CompetitorAnalysis`` or any row exposing the
+        same attribute names (see ``_LATEST_ANALYSIS_COLUMNS``).
+        """
         if analysis is None:
             return 0
 
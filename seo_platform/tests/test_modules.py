@@ -274,5 +274,734 @@ class TestHelpers:
         assert (end - start).days == 30
 
 
+@pytest.fixture
+def memory_engine(monkeypatch):
+    """Point ``session_scope`` at a fresh in-memory SQLite database."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    import database.models as models
+
+    eng = create_engine("sqlite://")
+    Base.metadata.create_all(bind=eng)
+    monkeypatch.setattr(models, "SessionLocal", sessionmaker(bind=eng))
+    yield eng
+    eng.dispose()
+
+
+class TestCompetitorPersistence:
+    """Test competitor de-duplication on fresh and pre-index databases."""
+
+    AREA = {"city": "Arlington", "state": "VA", "region": "DMV"}
+
+    @pytest.fixture
+    def comp_engine(self, memory_engine, monkeypatch):
+        import modules.competitor_intel as ci
+        monkeypatch.setattr(ci, "_run_searches", lambda queries, **kw: [[
+            {"link": f"https://rival{i}.com/notary", "title": f"Rival {i}"}
+            for i in range(4)
+        ]])
+        return memory_engine
+
+    @staticmethod
+    def _drop_domain_index(eng):
+        from sqlalchemy import text
+        with eng.begin() as conn:
+            conn.execute(text("DROP INDEX idx_competitor_domain"))
+
+    def _domains(self, eng):
+        from sqlalchemy.orm import Session
+        with Session(eng) as s:
+            return sorted(c.domain for c in s.query(Competitor))
+
+    def test_discover_on_conflict(self, comp_engine):
+        from database.models import has_unique_competitor_domain
+        from modules.competitor_intel import CompetitorIntelligence
+        assert has_unique_competitor_domain(comp_engine)
+        intel = CompetitorIntelligence()
+        intel.discover_competitors(self.AREA)
+        intel.discover_competitors(self.AREA)
+        assert self._domains(comp_engine) == [f"rival{i}.com" for i in range(4)]
+
+    def test_discover_without_unique_index(self, comp_engine):
+        from database.models import has_unique_competitor_domain
+        from modules.competitor_intel import CompetitorIntelligence
+        self._drop_domain_index(comp_engine)
+        assert not has_unique_competitor_domain(comp_engine)
+        from sqlalchemy.orm import Session
+        with Session(comp_engine) as s:
+            s.add(Competitor(name="Rival 0", domain="rival0.com", market="dmv"))
+            s.commit()
+        intel = CompetitorIntelligence()
+        intel.discover_competitors(self.AREA)
+        intel.discover_competitors(self.AREA)
+        assert self._domains(comp_engine) == [f"rival{i}.com" for i in range(4)]
+
+    def test_migration_dedupes_and_adds_index(self, comp_engine):
+        from sqlalchemy.orm import Session
+        from database.models import (
+            _migrate_competitor_domain_index, has_unique_competitor_domain,
+        )
+        self._drop_domain_index(comp_engine)
+        with Session(comp_engine) as s:
+            first = Competitor(name="A", domain="dup.com")
+            second = Competitor(name="A again", domain="dup.com")
+            other = Competitor(name="B", domain="other.com")
+            s.add_all([first, second, other])
+            s.flush()
+            s.add(CompetitorAnalysis(
+                competitor_id=second.id, analysis_date=datetime.date.today()
+            ))
+            s.commit()
+            first_id = first.id
+        _migrate_competitor_domain_index(comp_engine)
+        assert has_unique_competitor_domain(comp_engine)
+        assert self._domains(comp_engine) == ["dup.com", "other.com"]
+        with Session(comp_engine) as s:
+            analysis = s.query(CompetitorAnalysis).one()
+            assert analysis.competitor_id == first_id
+
+
+class TestCompetitorIntelHelpers:
+    """Test the competitor-intel fast paths against their original forms."""
+
+    PAGES = [
+        "",
+        "<html><body></body></html>",
+        "<p>Mobile notary in Arlington</p>",
+        "<h1>Apostille</h1><p>Fast <b>same</b>-day service.</p>",
+        "<div>one<span>two</span> three <i> four </i>five</div>",
+        "<head><title>Notary</title><style>p {}</style>"
+        "<script>var x = 1;</script></head>"
+        "<body><template>hidden words</template><!-- a comment -->"
+        "<p>Visible\n\t text\u00a0here</p></body>",
+    ]
+
+    SERP = (
+        "<html><body><div id='search'>"
+        "<div class='g'><div class='tF2Cxc'>"
+        "<a href='/url?q=https://rival.com/notary&sa=U'><h3>Rival <b>Notary</b></h3></a>"
+        "<div class='VwiC3b'>Mobile notary, <em>4.9</em> stars</div></div></div>"
+        "<div class='g-blk'><a href='https://skip.com'><h3>Not a result</h3></a></div>"
+        "<div class=' g  extra'><a href='https://direct.com/'>x</a><h3> Direct </h3>"
+        "<span class='aCOpRe'>Span snippet</span><div class='VwiC3b'>later</div></div>"
+        "<div class='g'><a href='https://notitle.com/'>no heading</a></div>"
+        "<div class='tF2Cxc'><h3>No link</h3></div>"
+        "<div class='g'><a href='/url?q=https://bare.org/'><h3>Bare</h3></a></div>"
+        "</div></body></html>"
+    )
+
+    def test_word_count_matches_beautifulsoup(self):
+        from bs4 import BeautifulSoup
+        from modules.competitor_intel import _parse_html, _word_count
+        for html in self.PAGES:
+            expected = len(BeautifulSoup(html, "lxml").get_text(strip=True).split())
+            assert _word_count(_parse_html(html)) == expected, html
+
+    def test_compare_keywords_matches_set_arithmetic(self, memory_engine, monkeypatch):
+        import random
+        from sqlalchemy.orm import Session
+        from modules.competitor_intel import CompetitorIntelligence
+
+        rng = random.Random(3)
+        words = [f"notary keyword {i}" for i in range(300)]
+        ours = {w: rng.choice([None, 1, 5, 20]) for w in rng.sample(words, 120)}
+        theirs = {w: rng.choice([None, 2, 5, 9]) for w in rng.sample(words, 150)}
+        monkeypatch.setattr(
+            CompetitorIntelligence, "_get_our_keyword_rankings", lambda self, db: ours
+        )
+        monkeypatch.setattr(
+            CompetitorIntelligence, "_estimate_competitor_keywords", lambda self, d: theirs
+        )
+        with Session(memory_engine) as s:
+            comp = Competitor(name="Rival", domain="rival.com", market="dmv")
+            s.add(comp)
+            s.commit()
+            comp_id = comp.id
+
+        result = CompetitorIntelligence().compare_keywords(comp_id)
+
+        overlap = sorted(set(ours) & set(theirs))
+        assert result["overlap"] == [
+            {
+                "keyword": kw,
+                "our_position": ours[kw],
+                "their_position": theirs[kw],
+                "we_win": ours[kw] < theirs[kw] if ours[kw] and theirs[kw] else None,
+            }
+            for kw in overlap
+        ]
+        assert result["their_exclusive"] == [
+            {"keyword": kw, "their_position": theirs[kw]}
+            for kw in sorted(set(theirs) - set(ours))
+        ]
+        assert result["our_exclusive"] == [
+            {"keyword": kw, "our_position": ours[kw]}
+            for kw in sorted(set(ours) - set(theirs))
+        ]
+        assert result["summary"]["total_overlap"] == len(overlap)
+
+    def test_token_bucket_spaces_calls_after_burst(self, monkeypatch):
+        import modules.competitor_intel as ci
+        waits = []
+        monkeypatch.setattr(ci.time, "sleep", waits.append)
+        bucket = ci._TokenBucket(rate=2.0, capacity=3)
+        for _ in range(6):
+            bucket.acquire()
+        # Three calls ride the burst, the rest queue at 0.5 s apart
+        assert waits == [pytest.approx(w, abs=0.05) for w in (0.5, 1.0, 1.5)]
+
+    def test_safe_get_leaves_retries_to_the_session(self):
+        import requests
+        import modules.competitor_intel as ci
+        throttled = requests.Response()
+        throttled.status_code = 503
+        throttled.url = "https://rival.com/"
+        with patch.object(ci._HTTP, "get", return_value=throttled) as get:
+            assert ci._safe_get("https://rival.com/") is None
+        assert get.call_count == 1
+
+    def test_monitor_compares_latest_two_analyses(self, memory_engine):
+        from sqlalchemy.orm import Session
+        from modules.competitor_intel import CompetitorIntelligence
+        day = datetime.date(2026, 1, 1)
+        with Session(memory_engine) as s:
+            many = Competitor(name="Many", domain="many.com")
+            single = Competitor(name="Single", domain="single.com")
+            inactive = Competitor(name="Gone", domain="gone.com", is_active=False)
+            s.add_all([many, single, inactive])
+            s.flush()
+            snapshots = {
+                "old": CompetitorAnalysis(competitor_id=many.id, analysis_date=day),
+                "tied_first": CompetitorAnalysis(
+                    competitor_id=many.id, analysis_date=day + datetime.timedelta(days=7)
+                ),
+                "tied_second": CompetitorAnalysis(
+                    competitor_id=many.id, analysis_date=day + datetime.timedelta(days=7)
+                ),
+                "single": CompetitorAnalysis(competitor_id=single.id, analysis_date=day),
+                "gone_a": CompetitorAnalysis(competitor_id=inactive.id, analysis_date=day),
+                "gone_b": CompetitorAnalysis(competitor_id=inactive.id, analysis_date=day),
+            }
+            s.add_all(snapshots.values())
+            s.commit()
+            ids = {name: a.id for name, a in snapshots.items()}
+
+        def detect(self, comp, latest, previous):
+            return [{
+                "severity": "info", "title": comp.name, "message": "changed",
+                "data": {"latest": latest.id, "previous": previous.id},
+            }]
+
+        with patch.object(CompetitorIntelligence, "_detect_changes", detect):
+            alerts = CompetitorIntelligence().monitor_competitor_changes()
+
+        # Same-day snapshots fall back to the later id
+        assert [a["data"] for a in alerts] == [
+            {"latest": ids["tied_second"], "previous": ids["tied_first"]}
+        ]
+        with Session(memory_engine) as s:
+            assert [(a.alert_type, a.title) for a in s.query(Alert)] == [
+                ("competitor_change", "Many")
+            ]
+
+    def test_crawl_visits_each_internal_page_once(self):
+        import threading
+        from bs4 import BeautifulSoup
+        import modules.competitor_intel as ci
+        ci.CompetitorIntelligence._crawl_site_pages_cached.cache_clear()
+        intel = ci.CompetitorIntelligence()
+        # page n links to its children 2n+1 and 2n+2, back home, and off-site
+        site = {
+            f"https://rival.com/p{n}": (
+                f"<title>Page {n}</title><h2>Topic {n}</h2><p>notary words here</p>"
+                f'<a href="/p{2 * n + 1}">a</a><a href="/p{2 * n + 2}#top">b</a>'
+                '<a href="/p0">home</a><a href="https://other.com/x">x</a>'
+            )
+            for n in range(20)
+        }
+        site["https://rival.com/p3"] = None  # unreachable
+        fetched = []
+        lock = threading.Lock()
+
+        def fetch(url):
+            with lock:
+                fetched.append(url)
+            return site.get(url.split("#")[0])
+
+        with patch.object(ci, "_fetch_page_html", side_effect=fetch):
+            pages = intel._crawl_site_pages("https://rival.com/p0", max_pages=50)
+            crawl = list(fetched)
+            fetched.clear()
+            limited = intel._crawl_site_pages("https://rival.com/p0", max_pages=5)
+
+        assert not any("other.com" in url for url in crawl + fetched)
+        assert len({ci.normalize_url(u) for u in crawl}) == len(crawl)
+        # p3 is down, so nothing below it (p7, p8, p15-p18) is ever found
+        below_p3 = {3, 7, 8, 15, 16, 17, 18}
+        assert sorted(p["title"] for p in pages) == sorted(
+            f"Page {n}" for n in range(20) if n not in below_p3
+        )
+        page0 = next(p for p in pages if p["title"] == "Page 0")
+        assert page0["topics"] == ["Topic 0"]
+        assert page0["word_count"] == len(
+            BeautifulSoup(site["https://rival.com/p0"], "lxml").get_text(strip=True).split()
+        )
+        # Fetches stop once the page slots are filled (plus any that failed)
+        assert len(limited) == 5
+        assert len(fetched) - sum(site.get(u.split("#")[0]) is None for u in fetched) == 5
+
+    def test_serp_parser_matches_css_selectors(self):
+        import requests
+        from bs4 import BeautifulSoup
+        import modules.competitor_intel as ci
+
+        expected = []
+        soup = BeautifulSoup(self.SERP, "lxml")
+        for g in soup.select("div.tF2Cxc, div.g"):
+            link_tag = g.select_one("a[href]")
+            title_tag = g.select_one("h3")
+            snippet_tag = g.select_one("div.VwiC3b, span.aCOpRe")
+            if link_tag and title_tag:
+                href = link_tag["href"]
+                if href.startswith("/url?q="):
+                    href = href.split("/url?q=")[1].split("&")[0]
+                expected.append({
+                    "title": title_tag.get_text(strip=True),
+                    "link": href,
+                    "snippet": snippet_tag.get_text(strip=True) if snippet_tag else "",
+                    "displayLink": ci.extract_domain(href),
+                })
+
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = self.SERP.encode()
+        resp.encoding = "utf-8"
+        with patch.object(ci._HTTP, "get", return_value=resp), \
+                patch.object(ci._SCRAPE_LIMITER, "acquire"):
+            results = ci._scrape_serp_results("notary arlington va")
+        assert [r["link"] for r in results] == [
+            "https://rival.com/notary", "https://rival.com/notary",
+            "https://direct.com/", "https://bare.org/",
+        ]
+        assert results == expected
+
+class TestCompetitorIntelCaching:
+    """Test that competitor-intel caches skip failures and hand out copies."""
+
+    @pytest.fixture
+    def intel(self):
+        from modules.competitor_intel import CompetitorIntelligence
+        CompetitorIntelligence._backlink_estimate_cached.cache_clear()
+        CompetitorIntelligence._technical_quality_cached.cache_clear()
+        CompetitorIntelligence._crawl_site_pages_cached.cache_clear()
+        CompetitorIntelligence._google_reviews_cached.cache_clear()
+        return CompetitorIntelligence()
+
+    def test_unreachable_site_quality_is_not_cached(self, intel):
+        from bs4 import BeautifulSoup
+        import modules.competitor_intel as ci
+        page = ci._ParsedPage(
+            "https://rival.com/", 200, 100,
+            BeautifulSoup("<title>Rival</title><h1>Notary</h1>", "lxml"),
+        )
+        pages = [None, page]
+        with patch.object(ci, "_fetch_and_parse", side_effect=lambda url: pages.pop(0)), \
+                patch.object(ci, "_safe_get", return_value=None):
+            assert intel._assess_technical_quality("https://rival.com/")["issues"] == [
+                "Site unreachable"
+            ]
+            first = intel._assess_technical_quality("https://rival.com/")
+            assert first["checks"]["has_title"]
+            first["issues"].append("caller scribble")
+            again = intel._assess_technical_quality("https://rival.com/")
+        assert "caller scribble" not in again["issues"]
+
+    def test_empty_backlink_searches_are_not_cached(self, intel):
+        import modules.competitor_intel as ci
+        responses = [
+            [[]], [[]] * 10,
+            [[{"link": "https://www.yelp.com/biz/rival"}]],
+        ]
+        with patch.object(ci, "_run_searches", side_effect=lambda *a, **kw: responses.pop(0)):
+            assert intel._estimate_backlinks("rival.com")["known_directory_links"] == []
+            found = intel._estimate_backlinks("rival.com")
+            assert found["known_directory_links"] == ["yelp.com"]
+            found["known_directory_links"].clear()
+            assert intel._estimate_backlinks("rival.com")["known_directory_links"] == ["yelp.com"]
+        assert responses == []
+
+    def test_failed_crawl_is_not_cached(self, intel):
+        import modules.competitor_intel as ci
+        site = {"up": False}
+
+        def fetch(url):
+            if not site["up"]:
+                return None
+            return "<title>Rival Notary</title><h1>Mobile notary</h1><p>We come to you.</p>"
+
+        with patch.object(ci, "_fetch_page_html", side_effect=fetch):
+            assert intel._crawl_site_pages("https://rival.com/") == []
+            site["up"] = True
+            pages = intel._crawl_site_pages("https://rival.com/")
+            assert [p["title"] for p in pages] == ["Rival Notary"]
+            pages[0]["title"] = "changed"
+            pages.append({})
+            site["up"] = False
+            cached = intel._crawl_site_pages("https://rival.com/")
+        assert [p["title"] for p in cached] == ["Rival Notary"]
+
+    def test_empty_review_lookup_is_not_cached(self, intel):
+        import modules.competitor_intel as ci
+        snippets = [[], [{"snippet": "Rated 4.8 stars from 120 reviews"}]]
+        with patch.object(ci, "_google_custom_search", side_effect=lambda *a, **kw: snippets.pop(0)), \
+                patch.object(ci, "_scrape_serp_results", return_value=[]):
+            assert intel._fetch_google_reviews("Rival", "rival.com") == {
+                "google_rating": None, "review_count": None,
+            }
+            found = intel._fetch_google_reviews("Rival", "rival.com")
+            assert found == {"google_rating": 4.8, "review_count": 120}
+            found["google_rating"] = 1.0
+            assert intel._fetch_google_reviews("Rival", "rival.com")["google_rating"] == 4.8
+
+class TestBacklinkScoring:
+    """Test backlink toxicity and domain-authority scoring."""
+
+    def test_toxicity_scores(self):
+        import itertools
+        import numpy as np
+        from modules.backlink_builder import _toxicity_scores
+
+        cases = [
+            (da, *flags)
+            for da in (0, 4, 5, 9, 10, 14, 15, 60)
+            for flags in itertools.product((0, 1), repeat=5)
+        ]
+        columns = [np.array(col, dtype=np.int64) for col in zip(*cases)]
+        scores = _toxicity_scores(*columns)
+
+        for (da, spam, tld, commercial, irrelevant, digits), score in zip(cases, scores):
+            expected = 30 if da < 5 else 20 if da < 10 else 10 if da < 15 else 0
+            expected += 35 * spam + 15 * tld + 20 * commercial + 10 * irrelevant + 15 * digits
+            assert score == min(expected, 100)
+
+
+    def test_domain_authority_baseline_is_not_cached(self):
+        from modules.backlink_builder import BacklinkBuilder
+        builder = BacklinkBuilder()
+        builder.ahrefs_api_key = "test-key"
+        replies = [None, {"domain_rating": 42}]
+        with patch.object(
+            builder, "_ahrefs_get", side_effect=lambda *a, **kw: replies.pop(0)
+        ) as ahrefs:
+            assert builder._estimate_domain_authority("rival.com") == 15
+            assert builder._estimate_domain_authority("rival.com") == 42
+            assert builder._estimate_domain_authority("rival.com") == 42
+            assert ahrefs.call_count == 2
+
+    def test_batch_domain_authority_baseline_is_not_cached(self):
+        from modules.backlink_builder import BacklinkBuilder
+        builder = BacklinkBuilder()
+        builder.ahrefs_api_key = "test-key"
+        ratings = {"good.com": {"domain_rating": 50}, "down.com": None}
+        with patch.object(
+            builder, "_ahrefs_get", side_effect=lambda report, domain, **kw: ratings[domain]
+        ) as ahrefs:
+            assert builder._estimate_domain_authorities(["good.com", "down.com"]) == {
+                "good.com": 50, "down.com": 15,
+            }
+            assert ahrefs.call_count == 2
+        assert dict(builder._da_cache) == {"good.com": 50}
+
+
+
+class TestBacklinkReport:
+    """Test the SQL-aggregated backlink report against the in-Python original."""
+
+    def test_backlink_report_matches_python_reference(self, memory_engine):
+        import random
+        import statistics
+        from collections import Counter
+        from sqlalchemy.orm import Session
+        from modules.backlink_builder import BacklinkBuilder
+
+        rng = random.Random(7)
+        today = datetime.date.today()
+        domains = [f"site{i}.com" for i in range(40)]
+        anchors = ["notary", "Apostille ", "click here", "", None, "NOTARY"]
+        session = Session(memory_engine)
+        session.add_all(
+            Backlink(
+                source_url=f"https://{rng.choice(domains)}/p{i}",
+                source_domain=rng.choice(domains + [""]),
+                anchor_text=rng.choice(anchors),
+                link_type=rng.choice(["dofollow", "DoFollow", "nofollow", None]),
+                domain_authority=rng.choice([None, 0, 5, 10, 11, 35, 35, 90, 91, 120]),
+                is_active=rng.choice([True, True, False, None]),
+                is_toxic=rng.choice([True, False]),
+                toxicity_score=float(rng.randint(0, 100)),
+                first_seen=today - datetime.timedelta(days=rng.randint(0, 60)),
+                last_checked=rng.choice(
+                    [None, today - datetime.timedelta(days=rng.randint(0, 60))]
+                ),
+            )
+            for i in range(500)
+        )
+        session.commit()
+        builder = BacklinkBuilder()
+        builder.session = session
+        report = builder.get_backlink_report("month")
+
+        rows = session.query(Backlink).order_by(Backlink.id).all()
+        cutoff = today - datetime.timedelta(days=30)
+        active = [b for b in rows if b.is_active]
+        new = [b for b in active if b.first_seen and b.first_seen >= cutoff]
+        lost = [
+            b for b in rows
+            if not b.is_active and b.last_checked and b.last_checked >= cutoff
+        ]
+        toxic = [b for b in active if b.is_toxic]
+        da = [b.domain_authority or 0 for b in active]
+        anchor_counts = Counter(
+            (b.anchor_text or "").strip().lower() or "[no anchor / image]" for b in active
+        )
+        dofollow = sum(1 for b in active if (b.link_type or "").lower() == "dofollow")
+
+        assert report["summary"] == {
+            "total_active_backlinks": len(active),
+            "unique_referring_domains": len({b.source_domain for b in active if b.source_domain}),
+            "new_backlinks": len(new),
+            "lost_backlinks": len(lost),
+            "toxic_backlinks": len(toxic),
+            "dofollow_links": dofollow,
+            "nofollow_links": len(active) - dofollow,
+        }
+        assert report["domain_authority_stats"] == {
+            "average": round(statistics.mean(da), 1),
+            "median": round(statistics.median(da), 1),
+            "min": min(da),
+            "max": max(da),
+        }
+        assert sum(report["domain_authority_distribution"].values()) == len(active)
+        assert report["domain_authority_distribution"]["0-10"] == sum(1 for d in da if d <= 10)
+        assert report["domain_authority_distribution"]["91-100"] == sum(1 for d in da if d > 90)
+        assert report["top_anchors"] == anchor_counts.most_common(20)
+        assert [r["source_url"] for r in report["new_backlinks_detail"]] == [
+            b.source_url
+            for b in sorted(new, key=lambda b: b.domain_authority or 0, reverse=True)
+        ]
+        assert [r["source_url"] for r in report["lost_backlinks_detail"]] == [
+            b.source_url for b in lost
+        ]
+        assert [r["source_url"] for r in report["toxic_backlinks_detail"]] == [
+            b.source_url for b in toxic
+        ]
+        session.close()
+
+    def test_backlink_report_da_stats_edge_cases(self, memory_engine):
+        from sqlalchemy.orm import Session
+        from modules.backlink_builder import BacklinkBuilder
+        session = Session(memory_engine)
+        builder = BacklinkBuilder()
+        builder.session = session
+        assert builder.get_backlink_report()["domain_authority_stats"] == {
+            "average": 0.0, "median": 0.0, "min": 0, "max": 0,
+        }
+        session.add_all([
+            Backlink(source_url="https://a.com/", domain_authority=10, is_active=True),
+            Backlink(source_url="https://b.com/", domain_authority=21, is_active=True),
+            Backlink(source_url="https://c.com/", domain_authority=None, is_active=True),
+            Backlink(source_url="https://d.com/", domain_authority=21, is_active=True),
+            Backlink(source_url="https://e.com/", domain_authority=99, is_active=False),
+        ])
+        session.commit()
+        assert builder.get_backlink_report()["domain_authority_stats"] == {
+            "average": 13.0, "median": 15.5, "min": 0, "max": 21,
+        }
+        session.close()
+
+class TestBacklinkMonitoring:
+    """Test how monitor_backlinks persists what it discovers."""
+
+    @pytest.fixture
+    def builder(self, memory_engine):
+        from sqlalchemy.orm import Session
+        from modules.backlink_builder import BacklinkBuilder
+        builder = BacklinkBuilder()
+        builder.session = Session(memory_engine)
+        builder.ahrefs_api_key = "test-key"
+        yield builder
+        builder.session.close()
+
+    @staticmethod
+    def _refpages(*links):
+        return {"refpages": [
+            {"url_from": url, "url_to": "https://commonnotaryapostille.com/",
+             "anchor": anchor, "ahrefs_rank": 30}
+            for url, anchor in links
+        ]}
+
+    def test_existing_rows_found_across_in_clause_chunks(self, builder):
+        import modules.backlink_builder as bb
+        old_day = datetime.date(2020, 1, 1)
+        builder.session.add_all(
+            Backlink(source_url=f"https://dir{i}.com/", anchor_text="old",
+                     is_active=False, first_seen=old_day, last_checked=old_day)
+            for i in range(0, 10, 2)
+        )
+        builder.session.commit()
+        links = [(f"https://dir{i}.com/", f"anchor {i}") for i in range(10)]
+        with patch.object(bb, "_IN_CLAUSE_CHUNK", 3), \
+                patch.object(builder, "_ahrefs_get", return_value=self._refpages(*links)):
+            summary = builder.monitor_backlinks()
+
+        assert summary["total_discovered"] == 10
+        assert summary["new_backlinks"] == 5
+        rows = {b.source_url: b for b in builder.session.query(Backlink)}
+        assert len(rows) == 10
+        for i in range(0, 10, 2):
+            row = rows[f"https://dir{i}.com/"]
+            assert row.is_active and row.anchor_text == f"anchor {i}"
+            assert row.first_seen == old_day
+            assert row.last_checked == datetime.date.today()
+
+    def test_duplicate_source_urls_keep_last_anchor(self, builder):
+        links = [
+            ("https://dir.com/a", "first"),
+            ("https://dir.com/b", "only"),
+            ("https://dir.com/a", "last"),
+        ]
+        with patch.object(builder, "_ahrefs_get", return_value=self._refpages(*links)):
+            summary = builder.monitor_backlinks()
+        assert summary["total_discovered"] == 3
+        assert summary["new_backlinks"] == 2
+        anchors = {b.source_url: b.anchor_text for b in builder.session.query(Backlink)}
+        assert anchors == {"https://dir.com/a": "last", "https://dir.com/b": "only"}
+
+    def test_new_rows_inserted_with_all_fields(self, builder):
+        payload = self._refpages(("https://dir.com/a", "Notary"))
+        payload["refpages"].append({
+            "url_from": "https://unrated.org/list",
+            "url_to": "https://commonnotaryapostille.com/",
+            "anchor": "", "nofollow": True, "ahrefs_rank": None,
+        })
+        with patch.object(builder, "_ahrefs_get", return_value=payload), \
+                patch.object(builder, "_lookup_domain_authority", return_value=44):
+            builder.monitor_backlinks()
+        today = datetime.date.today()
+        rows = {
+            b.source_url: (
+                b.source_domain, b.target_url, b.anchor_text, b.link_type,
+                b.domain_authority, b.is_active, b.first_seen, b.last_checked,
+            )
+            for b in builder.session.query(Backlink)
+        }
+        assert rows == {
+            "https://dir.com/a": (
+                "dir.com", "https://commonnotaryapostille.com/", "Notary",
+                "dofollow", 30, True, today, today,
+            ),
+            "https://unrated.org/list": (
+                "unrated.org", "https://commonnotaryapostille.com/", "",
+                "nofollow", 44, True, today, today,
+            ),
+        }
+
+class TestBacklinkGapAnalysis:
+    """Test the consolidated gap analysis across competitors."""
+
+    @pytest.fixture
+    def builder(self):
+        from modules.backlink_builder import BacklinkBuilder
+        builder = BacklinkBuilder()
+        yield builder
+        builder.close()
+
+    @staticmethod
+    def _link(domain, da, path="/"):
+        return {
+            "source_url": f"https://{domain}{path}",
+            "source_domain": domain,
+            "anchor_text": domain,
+            "domain_authority": da,
+        }
+
+    def test_competitors_fetched_concurrently_keep_their_order(self, builder):
+        import time
+        profiles = {
+            "slow.com": [self._link("a.org", 20), self._link("ours.com", 50)],
+            "fast.com": [self._link("b.org", 30)],
+            "mid.com": [],
+        }
+        delays = {"slow.com": 0.2, "fast.com": 0.0, "mid.com": 0.1}
+
+        def fetch(domain, rebuild=False):
+            time.sleep(delays[domain])
+            return profiles[domain]
+
+        with patch.object(builder, "_fetch_competitor_backlinks", side_effect=fetch), \
+                patch.object(
+                    builder, "_get_our_referring_domains", return_value={"ours.com"}
+                ) as ours:
+            result = builder.get_backlink_gap_analysis(["slow.com", "fast.com", "mid.com"])
+
+        assert ours.call_count == 1
+        assert list(result["per_competitor"]) == ["slow.com", "fast.com", "mid.com"]
+        assert result["per_competitor"]["slow.com"] == {
+            "total_backlinks": 2, "unique_domains": 2, "gap_domains": 1,
+        }
+        assert result["per_competitor"]["mid.com"]["gap_domains"] == 0
+        assert [g["source_domain"] for g in result["gap_opportunities"]] == ["b.org", "a.org"]
+
+    def test_gap_domains_count_once_per_competitor(self, builder):
+        profiles = {
+            "one.com": [
+                self._link("dir.org", 20, "/a"), self._link("dir.org", 45, "/b"),
+                self._link("dir.org", 10, "/c"), self._link("blog.net", 60),
+            ],
+            "two.com": [self._link("dir.org", 30), self._link("solo.io", 5)],
+        }
+        with patch.object(
+            builder, "_fetch_competitor_backlinks",
+            side_effect=lambda domain, rebuild=False: profiles[domain],
+        ), patch.object(builder, "_get_our_referring_domains", return_value=set()):
+            result = builder.get_backlink_gap_analysis(["one.com", "two.com"])
+
+        gaps = {g["source_domain"]: g for g in result["gap_opportunities"]}
+        assert result["total_gap_domains"] == 3
+        assert gaps["dir.org"]["competitors_linking"] == 2
+        assert gaps["dir.org"]["domain_authority"] == 45
+        assert gaps["dir.org"]["source_url"] == "https://dir.org/b"
+        assert gaps["dir.org"]["priority"] == "high"
+        assert gaps["blog.net"]["competitors_linking"] == 1
+        assert gaps["blog.net"]["priority"] == "medium"
+        assert gaps["solo.io"]["priority"] == "low"
+        assert result["per_competitor"]["one.com"]["gap_domains"] == 2
+
+    def test_consolidated_gaps_keep_top_100(self, builder):
+        # Three overlapping 100-domain profiles: 250 gap domains in total
+        profiles = {
+            f"comp{k}.com": [
+                self._link(f"site{j}.org", j % 70) for j in range(k * 75, k * 75 + 100)
+            ]
+            for k in range(3)
+        }
+        with patch.object(
+            builder, "_fetch_competitor_backlinks",
+            side_effect=lambda domain, rebuild=False: profiles[domain],
+        ), patch.object(builder, "_get_our_referring_domains", return_value=set()):
+            result = builder.get_backlink_gap_analysis(list(profiles))
+
+        gaps = result["gap_opportunities"]
+        assert result["total_gap_domains"] == 250
+        assert len(gaps) == 100
+        assert set(gaps[0]) == {
+            "source_domain", "competitors_linking", "domain_authority",
+            "source_url", "anchor_text", "priority",
+        }
+        keys = [(g["competitors_linking"], g["domain_authority"]) for g in gaps]
+        assert keys == sorted(keys, reverse=True)
+        # The 50 domains shared by two competitors rank first
+        assert [k for k, _ in keys].count(2) == 50
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -136,19 +136,48 @@ def calculate_nap_consistency(
 
 
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-def fetch_url(url: str, timeout: int = 30, headers: Optional[dict] = None) -> requests.Response:
-    """Fetch a URL with retry logic."""
+def fetch_url(
+    url: str,
+    timeout: int = 30,
+    headers: Optional[dict] = None,
+    session: Optional[requests.Session] = None,
+    stream: bool = False,
+) -> requests.Response:
+    """Fetch a URL with retry logic.
+
+    Pass a shared *session* to reuse its pooled keep-alive connections, and
+    ``stream=True`` to defer reading the body (see :func:`read_capped`).
+    """
     default_headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     }
     if headers:
         default_headers.update(headers)
 
-    response = requests.get(url, headers=default_headers, timeout=timeout)
+    response = (session or requests).get(
+        url, headers=default_headers, timeout=timeout, stream=stream
+    )
     response.raise_for_status()
     return response
 
 
+def read_capped(response: requests.Response, cap: int = 1_048_576) -> str:
+    """Read and decode at most *cap* bytes of a streamed response body.
+
+    Oversized pages (HTML dumps, PDFs served as pages) are truncated instead
+    of being loaded whole.  The connection is released afterwards.
+    """
+    buf = bytearray()
+    try:
+        for chunk in response.iter_content(chunk_size=8192):
+            buf.extend(chunk)
+            if len(buf) >= cap:
+                break
+    finally:
+        response.close()
+    return bytes(buf[:cap]).decode(response.encoding or "utf-8", errors="replace")
+
+
 def compute_seo_score(page_data: dict) -> float:
     """Compute an SEO score for a page based on various factors."""
     score = 0